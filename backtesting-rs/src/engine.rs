@@ -1,11 +1,14 @@
 //! 백테스트 엔진 모듈
 
+use rust_decimal::prelude::ToPrimitive;
 use rust_decimal::Decimal;
 use rust_decimal_macros::dec;
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 
 use crate::data::StockData;
+use crate::indicators::IndicatorCache;
+use crate::metrics::{MetricsSnapshot, StreamingMetrics};
 use crate::strategy::{Signal, Strategy};
 
 /// 백테스트 설정
@@ -21,6 +24,8 @@ pub struct BacktestConfig {
     pub max_positions: usize,
     /// 종목당 최대 투자 비율
     pub max_position_size: Decimal,
+    /// 일별 자산 곡선 기록 여부 (false면 상수 메모리로 지표만 계산)
+    pub record_equity_curve: bool,
 }
 
 impl Default for BacktestConfig {
@@ -31,6 +36,7 @@ impl Default for BacktestConfig {
             slippage: dec!(0.001),
             max_positions: 10,
             max_position_size: dec!(0.1),
+            record_equity_curve: false,
         }
     }
 }
@@ -77,7 +83,7 @@ pub struct BacktestResult {
     pub win_rate: f64,
     /// 총 거래 횟수
     pub total_trades: usize,
-    /// 일별 자산 가치
+    /// 일별 자산 가치 (`record_equity_curve`가 false면 비어있음)
     pub equity_curve: Vec<f64>,
 }
 
@@ -86,32 +92,95 @@ pub struct BacktestEngine {
     config: BacktestConfig,
     cash: Decimal,
     positions: HashMap<String, Position>,
-    equity_history: Vec<Decimal>,
-    trade_count: usize,
-    winning_trades: usize,
+    metrics: StreamingMetrics,
 }
 
 impl BacktestEngine {
     pub fn new(config: BacktestConfig) -> Self {
         let initial_cash = config.initial_capital;
+        let initial_equity = to_f64(initial_cash);
+        let metrics = if config.record_equity_curve {
+            StreamingMetrics::with_equity_curve(initial_equity, 0)
+        } else {
+            StreamingMetrics::new(initial_equity)
+        };
         Self {
             config,
             cash: initial_cash,
             positions: HashMap::new(),
-            equity_history: Vec::new(),
-            trade_count: 0,
-            winning_trades: 0,
+            metrics,
         }
     }
 
+    /// 실행 중인 지표 누산기 (실시간 모니터링용)
+    pub fn metrics(&self) -> &StreamingMetrics {
+        &self.metrics
+    }
+
+    /// 보유 포지션의 시장 가치 합계
+    fn positions_value(&self) -> Decimal {
+        self.positions.values().map(|p| p.market_value()).sum()
+    }
+
     /// 현재 총 자산 가치
     pub fn total_equity(&self) -> Decimal {
-        let positions_value: Decimal = self.positions.values().map(|p| p.market_value()).sum();
-        self.cash + positions_value
+        self.cash + self.positions_value()
     }
 
     /// 백테스트 실행
     pub fn run<S: Strategy>(&mut self, data: &StockData, strategy: &S) -> BacktestResult {
+        self.run_with_monitor(data, strategy, 0, |_| {})
+    }
+
+    /// 백테스트 실행 (실시간 모니터링)
+    ///
+    /// `interval` 바마다 현재 지표 스냅샷으로 `on_update`를 호출합니다.
+    /// `interval`이 0이면 호출하지 않습니다.
+    pub fn run_with_monitor<S, F>(
+        &mut self,
+        data: &StockData,
+        strategy: &S,
+        interval: usize,
+        on_update: F,
+    ) -> BacktestResult
+    where
+        S: Strategy,
+        F: FnMut(&MetricsSnapshot),
+    {
+        let cache = IndicatorCache::new(&data.candles);
+        self.run_inner(data, &cache, strategy, interval, on_update)
+    }
+
+    /// 미리 만든 지표 캐시로 백테스트 실행
+    ///
+    /// 같은 데이터로 여러 파라미터 조합을 실행할 때 캐시를 한 번만 만들어 공유합니다.
+    /// `cache`는 `data.candles`로 만든 것이어야 합니다.
+    pub fn run_with_cache<S: Strategy>(
+        &mut self,
+        data: &StockData,
+        cache: &IndicatorCache,
+        strategy: &S,
+    ) -> BacktestResult {
+        self.run_inner(data, cache, strategy, 0, |_| {})
+    }
+
+    fn run_inner<S, F>(
+        &mut self,
+        data: &StockData,
+        cache: &IndicatorCache,
+        strategy: &S,
+        interval: usize,
+        mut on_update: F,
+    ) -> BacktestResult
+    where
+        S: Strategy,
+        F: FnMut(&MetricsSnapshot),
+    {
+        debug_assert_eq!(cache.len(), data.len());
+        // 구독자가 없으면 비용이 거의 없는 계측 스팬
+        let _span = tracing::debug_span!("backtest.run", symbol = %data.symbol, bars = data.len())
+            .entered();
+
         for (i, candle) in data.candles.iter().enumerate() {
             // 포지션 가격 업데이트
             if let Some(pos) = self.positions.get_mut(&data.symbol) {
@@ -119,7 +188,7 @@ impl BacktestEngine {
             }
 
             // 전략 시그널 계산
-            let signal = strategy.generate_signal(&data.candles[..=i]);
+            let signal = strategy.signal_at(&data.candles, cache, i);
 
             // 시그널에 따른 주문 실행
             match signal {
@@ -128,8 +197,14 @@ impl BacktestEngine {
                 Signal::Hold => {}
             }
 
-            // 자산 가치 기록
-            self.equity_history.push(self.total_equity());
+            // 지표 갱신 (바당 O(1))
+            let positions_value = self.positions_value();
+            self.metrics
+                .update(to_f64(self.cash + positions_value), to_f64(positions_value));
+
+            if interval > 0 && (i + 1) % interval == 0 {
+                on_update(&self.metrics.snapshot());
+            }
         }
 
         self.calculate_result()
@@ -164,6 +239,7 @@ impl BacktestEngine {
         }
 
         self.cash -= total_cost;
+        self.metrics.record_fill(to_f64(cost));
         self.positions.insert(
             symbol.to_string(),
             Position {
@@ -173,7 +249,6 @@ impl BacktestEngine {
                 current_price: price,
             },
         );
-        self.trade_count += 1;
     }
 
     fn execute_sell(&mut self, symbol: &str, price: Decimal) {
@@ -184,103 +259,49 @@ impl BacktestEngine {
             let net_proceeds = proceeds - commission;
 
             self.cash += net_proceeds;
-            self.trade_count += 1;
+            self.metrics.record_fill(to_f64(proceeds));
 
-            // 수익 거래 카운트
-            if slippage_price > position.avg_price {
-                self.winning_trades += 1;
-            }
+            // 청산 손익 (수익 거래 카운트)
+            let pnl = (slippage_price - position.avg_price) * Decimal::from(position.quantity);
+            self.metrics.record_close(to_f64(pnl));
         }
     }
 
-    fn calculate_result(&self) -> BacktestResult {
-        let initial = self.config.initial_capital;
-        let final_equity = self.total_equity();
-        
-        // 총 수익률
-        let total_return = ((final_equity - initial) / initial * dec!(100))
-            .to_string()
-            .parse::<f64>()
-            .unwrap_or(0.0);
-
-        // 최대 낙폭 계산
-        let max_drawdown = self.calculate_max_drawdown();
-
-        // 승률
-        let win_rate = if self.trade_count > 0 {
-            (self.winning_trades as f64 / self.trade_count as f64) * 100.0
-        } else {
-            0.0
-        };
-
-        // 샤프 비율 계산 (간단 버전)
-        let sharpe_ratio = self.calculate_sharpe_ratio();
-
-        // CAGR 계산 (일 단위)
-        let days = self.equity_history.len() as f64;
-        let years = days / 252.0;
-        let cagr = if years > 0.0 {
-            ((final_equity / initial).to_string().parse::<f64>().unwrap_or(1.0)).powf(1.0 / years) - 1.0
-        } else {
-            0.0
-        } * 100.0;
+    fn calculate_result(&mut self) -> BacktestResult {
+        let snapshot = self.metrics.snapshot();
 
         BacktestResult {
-            total_return,
-            cagr,
-            sharpe_ratio,
-            max_drawdown,
-            win_rate,
-            total_trades: self.trade_count,
-            equity_curve: self.equity_history.iter()
-                .map(|e| e.to_string().parse::<f64>().unwrap_or(0.0))
-                .collect(),
-        }
-    }
-
-    fn calculate_max_drawdown(&self) -> f64 {
-        let mut max_equity = Decimal::ZERO;
-        let mut max_dd = Decimal::ZERO;
-
-        for equity in &self.equity_history {
-            if *equity > max_equity {
-                max_equity = *equity;
-            }
-            let dd = (max_equity - *equity) / max_equity * dec!(100);
-            if dd > max_dd {
-                max_dd = dd;
-            }
+            total_return: snapshot.total_return,
+            cagr: snapshot.cagr,
+            sharpe_ratio: snapshot.sharpe_ratio,
+            max_drawdown: snapshot.max_drawdown,
+            win_rate: snapshot.win_rate,
+            total_trades: snapshot.total_trades,
+            equity_curve: self.metrics.take_equity_curve(),
         }
-
-        max_dd.to_string().parse::<f64>().unwrap_or(0.0)
     }
+}
 
-    fn calculate_sharpe_ratio(&self) -> f64 {
-        if self.equity_history.len() < 2 {
-            return 0.0;
-        }
-
-        // 일별 수익률 계산
-        let returns: Vec<f64> = self.equity_history
-            .windows(2)
-            .map(|w| {
-                let prev = w[0].to_string().parse::<f64>().unwrap_or(1.0);
-                let curr = w[1].to_string().parse::<f64>().unwrap_or(1.0);
-                (curr - prev) / prev
-            })
-            .collect();
-
-        let mean: f64 = returns.iter().sum::<f64>() / returns.len() as f64;
-        let variance: f64 = returns.iter().map(|r| (r - mean).powi(2)).sum::<f64>() / returns.len() as f64;
-        let std_dev = variance.sqrt();
-
-        if std_dev == 0.0 {
-            return 0.0;
-        }
+/// 파라미터 그리드 백테스트 (병렬)
+///
+/// 지표 캐시를 한 번 만들어 모든 rayon 워커가 읽기 전용으로 공유합니다.
+/// 결과는 `strategies`와 같은 순서입니다.
+pub fn run_grid<S: Strategy>(
+    config: &BacktestConfig,
+    data: &StockData,
+    strategies: &[S],
+) -> Vec<BacktestResult> {
+    use rayon::prelude::*;
+
+    let cache = IndicatorCache::new(&data.candles);
+    strategies
+        .par_iter()
+        .map(|strategy| BacktestEngine::new(config.clone()).run_with_cache(data, &cache, strategy))
+        .collect()
+}
 
-        // 연환산 (252 거래일 기준)
-        (mean / std_dev) * (252.0_f64).sqrt()
-    }
+fn to_f64(value: Decimal) -> f64 {
+    value.to_f64().unwrap_or(0.0)
 }
 
 #[cfg(test)]
@@ -293,5 +314,82 @@ mod tests {
         assert_eq!(config.initial_capital, dec!(10_000_000));
         assert_eq!(config.max_positions, 10);
     }
+
+    #[test]
+    fn test_equity_curve_recorded_only_on_request() {
+        use crate::data::Candle;
+        use crate::strategy::Momentum;
+        use chrono::NaiveDate;
+
+        let candles: Vec<Candle> = [100, 102, 101, 108, 112, 104, 99, 103]
+            .iter()
+            .enumerate()
+            .map(|(i, &price)| Candle {
+                date: NaiveDate::from_ymd_opt(2024, 1, 1 + i as u32).unwrap(),
+                open: Decimal::from(price),
+                high: Decimal::from(price),
+                low: Decimal::from(price),
+                close: Decimal::from(price),
+                volume: 1000,
+            })
+            .collect();
+        let data = StockData {
+            symbol: "005930".to_string(),
+            candles,
+        };
+        let strategy = Momentum::new(2, 0.03);
+
+        let streamed = BacktestEngine::new(BacktestConfig::default()).run(&data, &strategy);
+        assert!(streamed.equity_curve.is_empty());
+
+        let config = BacktestConfig {
+            record_equity_curve: true,
+            ..BacktestConfig::default()
+        };
+        let recorded = BacktestEngine::new(config).run(&data, &strategy);
+        assert_eq!(recorded.equity_curve.len(), data.len());
+        assert_eq!(recorded.sharpe_ratio, streamed.sharpe_ratio);
+        assert_eq!(recorded.max_drawdown, streamed.max_drawdown);
+    }
+
+    #[test]
+    fn test_run_grid_matches_sequential_runs() {
+        use crate::data::Candle;
+        use crate::strategy::SmaCrossover;
+        use chrono::{Duration, NaiveDate};
+
+        let start = NaiveDate::from_ymd_opt(2024, 1, 1).unwrap();
+        let candles: Vec<Candle> = (0..300)
+            .map(|i| {
+                let price = Decimal::from(10_000 + ((i * 53) % 97) * 20 - ((i / 30) % 2) * 900);
+                Candle {
+                    date: start + Duration::days(i),
+                    open: price,
+                    high: price,
+                    low: price,
+                    close: price,
+                    volume: 1000,
+                }
+            })
+            .collect();
+        let data = StockData {
+            symbol: "005930".to_string(),
+            candles,
+        };
+        let config = BacktestConfig::default();
+        let grid: Vec<SmaCrossover> = [(5, 20), (10, 30), (20, 60)]
+            .iter()
+            .map(|&(short, long)| SmaCrossover::new(short, long))
+            .collect();
+
+        let results = run_grid(&config, &data, &grid);
+        assert_eq!(results.len(), grid.len());
+        for (strategy, result) in grid.iter().zip(&results) {
+            let expected = BacktestEngine::new(config.clone()).run(&data, strategy);
+            assert_eq!(result.total_trades, expected.total_trades);
+            assert_eq!(result.total_return, expected.total_return);
+        }
+        assert!(results.iter().any(|r| r.total_trades > 0));
+    }
 }
 
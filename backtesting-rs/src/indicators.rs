@@ -0,0 +1,159 @@
+//! 지표 캐시 모듈
+//!
+//! 종가의 누적합과 제곱 누적합을 한 번 계산해 두면 어떤 구간의 평균과 분산도
+//! O(1)로 구할 수 있습니다. 데이터셋마다 한 번 만들고 파라미터 조합 간에 읽기 전용으로
+//! 공유하므로, 그리드 탐색 비용이 조합 수 × 기간 × 바 수가 아니라 조합 수 × 바 수에
+//! 비례합니다.
+
+use rust_decimal::prelude::ToPrimitive;
+
+use crate::data::Candle;
+
+/// 종가 누적합 기반 지표 캐시
+///
+/// 누적합은 첫 종가를 뺀 값으로 계산합니다. 가격 수준이 큰 종목에서 제곱합의
+/// 자릿수 손실(catastrophic cancellation)로 분산이 틀어지는 것을 줄이기 위함입니다.
+#[derive(Debug, Clone)]
+pub struct IndicatorCache {
+    closes: Vec<f64>,
+    /// 누적합 기준값 (첫 종가)
+    shift: f64,
+    /// `sums[i]` = 처음 i개 종가의 (종가 - shift) 합
+    sums: Vec<f64>,
+    /// `sq_sums[i]` = 처음 i개 종가의 (종가 - shift)² 합
+    sq_sums: Vec<f64>,
+}
+
+impl IndicatorCache {
+    /// 캔들 종가로 캐시 생성
+    pub fn new(candles: &[Candle]) -> Self {
+        let closes: Vec<f64> = candles
+            .iter()
+            .map(|c| c.close.to_f64().unwrap_or(0.0))
+            .collect();
+        Self::from_closes(closes)
+    }
+
+    /// 종가 배열로 캐시 생성
+    pub fn from_closes(closes: Vec<f64>) -> Self {
+        let shift = closes.first().copied().unwrap_or(0.0);
+        let mut sums = Vec::with_capacity(closes.len() + 1);
+        let mut sq_sums = Vec::with_capacity(closes.len() + 1);
+        let (mut sum, mut sq_sum) = (0.0, 0.0);
+        sums.push(sum);
+        sq_sums.push(sq_sum);
+        for &close in &closes {
+            let x = close - shift;
+            sum += x;
+            sq_sum += x * x;
+            sums.push(sum);
+            sq_sums.push(sq_sum);
+        }
+        Self {
+            closes,
+            shift,
+            sums,
+            sq_sums,
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.closes.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.closes.is_empty()
+    }
+
+    /// `i`번째 종가
+    pub fn close(&self, i: usize) -> f64 {
+        self.closes[i]
+    }
+
+    /// `end`번째 바까지(포함) `period`개 구간의 (shift 기준 합, 제곱합)
+    fn window(&self, end: usize, period: usize) -> Option<(f64, f64)> {
+        if period == 0 || end >= self.len() || end + 1 < period {
+            return None;
+        }
+        let (lo, hi) = (end + 1 - period, end + 1);
+        Some((
+            self.sums[hi] - self.sums[lo],
+            self.sq_sums[hi] - self.sq_sums[lo],
+        ))
+    }
+
+    /// `end`번째 바까지 `period`개 종가의 단순이동평균
+    pub fn sma(&self, end: usize, period: usize) -> Option<f64> {
+        self.window(end, period)
+            .map(|(sum, _)| self.shift + sum / period as f64)
+    }
+
+    /// `end`번째 바까지 `period`개 종가의 모분산
+    pub fn variance(&self, end: usize, period: usize) -> Option<f64> {
+        self.window(end, period).map(|(sum, sq_sum)| {
+            let n = period as f64;
+            let mean = sum / n;
+            // 반올림 오차로 음수가 나오지 않도록 0에서 자름
+            (sq_sum / n - mean * mean).max(0.0)
+        })
+    }
+
+    /// `end`번째 바까지 `period`개 종가의 표준편차
+    pub fn std_dev(&self, end: usize, period: usize) -> Option<f64> {
+        self.variance(end, period).map(f64::sqrt)
+    }
+
+    /// 볼린저 밴드 (하단, 중심, 상단)
+    pub fn bollinger(&self, end: usize, period: usize, k: f64) -> Option<(f64, f64, f64)> {
+        let (sum, sq_sum) = self.window(end, period)?;
+        let n = period as f64;
+        let mean = sum / n;
+        let std_dev = (sq_sum / n - mean * mean).max(0.0).sqrt();
+        let sma = self.shift + mean;
+        Some((sma - k * std_dev, sma, sma + k * std_dev))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn naive_stats(closes: &[f64], end: usize, period: usize) -> (f64, f64) {
+        let window = &closes[end + 1 - period..=end];
+        let mean = window.iter().sum::<f64>() / period as f64;
+        let variance = window.iter().map(|c| (c - mean).powi(2)).sum::<f64>() / period as f64;
+        (mean, variance)
+    }
+
+    #[test]
+    fn test_matches_naive_window_statistics() {
+        // 가격 수준이 높아도 shift 덕분에 분산 오차가 작음
+        let closes: Vec<f64> = (0..500)
+            .map(|i| 1_000_000.0 + ((i * 37) % 101) as f64 * 10.0)
+            .collect();
+        let cache = IndicatorCache::from_closes(closes.clone());
+
+        for period in [1, 5, 20, 60] {
+            for end in period - 1..closes.len() {
+                let (mean, variance) = naive_stats(&closes, end, period);
+                assert!((cache.sma(end, period).unwrap() - mean).abs() < 1e-6);
+                assert!((cache.variance(end, period).unwrap() - variance).abs() < 1e-4);
+            }
+        }
+    }
+
+    #[test]
+    fn test_window_out_of_range() {
+        let cache = IndicatorCache::from_closes(vec![1.0, 2.0, 3.0]);
+        assert_eq!(cache.sma(1, 3), None);
+        assert_eq!(cache.sma(3, 1), None);
+        assert_eq!(cache.sma(2, 0), None);
+        assert_eq!(cache.sma(2, 3), Some(2.0));
+
+        let (lower, mid, upper) = cache.bollinger(2, 3, 2.0).unwrap();
+        let std_dev = (2.0f64 / 3.0).sqrt();
+        assert!((mid - 2.0).abs() < 1e-12);
+        assert!((upper - (2.0 + 2.0 * std_dev)).abs() < 1e-12);
+        assert!((lower - (2.0 - 2.0 * std_dev)).abs() < 1e-12);
+    }
+}
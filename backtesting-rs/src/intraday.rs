@@ -0,0 +1,1104 @@
+//! 인트라데이(분봉/틱) 재생 엔진
+//!
+//! 여러 종목의 분봉 또는 틱을 시각 순으로 병합(BinaryHeap k-way merge)하여 재생하고,
+//! 한국거래소(KRX) 정규장 규칙에 따라 시장가/지정가 주문을 체결합니다.
+//!
+//! - 09:00 ~ 15:20 접속매매: 주문은 제출한 바의 다음 바부터 체결 (look-ahead 방지)
+//! - 15:20 ~ 15:30 종가 단일가매매: 주문을 모아 두었다가 15:30 종가로 일괄 체결
+//! - 가격제한폭: 전일 종가 대비 ±30%, 호가 단위에 맞지 않는 지정가는 거부
+//! - 당일 유효 주문: 장 마감 후 미체결 주문은 자동 취소
+//! - 부분 체결: 바 거래량의 `max_participation` 비율까지만 체결
+//!
+//! 가격과 금액은 원 단위 정수(i64)로 다루며, 종목 상태와 주문 버퍼는 실행 시작 시
+//! 미리 할당하므로 재생 중에는 할당이 거의 일어나지 않습니다.
+
+use std::cmp::Reverse;
+use std::collections::binary_heap::PeekMut;
+use std::collections::BinaryHeap;
+use std::path::Path;
+
+use chrono::{Duration, NaiveDate, NaiveDateTime, NaiveTime};
+use serde::{Deserialize, Serialize};
+
+use crate::data::DataError;
+use crate::metrics::{MetricsSnapshot, StreamingMetrics};
+
+/// CSV 한 행의 대략적인 바이트 수 (버퍼 크기 추정용)
+const CSV_BYTES_PER_ROW: usize = 48;
+
+/// 분봉 또는 틱 (틱은 시가 = 고가 = 저가 = 종가)
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub struct Bar {
+    pub timestamp: NaiveDateTime,
+    pub open: i64,
+    pub high: i64,
+    pub low: i64,
+    pub close: i64,
+    pub volume: i64,
+}
+
+impl Bar {
+    /// 체결 틱 하나를 바로 표현
+    pub fn tick(timestamp: NaiveDateTime, price: i64, volume: i64) -> Self {
+        Self {
+            timestamp,
+            open: price,
+            high: price,
+            low: price,
+            close: price,
+            volume,
+        }
+    }
+}
+
+/// 종목별 인트라데이 시계열
+#[derive(Debug, Clone)]
+pub struct IntradaySeries {
+    pub symbol: String,
+    pub bars: Vec<Bar>,
+}
+
+impl IntradaySeries {
+    pub fn with_capacity(symbol: impl Into<String>, capacity: usize) -> Self {
+        Self {
+            symbol: symbol.into(),
+            bars: Vec::with_capacity(capacity),
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.bars.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.bars.is_empty()
+    }
+
+    /// CSV 파일에서 로드 (컬럼: timestamp, open, high, low, close, volume)
+    ///
+    /// timestamp는 `2024-01-02T09:01:00` 형식입니다. 파일 크기로 행 수를 추정하여
+    /// 버퍼를 한 번에 할당합니다.
+    pub fn load_csv<P: AsRef<Path>>(symbol: &str, path: P) -> Result<Self, DataError> {
+        let path = path.as_ref();
+        let estimated_rows = std::fs::metadata(path)
+            .map(|m| m.len() as usize / CSV_BYTES_PER_ROW)
+            .unwrap_or(0);
+        let mut series = Self::with_capacity(symbol, estimated_rows);
+
+        let mut reader = csv::Reader::from_path(path)?;
+        for result in reader.deserialize() {
+            series.bars.push(result?);
+        }
+        if series.is_empty() {
+            return Err(DataError::EmptyData);
+        }
+
+        // 대부분 이미 시각순이므로 확인 후에만 정렬
+        if !series
+            .bars
+            .windows(2)
+            .all(|w| w[0].timestamp <= w[1].timestamp)
+        {
+            series.bars.sort_by_key(|b| b.timestamp);
+        }
+        Ok(series)
+    }
+}
+
+/// 유가증권시장 호가 가격 단위
+pub fn tick_size(price: i64) -> i64 {
+    match price {
+        p if p < 2_000 => 1,
+        p if p < 5_000 => 5,
+        p if p < 20_000 => 10,
+        p if p < 50_000 => 50,
+        p if p < 200_000 => 100,
+        p if p < 500_000 => 500,
+        _ => 1_000,
+    }
+}
+
+/// 장 운영 구간
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum SessionPhase {
+    /// 장 시작 전 (동시호가 포함, 재생하지 않음)
+    PreOpen,
+    /// 접속매매
+    Continuous,
+    /// 종가 단일가매매 (주문 접수만, 체결은 장 마감 시)
+    ClosingAuction,
+    /// 장 마감 (종가 체결)
+    Close,
+    /// 장 마감 후 (재생하지 않음)
+    AfterHours,
+}
+
+/// 장 운영 규칙
+#[derive(Debug, Clone)]
+pub struct SessionRules {
+    /// 접속매매 시작
+    pub open: NaiveTime,
+    /// 종가 단일가매매 시작
+    pub closing_auction: NaiveTime,
+    /// 장 마감 (종가 결정)
+    pub close: NaiveTime,
+    /// 가격제한폭 (%)
+    pub price_limit_pct: i64,
+}
+
+impl Default for SessionRules {
+    /// KRX 정규장
+    fn default() -> Self {
+        Self {
+            open: NaiveTime::from_hms_opt(9, 0, 0).unwrap(),
+            closing_auction: NaiveTime::from_hms_opt(15, 20, 0).unwrap(),
+            close: NaiveTime::from_hms_opt(15, 30, 0).unwrap(),
+            price_limit_pct: 30,
+        }
+    }
+}
+
+impl SessionRules {
+    pub fn phase(&self, time: NaiveTime) -> SessionPhase {
+        if time < self.open {
+            SessionPhase::PreOpen
+        } else if time < self.closing_auction {
+            SessionPhase::Continuous
+        } else if time < self.close {
+            SessionPhase::ClosingAuction
+        } else if time == self.close {
+            SessionPhase::Close
+        } else {
+            SessionPhase::AfterHours
+        }
+    }
+
+    /// 전일 종가 기준 (하한가, 상한가). 전일 종가가 없으면 제한 없음
+    ///
+    /// 제한폭을 호가 단위로 절사하는 근사 계산입니다.
+    pub fn price_band(&self, prev_close: Option<i64>) -> (i64, i64) {
+        match prev_close {
+            Some(base) => {
+                let width = base * self.price_limit_pct / 100;
+                let upper = base + width;
+                let lower = base - width;
+                (
+                    lower + (tick_size(lower) - lower % tick_size(lower)) % tick_size(lower),
+                    upper - upper % tick_size(upper),
+                )
+            }
+            None => (1, i64::MAX),
+        }
+    }
+}
+
+/// 매매 방향
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub enum Side {
+    Buy,
+    Sell,
+}
+
+/// 주문 유형
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub enum OrderType {
+    Market,
+    /// 지정가 (원)
+    Limit(i64),
+}
+
+/// 전략이 제출하는 주문
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct OrderRequest {
+    pub side: Side,
+    pub order_type: OrderType,
+    pub quantity: i64,
+}
+
+/// 전략 명령 (현재 바의 종목에 적용)
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum Command {
+    Submit(OrderRequest),
+    /// 종목의 미체결 주문 전체 취소
+    CancelAll,
+}
+
+/// 미체결 주문
+#[derive(Debug, Clone, Copy)]
+pub struct Order {
+    pub id: u64,
+    pub symbol: usize,
+    pub side: Side,
+    pub order_type: OrderType,
+    pub quantity: i64,
+    pub filled: i64,
+    pub submitted_at: NaiveDateTime,
+}
+
+impl Order {
+    pub fn remaining(&self) -> i64 {
+        self.quantity - self.filled
+    }
+}
+
+/// 체결
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
+pub struct Fill {
+    pub order_id: u64,
+    /// 종목 인덱스 (`run`에 전달한 시계열 순서)
+    pub symbol: usize,
+    pub side: Side,
+    pub price: i64,
+    pub quantity: i64,
+    pub commission: i64,
+    pub timestamp: NaiveDateTime,
+}
+
+/// 전략에 전달되는 현재 상태
+#[derive(Debug, Clone, Copy)]
+pub struct BarContext {
+    pub symbol: usize,
+    pub timestamp: NaiveDateTime,
+    pub phase: SessionPhase,
+    /// 보유 수량
+    pub position: i64,
+    /// 예수금
+    pub cash: i64,
+    /// 종목의 미체결 주문 수
+    pub open_orders: usize,
+}
+
+/// 인트라데이 전략 트레이트
+pub trait IntradayStrategy {
+    /// 바마다 호출됩니다. 주문은 `commands`에 추가합니다 (엔진이 재사용하는 버퍼).
+    fn on_bar(&mut self, ctx: &BarContext, bar: &Bar, commands: &mut Vec<Command>);
+
+    /// 체결 시 호출됩니다.
+    fn on_fill(&mut self, _fill: &Fill) {}
+
+    /// 장 마감 후 호출됩니다 (미체결 주문 만료 이후).
+    fn on_session_end(&mut self, _date: NaiveDate) {}
+
+    /// 전략 이름
+    fn name(&self) -> &str;
+}
+
+/// 인트라데이 백테스트 설정
+#[derive(Debug, Clone)]
+pub struct IntradayConfig {
+    /// 초기 자본금 (원)
+    pub initial_capital: i64,
+    /// 수수료율 (0.00015 = 0.015%)
+    pub commission_rate: f64,
+    /// 접속매매 시장가 슬리피지 (호가 단위 수)
+    pub slippage_ticks: i64,
+    /// 바 거래량 대비 최대 체결 비율
+    pub max_participation: f64,
+    /// 장 운영 규칙
+    pub session: SessionRules,
+    /// 체결 내역 기록 여부
+    pub record_fills: bool,
+}
+
+impl Default for IntradayConfig {
+    fn default() -> Self {
+        Self {
+            initial_capital: 10_000_000,
+            commission_rate: 0.00015,
+            slippage_ticks: 1,
+            max_participation: 0.1,
+            session: SessionRules::default(),
+            record_fills: false,
+        }
+    }
+}
+
+/// 실행 통계
+#[derive(Debug, Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct IntradayStats {
+    /// 재생한 바 수
+    pub bars: usize,
+    /// 장 운영 시간 외라서 건너뛴 바 수
+    pub skipped_bars: usize,
+    /// 거래일 수
+    pub days: usize,
+    pub orders: usize,
+    pub fills: usize,
+    /// 잔량이 남은 체결 수
+    pub partial_fills: usize,
+    pub rejected: usize,
+    pub cancelled: usize,
+    /// 장 마감으로 만료된 주문 수
+    pub expired: usize,
+}
+
+/// 인트라데이 백테스트 결과
+#[derive(Debug, Clone)]
+pub struct IntradayResult {
+    /// 일별 종가 기준 성과 지표
+    pub metrics: MetricsSnapshot,
+    pub stats: IntradayStats,
+    /// 최종 자산 (원)
+    pub final_equity: i64,
+    /// 체결 내역 (`record_fills`가 false면 비어있음)
+    pub fills: Vec<Fill>,
+}
+
+/// 종목별 상태
+#[derive(Debug, Clone, Default)]
+struct SymbolBook {
+    open_orders: Vec<Order>,
+    position: i64,
+    /// 보유 수량의 매입 금액 합계
+    cost_basis: i64,
+    /// 진입부터 청산까지 누적 실현 손익
+    round_trip_pnl: f64,
+    last_price: i64,
+    last_volume: i64,
+    prev_close: Option<i64>,
+    /// 당일 종가 체결 완료 여부
+    auction_done: bool,
+}
+
+/// 인트라데이 백테스트 엔진
+pub struct IntradayEngine {
+    config: IntradayConfig,
+    cash: i64,
+    books: Vec<SymbolBook>,
+    next_order_id: u64,
+    metrics: StreamingMetrics,
+    stats: IntradayStats,
+    fills: Vec<Fill>,
+    /// 전략 명령 버퍼 (바마다 재사용)
+    commands: Vec<Command>,
+}
+
+impl IntradayEngine {
+    pub fn new(config: IntradayConfig) -> Self {
+        let cash = config.initial_capital;
+        Self {
+            metrics: StreamingMetrics::new(cash as f64),
+            config,
+            cash,
+            books: Vec::new(),
+            next_order_id: 1,
+            stats: IntradayStats::default(),
+            fills: Vec::new(),
+            commands: Vec::with_capacity(16),
+        }
+    }
+
+    /// 실행 중인 지표 누산기
+    pub fn metrics(&self) -> &StreamingMetrics {
+        &self.metrics
+    }
+
+    /// 현재 총 자산 (보유 종목은 마지막 체결가로 평가)
+    pub fn total_equity(&self) -> i64 {
+        self.cash + self.positions_value()
+    }
+
+    fn positions_value(&self) -> i64 {
+        self.books.iter().map(|b| b.position * b.last_price).sum()
+    }
+
+    /// 백테스트 실행
+    ///
+    /// 모든 종목의 바를 시각 순으로 병합하여 재생합니다. 시각이 같으면 `data`의
+    /// 순서대로 처리합니다. 종목 인덱스는 `data`의 위치입니다.
+    pub fn run<S: IntradayStrategy>(
+        &mut self,
+        data: &[IntradaySeries],
+        strategy: &mut S,
+    ) -> IntradayResult {
+        let total_bars: usize = data.iter().map(|s| s.len()).sum();
+        let _span = tracing::debug_span!(
+            "intraday.run",
+            strategy = strategy.name(),
+            symbols = data.len(),
+            bars = total_bars
+        )
+        .entered();
+
+        self.books = vec![SymbolBook::default(); data.len()];
+        for book in &mut self.books {
+            book.open_orders.reserve(8);
+        }
+
+        // 종목마다 다음 바 하나씩만 힙에 유지 (k-way merge)
+        let mut cursors = vec![0usize; data.len()];
+        let mut heap: BinaryHeap<Reverse<(NaiveDateTime, usize)>> = data
+            .iter()
+            .enumerate()
+            .filter_map(|(s, series)| series.bars.first().map(|b| Reverse((b.timestamp, s))))
+            .collect();
+
+        let mut current_date: Option<NaiveDate> = None;
+        while let Some(mut top) = heap.peek_mut() {
+            let Reverse((timestamp, s)) = *top;
+            let i = cursors[s];
+            cursors[s] += 1;
+            // pop + push 대신 최상단을 교체하여 sift-down 한 번으로 처리
+            match data[s].bars.get(i + 1) {
+                Some(next) => *top = Reverse((next.timestamp, s)),
+                None => {
+                    PeekMut::pop(top);
+                }
+            }
+
+            let date = timestamp.date();
+            if current_date != Some(date) {
+                if let Some(previous) = current_date {
+                    self.end_of_day(previous, strategy);
+                }
+                current_date = Some(date);
+            }
+            self.on_bar(s, &data[s].bars[i], strategy);
+        }
+        if let Some(last) = current_date {
+            self.end_of_day(last, strategy);
+        }
+
+        IntradayResult {
+            metrics: self.metrics.snapshot(),
+            stats: self.stats.clone(),
+            final_equity: self.total_equity(),
+            fills: std::mem::take(&mut self.fills),
+        }
+    }
+
+    fn on_bar<S: IntradayStrategy>(&mut self, s: usize, bar: &Bar, strategy: &mut S) {
+        let phase = self.config.session.phase(bar.timestamp.time());
+        match phase {
+            SessionPhase::PreOpen | SessionPhase::AfterHours => {
+                self.stats.skipped_bars += 1;
+                return;
+            }
+            SessionPhase::Continuous => self.match_continuous(s, bar, strategy),
+            SessionPhase::ClosingAuction => {}
+            SessionPhase::Close => {
+                self.run_auction(s, bar.close, bar.volume, bar.timestamp, strategy)
+            }
+        }
+        self.stats.bars += 1;
+
+        let book = &mut self.books[s];
+        book.last_price = bar.close;
+        book.last_volume = bar.volume;
+        if phase == SessionPhase::Close {
+            return;
+        }
+
+        let ctx = BarContext {
+            symbol: s,
+            timestamp: bar.timestamp,
+            phase,
+            position: book.position,
+            cash: self.cash,
+            open_orders: book.open_orders.len(),
+        };
+        // 버퍼를 잠시 꺼내 전략에 넘기고 용량을 유지한 채 돌려놓음
+        let mut commands = std::mem::take(&mut self.commands);
+        strategy.on_bar(&ctx, bar, &mut commands);
+        for command in commands.drain(..) {
+            self.apply(s, command, bar.timestamp);
+        }
+        self.commands = commands;
+    }
+
+    fn apply(&mut self, s: usize, command: Command, timestamp: NaiveDateTime) {
+        let book = &mut self.books[s];
+        let request = match command {
+            Command::CancelAll => {
+                self.stats.cancelled += book.open_orders.len();
+                book.open_orders.clear();
+                return;
+            }
+            Command::Submit(request) => request,
+        };
+
+        let valid = request.quantity > 0
+            && match request.order_type {
+                OrderType::Market => true,
+                OrderType::Limit(price) => {
+                    let (lower, upper) = self.config.session.price_band(book.prev_close);
+                    price % tick_size(price) == 0 && (lower..=upper).contains(&price)
+                }
+            }
+            && (request.side == Side::Buy || {
+                // 공매도 불가: 보유 수량에서 미체결 매도 수량을 뺀 만큼만 매도
+                let pending: i64 = book
+                    .open_orders
+                    .iter()
+                    .filter(|o| o.side == Side::Sell)
+                    .map(|o| o.remaining())
+                    .sum();
+                request.quantity <= book.position - pending
+            });
+        if !valid {
+            self.stats.rejected += 1;
+            return;
+        }
+
+        book.open_orders.push(Order {
+            id: self.next_order_id,
+            symbol: s,
+            side: request.side,
+            order_type: request.order_type,
+            quantity: request.quantity,
+            filled: 0,
+            submitted_at: timestamp,
+        });
+        self.next_order_id += 1;
+        self.stats.orders += 1;
+    }
+
+    /// 접속매매: 바 시가 기준으로 주문 순서대로 체결
+    fn match_continuous<S: IntradayStrategy>(&mut self, s: usize, bar: &Bar, strategy: &mut S) {
+        if self.books[s].open_orders.is_empty() {
+            return;
+        }
+        let (lower, upper) = self.config.session.price_band(self.books[s].prev_close);
+        let slippage = self.config.slippage_ticks * tick_size(bar.open);
+        let mut available = self.participation_limit(bar.volume);
+
+        let mut k = 0;
+        while k < self.books[s].open_orders.len() && available > 0 {
+            let order = self.books[s].open_orders[k];
+            let price = match (order.side, order.order_type) {
+                (Side::Buy, OrderType::Market) => Some((bar.open + slippage).min(upper)),
+                (Side::Sell, OrderType::Market) => Some((bar.open - slippage).max(lower)),
+                (Side::Buy, OrderType::Limit(limit)) => {
+                    (bar.low <= limit).then(|| limit.min(bar.open))
+                }
+                (Side::Sell, OrderType::Limit(limit)) => {
+                    (bar.high >= limit).then(|| limit.max(bar.open))
+                }
+            };
+            if let Some(price) = price {
+                available -= self.fill(s, k, price, available, bar.timestamp, strategy);
+            }
+            k += 1;
+        }
+        self.books[s].open_orders.retain(|o| o.remaining() > 0);
+    }
+
+    /// 종가 단일가매매: 모든 체결 가능 주문을 종가 하나로 체결
+    fn run_auction<S: IntradayStrategy>(
+        &mut self,
+        s: usize,
+        price: i64,
+        volume: i64,
+        timestamp: NaiveDateTime,
+        strategy: &mut S,
+    ) {
+        self.books[s].auction_done = true;
+        let mut available = self.participation_limit(volume);
+
+        let mut k = 0;
+        while k < self.books[s].open_orders.len() && available > 0 {
+            let order = self.books[s].open_orders[k];
+            let crosses = match (order.side, order.order_type) {
+                (_, OrderType::Market) => true,
+                (Side::Buy, OrderType::Limit(limit)) => limit >= price,
+                (Side::Sell, OrderType::Limit(limit)) => limit <= price,
+            };
+            if crosses {
+                available -= self.fill(s, k, price, available, timestamp, strategy);
+            }
+            k += 1;
+        }
+        self.books[s].open_orders.retain(|o| o.remaining() > 0);
+    }
+
+    fn participation_limit(&self, volume: i64) -> i64 {
+        (volume as f64 * self.config.max_participation).floor() as i64
+    }
+
+    /// `k`번째 미체결 주문을 최대 `available`주까지 체결하고 체결 수량을 반환
+    fn fill<S: IntradayStrategy>(
+        &mut self,
+        s: usize,
+        k: usize,
+        price: i64,
+        available: i64,
+        timestamp: NaiveDateTime,
+        strategy: &mut S,
+    ) -> i64 {
+        let rate = self.config.commission_rate;
+        let book = &mut self.books[s];
+        let order = book.open_orders[k];
+        let mut quantity = order.remaining().min(available);
+        if order.side == Side::Buy {
+            // 예수금 범위 내에서만 매수
+            let affordable = (self.cash as f64 / (price as f64 * (1.0 + rate))).floor() as i64;
+            quantity = quantity.min(affordable);
+        }
+        if quantity <= 0 {
+            return 0;
+        }
+
+        let notional = price * quantity;
+        let commission = (notional as f64 * rate).round() as i64;
+        match order.side {
+            Side::Buy => {
+                self.cash -= notional + commission;
+                book.position += quantity;
+                book.cost_basis += notional;
+            }
+            Side::Sell => {
+                let cost = book.cost_basis * quantity / book.position;
+                book.round_trip_pnl += (notional - cost) as f64;
+                book.cost_basis -= cost;
+                book.position -= quantity;
+                self.cash += notional - commission;
+                if book.position == 0 {
+                    self.metrics.record_close(book.round_trip_pnl);
+                    book.round_trip_pnl = 0.0;
+                    book.cost_basis = 0;
+                }
+            }
+        }
+        book.open_orders[k].filled += quantity;
+        self.metrics.record_fill(notional as f64);
+        self.stats.fills += 1;
+        if book.open_orders[k].remaining() > 0 {
+            self.stats.partial_fills += 1;
+        }
+
+        let fill = Fill {
+            order_id: order.id,
+            symbol: s,
+            side: order.side,
+            price,
+            quantity,
+            commission,
+            timestamp,
+        };
+        if self.config.record_fills {
+            self.fills.push(fill);
+        }
+        strategy.on_fill(&fill);
+        quantity
+    }
+
+    /// 장 마감 처리: 종가 체결, 미체결 주문 만료, 일별 지표 갱신
+    fn end_of_day<S: IntradayStrategy>(&mut self, date: NaiveDate, strategy: &mut S) {
+        let close_time = date.and_time(self.config.session.close);
+        for s in 0..self.books.len() {
+            let book = &self.books[s];
+            // 15:30 바가 없는 데이터는 마지막 체결가로 종가 단일가매매 처리
+            if !book.auction_done && !book.open_orders.is_empty() && book.last_price > 0 {
+                let (price, volume) = (book.last_price, book.last_volume);
+                self.run_auction(s, price, volume, close_time, strategy);
+            }
+            let book = &mut self.books[s];
+            self.stats.expired += book.open_orders.len();
+            book.open_orders.clear();
+            book.auction_done = false;
+            if book.last_price > 0 {
+                book.prev_close = Some(book.last_price);
+            }
+        }
+
+        let positions_value = self.positions_value();
+        self.metrics
+            .update((self.cash + positions_value) as f64, positions_value as f64);
+        self.stats.days += 1;
+        strategy.on_session_end(date);
+    }
+}
+
+/// 시가 범위 돌파 전략 (예제)
+///
+/// 장 시작 후 `range_minutes`분 동안의 고가를 돌파하면 시장가로 매수하고,
+/// 접속매매 마지막 바(`exit_time` 이후) 또는 종가 단일가매매 구간의 첫 바에서
+/// 시장가로 매도하여 당일 청산합니다. 단일가 구간 바가 없는 일반 분봉 데이터에서도
+/// 청산 주문은 장 마감 처리 시 마지막 체결가로 체결됩니다.
+pub struct OpeningRangeBreakout {
+    pub range_end: NaiveTime,
+    /// 이 시각 이후의 접속매매 바에서 청산 (기본: 15:19, 1분봉의 마지막 접속매매 바)
+    pub exit_time: NaiveTime,
+    pub quantity: i64,
+    range_high: Vec<i64>,
+    entered: Vec<bool>,
+}
+
+impl OpeningRangeBreakout {
+    /// `range_minutes`는 장 시작(09:00)부터 접속매매 종료(15:20) 전까지여야 합니다.
+    pub fn new(range_minutes: u32, quantity: i64) -> Self {
+        let open = NaiveTime::from_hms_opt(9, 0, 0).unwrap();
+        let exit_time = NaiveTime::from_hms_opt(15, 19, 0).unwrap();
+        assert!(
+            i64::from(range_minutes) < (exit_time - open).num_minutes(),
+            "range_minutes는 접속매매 시간보다 짧아야 합니다: {range_minutes}"
+        );
+        Self {
+            range_end: open + Duration::minutes(i64::from(range_minutes)),
+            exit_time,
+            quantity,
+            range_high: Vec::new(),
+            entered: Vec::new(),
+        }
+    }
+}
+
+impl IntradayStrategy for OpeningRangeBreakout {
+    fn on_bar(&mut self, ctx: &BarContext, bar: &Bar, commands: &mut Vec<Command>) {
+        if ctx.symbol >= self.range_high.len() {
+            self.range_high.resize(ctx.symbol + 1, 0);
+            self.entered.resize(ctx.symbol + 1, false);
+        }
+        let s = ctx.symbol;
+        // 접속매매 마지막 바이거나 단일가 구간으로 넘어왔으면 청산
+        let exiting = match ctx.phase {
+            SessionPhase::Continuous => bar.timestamp.time() >= self.exit_time,
+            SessionPhase::ClosingAuction => true,
+            _ => false,
+        };
+        if exiting {
+            if ctx.position > 0 && ctx.open_orders == 0 {
+                commands.push(Command::Submit(OrderRequest {
+                    side: Side::Sell,
+                    order_type: OrderType::Market,
+                    quantity: ctx.position,
+                }));
+            }
+            return;
+        }
+        match ctx.phase {
+            SessionPhase::Continuous if bar.timestamp.time() < self.range_end => {
+                self.range_high[s] = self.range_high[s].max(bar.high);
+            }
+            SessionPhase::Continuous => {
+                if !self.entered[s] && ctx.position == 0 && bar.close > self.range_high[s] {
+                    self.entered[s] = true;
+                    commands.push(Command::Submit(OrderRequest {
+                        side: Side::Buy,
+                        order_type: OrderType::Market,
+                        quantity: self.quantity,
+                    }));
+                }
+            }
+            _ => {}
+        }
+    }
+
+    fn on_session_end(&mut self, _date: NaiveDate) {
+        self.range_high.iter_mut().for_each(|h| *h = 0);
+        self.entered.iter_mut().for_each(|e| *e = false);
+    }
+
+    fn name(&self) -> &str {
+        "Opening Range Breakout"
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn at(day: u32, hour: u32, minute: u32) -> NaiveDateTime {
+        NaiveDate::from_ymd_opt(2024, 1, day)
+            .unwrap()
+            .and_hms_opt(hour, minute, 0)
+            .unwrap()
+    }
+
+    fn bar(timestamp: NaiveDateTime, open: i64, high: i64, low: i64, close: i64) -> Bar {
+        Bar {
+            timestamp,
+            open,
+            high,
+            low,
+            close,
+            volume: 1_000,
+        }
+    }
+
+    fn series(symbol: &str, bars: Vec<Bar>) -> IntradaySeries {
+        IntradaySeries {
+            symbol: symbol.to_string(),
+            bars,
+        }
+    }
+
+    /// 지정한 (종목, 시각)에 미리 정한 명령을 내리는 테스트 전략
+    #[derive(Default)]
+    struct Scripted {
+        script: Vec<(usize, NaiveDateTime, Command)>,
+        seen: Vec<(NaiveDateTime, usize)>,
+        fills: Vec<Fill>,
+    }
+
+    impl IntradayStrategy for Scripted {
+        fn on_bar(&mut self, ctx: &BarContext, _bar: &Bar, commands: &mut Vec<Command>) {
+            self.seen.push((ctx.timestamp, ctx.symbol));
+            for (s, t, command) in &self.script {
+                if *s == ctx.symbol && *t == ctx.timestamp {
+                    commands.push(*command);
+                }
+            }
+        }
+
+        fn on_fill(&mut self, fill: &Fill) {
+            self.fills.push(*fill);
+        }
+
+        fn name(&self) -> &str {
+            "Scripted"
+        }
+    }
+
+    fn submit(side: Side, order_type: OrderType, quantity: i64) -> Command {
+        Command::Submit(OrderRequest {
+            side,
+            order_type,
+            quantity,
+        })
+    }
+
+    #[test]
+    fn test_session_phase() {
+        let rules = SessionRules::default();
+        let t = |h, m| NaiveTime::from_hms_opt(h, m, 0).unwrap();
+        assert_eq!(rules.phase(t(8, 59)), SessionPhase::PreOpen);
+        assert_eq!(rules.phase(t(9, 0)), SessionPhase::Continuous);
+        assert_eq!(rules.phase(t(15, 19)), SessionPhase::Continuous);
+        assert_eq!(rules.phase(t(15, 20)), SessionPhase::ClosingAuction);
+        assert_eq!(rules.phase(t(15, 30)), SessionPhase::Close);
+        assert_eq!(rules.phase(t(15, 40)), SessionPhase::AfterHours);
+    }
+
+    #[test]
+    fn test_price_band_and_tick_size() {
+        let rules = SessionRules::default();
+        assert_eq!(rules.price_band(Some(70_000)), (49_000, 91_000));
+        // 10,150 * 0.7 = 7,105 -> 호가 단위(10원)로 올림, 13,195 -> 내림
+        assert_eq!(rules.price_band(Some(10_150)), (7_110, 13_190));
+        assert_eq!(tick_size(1_999), 1);
+        assert_eq!(tick_size(70_000), 100);
+        assert_eq!(tick_size(500_000), 1_000);
+    }
+
+    #[test]
+    fn test_bars_merged_in_time_order_across_symbols() {
+        let data = vec![
+            series(
+                "A",
+                vec![
+                    bar(at(2, 9, 0), 100, 100, 100, 100),
+                    bar(at(2, 9, 2), 100, 100, 100, 100),
+                ],
+            ),
+            series(
+                "B",
+                vec![
+                    bar(at(2, 9, 1), 200, 200, 200, 200),
+                    bar(at(2, 9, 2), 200, 200, 200, 200),
+                ],
+            ),
+        ];
+        let mut strategy = Scripted::default();
+        let result = IntradayEngine::new(IntradayConfig::default()).run(&data, &mut strategy);
+
+        assert_eq!(
+            strategy.seen,
+            vec![
+                (at(2, 9, 0), 0),
+                (at(2, 9, 1), 1),
+                (at(2, 9, 2), 0),
+                (at(2, 9, 2), 1)
+            ]
+        );
+        assert_eq!(result.stats.bars, 4);
+        assert_eq!(result.stats.days, 1);
+    }
+
+    #[test]
+    fn test_market_order_fills_on_next_bar_with_slippage() {
+        let data = vec![series(
+            "A",
+            vec![
+                bar(at(2, 9, 0), 70_000, 70_500, 69_900, 70_200),
+                bar(at(2, 9, 1), 70_300, 70_600, 70_100, 70_500),
+            ],
+        )];
+        let mut strategy = Scripted {
+            script: vec![(0, at(2, 9, 0), submit(Side::Buy, OrderType::Market, 10))],
+            ..Default::default()
+        };
+        let config = IntradayConfig {
+            commission_rate: 0.0,
+            ..IntradayConfig::default()
+        };
+        let mut engine = IntradayEngine::new(config);
+        let result = engine.run(&data, &mut strategy);
+
+        assert_eq!(strategy.fills.len(), 1);
+        let fill = strategy.fills[0];
+        assert_eq!(fill.timestamp, at(2, 9, 1));
+        assert_eq!(fill.price, 70_400); // 다음 바 시가 + 1호가
+        assert_eq!(result.final_equity, 10_000_000 - 70_400 * 10 + 70_500 * 10);
+    }
+
+    #[test]
+    fn test_limit_order_partial_fills_by_volume() {
+        let bars = (0..3)
+            .map(|m| Bar {
+                volume: 100,
+                ..bar(at(2, 9, m), 10_000, 10_050, 9_950, 10_000)
+            })
+            .collect();
+        let mut strategy = Scripted {
+            script: vec![(
+                0,
+                at(2, 9, 0),
+                submit(Side::Buy, OrderType::Limit(9_990), 25),
+            )],
+            ..Default::default()
+        };
+        let result =
+            IntradayEngine::new(IntradayConfig::default()).run(&[series("A", bars)], &mut strategy);
+
+        // 바당 거래량의 10% (10주)씩 체결
+        let quantities: Vec<i64> = strategy.fills.iter().map(|f| f.quantity).collect();
+        assert_eq!(quantities, vec![10, 10]);
+        assert!(strategy.fills.iter().all(|f| f.price == 9_990));
+        assert_eq!(result.stats.partial_fills, 2);
+        // 남은 5주는 장 마감 시 만료
+        assert_eq!(result.stats.expired, 1);
+    }
+
+    #[test]
+    fn test_closing_auction_fills_at_close_price() {
+        let data = vec![series(
+            "A",
+            vec![
+                bar(at(2, 9, 0), 10_000, 10_000, 10_000, 10_000),
+                bar(at(2, 15, 25), 10_100, 10_100, 10_100, 10_100),
+                bar(at(2, 15, 30), 10_200, 10_200, 10_200, 10_200),
+            ],
+        )];
+        let mut strategy = Scripted {
+            script: vec![
+                (
+                    0,
+                    at(2, 9, 0),
+                    submit(Side::Buy, OrderType::Limit(10_300), 5),
+                ),
+                (0, at(2, 15, 25), submit(Side::Buy, OrderType::Market, 5)),
+            ],
+            ..Default::default()
+        };
+        IntradayEngine::new(IntradayConfig::default()).run(&data, &mut strategy);
+
+        // 단일가 구간 중에는 체결되지 않고 15:30 종가로 일괄 체결 (슬리피지 없음)
+        assert_eq!(strategy.fills.len(), 2);
+        assert!(strategy
+            .fills
+            .iter()
+            .all(|f| f.timestamp == at(2, 15, 30) && f.price == 10_200));
+    }
+
+    #[test]
+    fn test_orders_expire_and_price_limits_apply_next_day() {
+        let data = vec![series(
+            "A",
+            vec![
+                bar(at(2, 9, 0), 10_000, 10_000, 10_000, 10_000),
+                bar(at(3, 9, 0), 10_000, 10_000, 10_000, 10_000),
+                bar(at(3, 9, 1), 10_000, 10_000, 10_000, 10_000),
+            ],
+        )];
+        let mut strategy = Scripted {
+            script: vec![
+                (
+                    0,
+                    at(2, 9, 0),
+                    submit(Side::Buy, OrderType::Limit(9_000), 1),
+                ),
+                // 전일 종가 10,000 기준 하한가 7,000 미만
+                (
+                    0,
+                    at(3, 9, 0),
+                    submit(Side::Buy, OrderType::Limit(6_990), 1),
+                ),
+                // 호가 단위(10원) 위반
+                (
+                    0,
+                    at(3, 9, 0),
+                    submit(Side::Buy, OrderType::Limit(9_995), 1),
+                ),
+                // 공매도 불가
+                (0, at(3, 9, 0), submit(Side::Sell, OrderType::Market, 1)),
+            ],
+            ..Default::default()
+        };
+        let result = IntradayEngine::new(IntradayConfig::default()).run(&data, &mut strategy);
+
+        assert_eq!(result.stats.orders, 1);
+        assert_eq!(result.stats.expired, 1);
+        assert_eq!(result.stats.rejected, 3);
+        assert!(strategy.fills.is_empty());
+    }
+
+    #[test]
+    fn test_opening_range_breakout_round_trip() {
+        let mut bars = vec![
+            bar(at(2, 8, 50), 9_000, 9_000, 9_000, 9_000), // 장 시작 전: 건너뜀
+            bar(at(2, 9, 0), 10_000, 10_100, 9_950, 10_050),
+            bar(at(2, 9, 10), 10_050, 10_300, 10_050, 10_250), // 돌파 -> 매수
+            bar(at(2, 9, 11), 10_250, 10_400, 10_200, 10_350), // 시가 + 1호가 체결
+            bar(at(2, 15, 20), 10_500, 10_500, 10_500, 10_500), // 단일가 매도 주문
+            bar(at(2, 15, 30), 10_600, 10_600, 10_600, 10_600), // 종가 체결
+        ];
+        for b in &mut bars {
+            b.volume = 100_000;
+        }
+        let mut strategy = OpeningRangeBreakout::new(10, 100);
+        let config = IntradayConfig {
+            commission_rate: 0.0,
+            record_fills: true,
+            ..IntradayConfig::default()
+        };
+        let result = IntradayEngine::new(config).run(&[series("A", bars)], &mut strategy);
+
+        let trades: Vec<(Side, i64)> = result.fills.iter().map(|f| (f.side, f.price)).collect();
+        assert_eq!(trades, vec![(Side::Buy, 10_260), (Side::Sell, 10_600)]);
+        assert_eq!(result.final_equity, 10_000_000 + (10_600 - 10_260) * 100);
+        assert_eq!(result.metrics.closed_trades, 1);
+        assert_eq!(result.stats.skipped_bars, 1);
+    }
+
+    #[test]
+    fn test_opening_range_breakout_exits_without_auction_bars() {
+        // 단일가 구간 바가 없는 일반 분봉 데이터, 시가 범위 90분
+        let mut bars = vec![
+            bar(at(2, 9, 0), 10_000, 10_100, 9_950, 10_050),
+            bar(at(2, 10, 30), 10_050, 10_300, 10_050, 10_250), // 돌파 -> 매수
+            bar(at(2, 10, 31), 10_250, 10_400, 10_200, 10_350), // 시가 + 1호가 체결
+            bar(at(2, 15, 19), 10_500, 10_500, 10_500, 10_500), // 마지막 접속매매 바 -> 매도
+        ];
+        for b in &mut bars {
+            b.volume = 100_000;
+        }
+        let mut strategy = OpeningRangeBreakout::new(90, 100);
+        assert_eq!(
+            strategy.range_end,
+            NaiveTime::from_hms_opt(10, 30, 0).unwrap()
+        );
+        let config = IntradayConfig {
+            commission_rate: 0.0,
+            record_fills: true,
+            ..IntradayConfig::default()
+        };
+        let result = IntradayEngine::new(config).run(&[series("A", bars)], &mut strategy);
+
+        // 청산 주문은 장 마감 처리 시 마지막 체결가로 체결
+        let trades: Vec<(Side, i64)> = result.fills.iter().map(|f| (f.side, f.price)).collect();
+        assert_eq!(trades, vec![(Side::Buy, 10_260), (Side::Sell, 10_500)]);
+        assert_eq!(result.metrics.closed_trades, 1);
+        assert_eq!(result.stats.expired, 0);
+    }
+}
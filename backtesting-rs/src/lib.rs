@@ -4,6 +4,9 @@
 
 pub mod data;
 pub mod engine;
+pub mod indicators;
+pub mod intraday;
+pub mod metrics;
 pub mod strategy;
 
 // Python 바인딩 (pyo3 feature 활성화 시)
@@ -17,6 +20,7 @@ use pyo3::prelude::*;
 #[pymodule]
 fn backtesting_rs(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(python::run_backtest, m)?)?;
+    m.add_class::<python::PyStreamingMetrics>()?;
     Ok(())
 }
 
@@ -10,7 +10,9 @@ use tracing::{info, Level};
 use tracing_subscriber::FmtSubscriber;
 
 mod engine;
+mod indicators;
 mod data;
+mod metrics;
 mod strategy;
 
 use engine::BacktestEngine;
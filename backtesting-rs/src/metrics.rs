@@ -0,0 +1,290 @@
+//! 스트리밍 성과 지표 모듈
+//!
+//! 바(bar)마다 한 번씩 갱신되는 단일 패스, 상수 메모리 지표 누산기입니다.
+//! 수익률 벡터나 자산 곡선 전체를 보관하지 않고도 수익률, 변동성, 낙폭,
+//! 승률, 회전율, 익스포저를 계산하므로 긴 백테스트의 실시간 모니터로 쓸 수 있습니다.
+
+use serde::{Deserialize, Serialize};
+
+/// 연환산 기준 거래일 수
+pub const TRADING_DAYS_PER_YEAR: f64 = 252.0;
+
+/// 특정 시점의 지표 스냅샷
+#[derive(Debug, Clone, Default, PartialEq, Serialize, Deserialize)]
+pub struct MetricsSnapshot {
+    /// 처리한 바 수
+    pub bars: usize,
+    /// 최근 자산 가치
+    pub equity: f64,
+    /// 총 수익률 (%)
+    pub total_return: f64,
+    /// 연환산 수익률 (%)
+    pub cagr: f64,
+    /// 연환산 변동성 (%)
+    pub volatility: f64,
+    /// 샤프 비율
+    pub sharpe_ratio: f64,
+    /// 최대 낙폭 (%)
+    pub max_drawdown: f64,
+    /// 현재 낙폭 (%)
+    pub current_drawdown: f64,
+    /// 승률 (%, 청산 거래 기준)
+    pub win_rate: f64,
+    /// 총 체결 횟수 (매수 + 매도)
+    pub total_trades: usize,
+    /// 청산 거래 횟수
+    pub closed_trades: usize,
+    /// 누적 회전율 (체결 금액 / 자산 가치의 합, 배)
+    pub turnover: f64,
+    /// 평균 익스포저 (%)
+    pub exposure: f64,
+}
+
+/// 단일 패스 지표 누산기
+///
+/// 일별 수익률의 평균/분산은 Welford 알고리즘으로 갱신하고,
+/// 낙폭은 고점만 추적하여 계산합니다.
+#[derive(Debug, Clone)]
+pub struct StreamingMetrics {
+    initial_equity: f64,
+    last_equity: f64,
+    peak_equity: f64,
+    max_drawdown: f64,
+    bars: usize,
+    return_count: usize,
+    return_mean: f64,
+    return_m2: f64,
+    trades: usize,
+    closed_trades: usize,
+    winning_trades: usize,
+    turnover: f64,
+    exposure_sum: f64,
+    equity_curve: Option<Vec<f64>>,
+}
+
+impl StreamingMetrics {
+    /// 자산 곡선을 보관하지 않는 누산기 생성
+    pub fn new(initial_equity: f64) -> Self {
+        Self {
+            initial_equity,
+            last_equity: initial_equity,
+            peak_equity: 0.0,
+            max_drawdown: 0.0,
+            bars: 0,
+            return_count: 0,
+            return_mean: 0.0,
+            return_m2: 0.0,
+            trades: 0,
+            closed_trades: 0,
+            winning_trades: 0,
+            turnover: 0.0,
+            exposure_sum: 0.0,
+            equity_curve: None,
+        }
+    }
+
+    /// 자산 곡선을 함께 기록하는 누산기 생성
+    pub fn with_equity_curve(initial_equity: f64, capacity: usize) -> Self {
+        let mut metrics = Self::new(initial_equity);
+        metrics.equity_curve = Some(Vec::with_capacity(capacity));
+        metrics
+    }
+
+    /// 바 하나를 반영합니다.
+    ///
+    /// `equity`는 바 종료 시점의 총 자산, `exposure`는 보유 포지션의 시장 가치입니다.
+    pub fn update(&mut self, equity: f64, exposure: f64) {
+        if self.bars > 0 && self.last_equity != 0.0 {
+            let ret = (equity - self.last_equity) / self.last_equity;
+            self.return_count += 1;
+            let delta = ret - self.return_mean;
+            self.return_mean += delta / self.return_count as f64;
+            self.return_m2 += delta * (ret - self.return_mean);
+        }
+
+        if equity > self.peak_equity {
+            self.peak_equity = equity;
+        }
+        if self.peak_equity > 0.0 {
+            let dd = (self.peak_equity - equity) / self.peak_equity;
+            if dd > self.max_drawdown {
+                self.max_drawdown = dd;
+            }
+        }
+
+        if equity != 0.0 {
+            self.exposure_sum += exposure / equity;
+        }
+
+        if let Some(curve) = self.equity_curve.as_mut() {
+            curve.push(equity);
+        }
+
+        self.last_equity = equity;
+        self.bars += 1;
+    }
+
+    /// 체결 한 건을 반영합니다. `notional`은 체결 금액입니다.
+    pub fn record_fill(&mut self, notional: f64) {
+        self.trades += 1;
+        if self.last_equity != 0.0 {
+            self.turnover += notional.abs() / self.last_equity;
+        }
+    }
+
+    /// 포지션 청산 한 건의 손익을 반영합니다.
+    pub fn record_close(&mut self, pnl: f64) {
+        self.closed_trades += 1;
+        if pnl > 0.0 {
+            self.winning_trades += 1;
+        }
+    }
+
+    /// 처리한 바 수
+    pub fn bars(&self) -> usize {
+        self.bars
+    }
+
+    /// 기록된 자산 곡선 (기록하지 않는 경우 None)
+    pub fn equity_curve(&self) -> Option<&[f64]> {
+        self.equity_curve.as_deref()
+    }
+
+    /// 기록된 자산 곡선을 꺼냅니다. 기록하지 않았다면 빈 벡터를 반환합니다.
+    pub fn take_equity_curve(&mut self) -> Vec<f64> {
+        match self.equity_curve.as_mut() {
+            Some(curve) => std::mem::take(curve),
+            None => Vec::new(),
+        }
+    }
+
+    /// 현재까지의 지표를 계산합니다. O(1)
+    pub fn snapshot(&self) -> MetricsSnapshot {
+        let equity = if self.bars > 0 {
+            self.last_equity
+        } else {
+            self.initial_equity
+        };
+
+        let growth = if self.initial_equity != 0.0 {
+            equity / self.initial_equity
+        } else {
+            1.0
+        };
+
+        let years = self.bars as f64 / TRADING_DAYS_PER_YEAR;
+        let cagr = if years > 0.0 && growth > 0.0 {
+            growth.powf(1.0 / years) - 1.0
+        } else {
+            0.0
+        };
+
+        // 모분산 기준 (기존 엔진 계산과 동일)
+        let std_dev = if self.return_count > 0 {
+            (self.return_m2 / self.return_count as f64).sqrt()
+        } else {
+            0.0
+        };
+        let annualizer = TRADING_DAYS_PER_YEAR.sqrt();
+        let sharpe_ratio = if self.return_count >= 1 && std_dev > 0.0 {
+            (self.return_mean / std_dev) * annualizer
+        } else {
+            0.0
+        };
+
+        let current_drawdown = if self.peak_equity > 0.0 {
+            (self.peak_equity - equity).max(0.0) / self.peak_equity
+        } else {
+            0.0
+        };
+
+        let win_rate = if self.closed_trades > 0 {
+            self.winning_trades as f64 / self.closed_trades as f64 * 100.0
+        } else {
+            0.0
+        };
+
+        let exposure = if self.bars > 0 {
+            self.exposure_sum / self.bars as f64 * 100.0
+        } else {
+            0.0
+        };
+
+        MetricsSnapshot {
+            bars: self.bars,
+            equity,
+            total_return: (growth - 1.0) * 100.0,
+            cagr: cagr * 100.0,
+            volatility: std_dev * annualizer * 100.0,
+            sharpe_ratio,
+            max_drawdown: self.max_drawdown * 100.0,
+            current_drawdown: current_drawdown * 100.0,
+            win_rate,
+            total_trades: self.trades,
+            closed_trades: self.closed_trades,
+            turnover: self.turnover,
+            exposure,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn approx(a: f64, b: f64) -> bool {
+        (a - b).abs() < 1e-9
+    }
+
+    #[test]
+    fn test_matches_batch_calculation() {
+        let equities = [100.0, 102.0, 99.0, 105.0, 104.0, 110.0];
+        let mut metrics = StreamingMetrics::new(100.0);
+        for equity in equities {
+            metrics.update(equity, 0.0);
+        }
+        let snapshot = metrics.snapshot();
+
+        let returns: Vec<f64> = equities.windows(2).map(|w| (w[1] - w[0]) / w[0]).collect();
+        let mean = returns.iter().sum::<f64>() / returns.len() as f64;
+        let variance =
+            returns.iter().map(|r| (r - mean).powi(2)).sum::<f64>() / returns.len() as f64;
+        let sharpe = mean / variance.sqrt() * TRADING_DAYS_PER_YEAR.sqrt();
+
+        assert!(approx(snapshot.sharpe_ratio, sharpe));
+        assert!(approx(snapshot.total_return, 10.0));
+        assert!(approx(snapshot.max_drawdown, (102.0 - 99.0) / 102.0 * 100.0));
+        assert_eq!(snapshot.bars, 6);
+    }
+
+    #[test]
+    fn test_trades_turnover_and_exposure() {
+        let mut metrics = StreamingMetrics::new(1000.0);
+        metrics.update(1000.0, 0.0);
+        metrics.record_fill(500.0);
+        metrics.update(1000.0, 500.0);
+        metrics.record_fill(500.0);
+        metrics.record_close(20.0);
+        metrics.update(1020.0, 0.0);
+
+        let snapshot = metrics.snapshot();
+        assert_eq!(snapshot.total_trades, 2);
+        assert_eq!(snapshot.closed_trades, 1);
+        assert!(approx(snapshot.win_rate, 100.0));
+        assert!(approx(snapshot.turnover, 1.0));
+        assert!(approx(snapshot.exposure, 50.0 / 3.0));
+    }
+
+    #[test]
+    fn test_equity_curve_only_when_requested() {
+        let mut metrics = StreamingMetrics::new(100.0);
+        metrics.update(101.0, 0.0);
+        assert!(metrics.equity_curve().is_none());
+        assert!(metrics.take_equity_curve().is_empty());
+
+        let mut recorded = StreamingMetrics::with_equity_curve(100.0, 2);
+        recorded.update(101.0, 0.0);
+        recorded.update(99.0, 0.0);
+        assert_eq!(recorded.equity_curve(), Some(&[101.0, 99.0][..]));
+    }
+}
@@ -0,0 +1,130 @@
+//! Python 바인딩 모듈
+
+use pyo3::exceptions::{PyIOError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+use rust_decimal::Decimal;
+
+use crate::data::DataLoader;
+use crate::engine::{BacktestConfig, BacktestEngine, BacktestResult};
+use crate::metrics::{MetricsSnapshot, StreamingMetrics};
+use crate::strategy::{MeanReversion, Momentum, SmaCrossover};
+
+/// CSV 데이터로 백테스트를 실행하고 결과를 dict로 반환합니다.
+#[pyfunction]
+#[pyo3(signature = (data_path, strategy = "momentum", initial_capital = 10_000_000, record_equity_curve = false))]
+pub fn run_backtest(
+    py: Python<'_>,
+    data_path: &str,
+    strategy: &str,
+    initial_capital: i64,
+    record_equity_curve: bool,
+) -> PyResult<PyObject> {
+    let data = DataLoader::load_csv(data_path).map_err(|e| PyIOError::new_err(e.to_string()))?;
+    let config = BacktestConfig {
+        initial_capital: Decimal::from(initial_capital),
+        record_equity_curve,
+        ..BacktestConfig::default()
+    };
+    let mut engine = BacktestEngine::new(config);
+
+    let result = match strategy {
+        "momentum" => engine.run(&data, &Momentum::new(20, 0.05)),
+        "sma" => engine.run(&data, &SmaCrossover::new(5, 20)),
+        "mean_reversion" => engine.run(&data, &MeanReversion::new(20, 2.0)),
+        other => return Err(PyValueError::new_err(format!("알 수 없는 전략: {other}"))),
+    };
+
+    result_to_dict(py, &result)
+}
+
+fn result_to_dict(py: Python<'_>, result: &BacktestResult) -> PyResult<PyObject> {
+    let dict = PyDict::new(py);
+    dict.set_item("total_return", result.total_return)?;
+    dict.set_item("cagr", result.cagr)?;
+    dict.set_item("sharpe_ratio", result.sharpe_ratio)?;
+    dict.set_item("max_drawdown", result.max_drawdown)?;
+    dict.set_item("win_rate", result.win_rate)?;
+    dict.set_item("trade_count", result.total_trades)?;
+    dict.set_item("equity_curve", result.equity_curve.clone())?;
+    Ok(dict.into())
+}
+
+fn snapshot_to_dict(py: Python<'_>, snapshot: &MetricsSnapshot) -> PyResult<PyObject> {
+    let dict = PyDict::new(py);
+    dict.set_item("bars", snapshot.bars)?;
+    dict.set_item("equity", snapshot.equity)?;
+    dict.set_item("total_return", snapshot.total_return)?;
+    dict.set_item("cagr", snapshot.cagr)?;
+    dict.set_item("volatility", snapshot.volatility)?;
+    dict.set_item("sharpe_ratio", snapshot.sharpe_ratio)?;
+    dict.set_item("max_drawdown", snapshot.max_drawdown)?;
+    dict.set_item("current_drawdown", snapshot.current_drawdown)?;
+    dict.set_item("win_rate", snapshot.win_rate)?;
+    dict.set_item("trade_count", snapshot.total_trades)?;
+    dict.set_item("closed_trades", snapshot.closed_trades)?;
+    dict.set_item("turnover", snapshot.turnover)?;
+    dict.set_item("exposure", snapshot.exposure)?;
+    Ok(dict.into())
+}
+
+/// 스트리밍 지표 누산기 (Python용)
+///
+/// ```python
+/// from backtesting_rs import StreamingMetrics
+///
+/// metrics = StreamingMetrics(10_000_000)
+/// for equity, exposure in bars:
+///     metrics.update(equity, exposure)
+/// print(metrics.snapshot()["sharpe_ratio"])
+/// ```
+#[pyclass(name = "StreamingMetrics")]
+pub struct PyStreamingMetrics {
+    inner: StreamingMetrics,
+}
+
+#[pymethods]
+impl PyStreamingMetrics {
+    #[new]
+    #[pyo3(signature = (initial_equity, record_equity_curve = false))]
+    fn new(initial_equity: f64, record_equity_curve: bool) -> Self {
+        let inner = if record_equity_curve {
+            StreamingMetrics::with_equity_curve(initial_equity, 0)
+        } else {
+            StreamingMetrics::new(initial_equity)
+        };
+        Self { inner }
+    }
+
+    /// 바 하나를 반영합니다.
+    #[pyo3(signature = (equity, exposure = 0.0))]
+    fn update(&mut self, equity: f64, exposure: f64) {
+        self.inner.update(equity, exposure);
+    }
+
+    /// 체결 한 건을 반영합니다.
+    fn record_fill(&mut self, notional: f64) {
+        self.inner.record_fill(notional);
+    }
+
+    /// 청산 거래 한 건의 손익을 반영합니다.
+    fn record_close(&mut self, pnl: f64) {
+        self.inner.record_close(pnl);
+    }
+
+    /// 현재 지표 스냅샷을 dict로 반환합니다.
+    fn snapshot(&self, py: Python<'_>) -> PyResult<PyObject> {
+        snapshot_to_dict(py, &self.inner.snapshot())
+    }
+
+    /// 기록된 자산 곡선 (기록하지 않는 경우 None)
+    #[getter]
+    fn equity_curve(&self) -> Option<Vec<f64>> {
+        self.inner.equity_curve().map(|curve| curve.to_vec())
+    }
+
+    #[getter]
+    fn bars(&self) -> usize {
+        self.inner.bars()
+    }
+}
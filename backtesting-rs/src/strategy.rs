@@ -1,6 +1,8 @@
 //! 트레이딩 전략 모듈
 
 use crate::data::Candle;
+use crate::indicators::IndicatorCache;
+use rust_decimal::prelude::ToPrimitive;
 use rust_decimal::Decimal;
 
 /// 매매 시그널
@@ -15,6 +17,18 @@ pub enum Signal {
 pub trait Strategy: Send + Sync {
     /// 캔들 데이터를 기반으로 매매 시그널 생성
     fn generate_signal(&self, candles: &[Candle]) -> Signal;
+
+    /// `i`번째 캔들 시점의 매매 시그널 (지표 캐시 사용)
+    ///
+    /// `cache`는 `candles` 전체로 만든 캐시입니다. 기본 구현은 `generate_signal`을
+    /// 호출하며, 이동평균/표준편차를 쓰는 전략은 캐시를 조회하도록 재정의합니다.
+    ///
+    /// 캐시는 f64 누적합으로 계산하므로 재정의한 구현은 Decimal로 계산하는
+    /// `generate_signal`의 근사입니다. 비교하는 두 값이 거의 같은 경계(이동평균 동률,
+    /// 종가가 밴드 위에 걸친 경우)에서는 반올림 차이로 결과가 다를 수 있습니다.
+    fn signal_at(&self, candles: &[Candle], _cache: &IndicatorCache, i: usize) -> Signal {
+        self.generate_signal(&candles[..=i])
+    }
     
     /// 전략 이름
     fn name(&self) -> &str;
@@ -80,6 +94,30 @@ impl Strategy for SmaCrossover {
         }
     }
 
+    fn signal_at(&self, _candles: &[Candle], cache: &IndicatorCache, i: usize) -> Signal {
+        if i < self.long_period {
+            return Signal::Hold;
+        }
+
+        match (
+            cache.sma(i, self.short_period),
+            cache.sma(i, self.long_period),
+            cache.sma(i - 1, self.short_period),
+            cache.sma(i - 1, self.long_period),
+        ) {
+            (Some(cs), Some(cl), Some(ps), Some(pl)) => {
+                if ps <= pl && cs > cl {
+                    return Signal::Buy;
+                }
+                if ps >= pl && cs < cl {
+                    return Signal::Sell;
+                }
+                Signal::Hold
+            }
+            _ => Signal::Hold,
+        }
+    }
+
     fn name(&self) -> &str {
         "SMA Crossover"
     }
@@ -190,6 +228,21 @@ impl Strategy for MeanReversion {
         Signal::Hold
     }
 
+    fn signal_at(&self, _candles: &[Candle], cache: &IndicatorCache, i: usize) -> Signal {
+        let k = self.std_dev_multiplier.to_f64().unwrap_or(0.0);
+        if let Some((lower, _sma, upper)) = cache.bollinger(i, self.period, k) {
+            let current_price = cache.close(i);
+            if current_price < lower {
+                return Signal::Buy; // 과매도
+            }
+            if current_price > upper {
+                return Signal::Sell; // 과매수
+            }
+        }
+
+        Signal::Hold
+    }
+
     fn name(&self) -> &str {
         "Mean Reversion"
     }
@@ -235,5 +288,68 @@ mod tests {
         // 실제 수익률에 따라 달라질 수 있음
         assert!(signal == Signal::Buy || signal == Signal::Hold);
     }
+
+    /// f64 근사로는 Decimal 비교 결과를 보장할 수 없을 만큼 두 값이 가까운지 여부
+    fn near_tie(a: Option<f64>, b: Option<f64>) -> bool {
+        matches!((a, b), (Some(a), Some(b)) if (a - b).abs() <= 1e-6 * a.abs().max(1.0))
+    }
+
+    #[test]
+    fn test_signal_at_matches_generate_signal() {
+        // 교차와 밴드 이탈이 여러 번 나오는 소수점 가격 (단위: 0.01)
+        let cents: Vec<i64> = (0..200)
+            .map(|i| 1_000_000 + ((i * 53) % 97) * 2_017 - ((i / 25) % 2) * 90_013)
+            .collect();
+        let candles = create_test_candles_long(&cents);
+        let cache = IndicatorCache::new(&candles);
+
+        let sma = SmaCrossover::new(5, 20);
+        let bands = MeanReversion::new(20, 1.5);
+        let (mut signals, mut compared) = (0, 0);
+        for i in 0..candles.len() {
+            // signal_at은 f64 근사이므로 동률에 가까운 시점은 비교하지 않음
+            let sma_tie = i >= sma.long_period
+                && (near_tie(cache.sma(i, 5), cache.sma(i, 20))
+                    || near_tie(cache.sma(i - 1, 5), cache.sma(i - 1, 20)));
+            let band_tie = cache
+                .bollinger(i, 20, 1.5)
+                .is_some_and(|(lower, _, upper)| {
+                    let close = Some(cache.close(i));
+                    near_tie(close, Some(lower)) || near_tie(close, Some(upper))
+                });
+
+            let expected = sma.generate_signal(&candles[..=i]);
+            if !sma_tie {
+                assert_eq!(sma.signal_at(&candles, &cache, i), expected);
+                signals += (expected != Signal::Hold) as usize;
+            }
+            if !band_tie {
+                assert_eq!(
+                    bands.signal_at(&candles, &cache, i),
+                    bands.generate_signal(&candles[..=i])
+                );
+            }
+            compared += (!sma_tie && !band_tie) as usize;
+        }
+        assert!(signals > 0);
+        assert!(compared > candles.len() * 9 / 10);
+    }
+
+    /// 0.01 단위 가격으로 캔들 생성
+    fn create_test_candles_long(cents: &[i64]) -> Vec<Candle> {
+        let start = NaiveDate::from_ymd_opt(2024, 1, 1).unwrap();
+        cents
+            .iter()
+            .enumerate()
+            .map(|(i, &price)| Candle {
+                date: start + chrono::Duration::days(i as i64),
+                open: Decimal::new(price, 2),
+                high: Decimal::new(price + 100, 2),
+                low: Decimal::new(price - 100, 2),
+                close: Decimal::new(price, 2),
+                volume: 1000000,
+            })
+            .collect()
+    }
 }
 
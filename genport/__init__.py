@@ -1,8 +1,31 @@
 # 젠포트 연동 모듈
-from .browser import GenportBrowser
-from .backtest import GenportBacktest
-from .models import BacktestParams, BacktestResult
-from .parser import GenportResultParser
+#
+# Playwright 등 무거운 의존성을 불러오는 모듈은 실제로 접근할 때 로드합니다 (PEP 562).
+# BacktestParams나 파서만 필요한 짧은 작업은 브라우저 모듈을 불러오지 않습니다.
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .backtest import GenportBacktest
+    from .browser import GenportBrowser
+    from .models import BacktestParams, BacktestResult
+    from .optimize import SuccessiveHalving, SurrogateSearch
+    from .parser import GenportResultParser
+    from .sweep import GenportRunner, LocalEngineRunner, SweepOrchestrator
+
+_LAZY_ATTRS = {
+    "GenportBrowser": ".browser",
+    "GenportBacktest": ".backtest",
+    "GenportResultParser": ".parser",
+    "BacktestParams": ".models",
+    "BacktestResult": ".models",
+    "SweepOrchestrator": ".sweep",
+    "GenportRunner": ".sweep",
+    "LocalEngineRunner": ".sweep",
+    "SuccessiveHalving": ".optimize",
+    "SurrogateSearch": ".optimize",
+}
 
 __all__ = [
     "GenportBrowser",
@@ -10,5 +33,11 @@ __all__ = [
     "GenportResultParser",
     "BacktestParams",
     "BacktestResult",
+    "SweepOrchestrator",
+    "GenportRunner",
+    "LocalEngineRunner",
+    "SuccessiveHalving",
+    "SurrogateSearch",
 ]
 
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRS)
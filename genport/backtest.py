@@ -1,22 +1,53 @@
 """젠포트 백테스트 자동화 모듈."""
 
-from typing import Any
+import asyncio
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from src.utils.tracing import trace_context, tracer
 
-from .browser import GenportBrowser
 from .models import BacktestParams, BacktestResult
 from .parser import GenportResultParser
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Response
+
+    from .browser import GenportBrowser
+
+# 결과 대기 타임아웃 (5분)
+RESULT_TIMEOUT_MS = 300000
+
 
 class GenportBacktest:
     """젠포트 백테스트 실행기."""
 
-    def __init__(self, browser: GenportBrowser):
+    # 백테스트 결과를 반환하는 XHR/fetch 요청 URL 패턴
+    RESULT_URL_PATTERN = r"/api/.*backtest"
+
+    def __init__(
+        self,
+        browser: "GenportBrowser",
+        capture_network: bool = False,
+        result_url_pattern: str | None = None,
+        payload_predicate: Callable[[Any], bool] | None = None,
+    ):
         """
         Args:
             browser: 젠포트 브라우저 인스턴스.
+            capture_network: True면 결과 API 응답을 가로채 화면 렌더링을 기다리지 않고
+                결과를 읽습니다. 파싱되는 응답을 받기 전에 화면이 렌더링되면 DOM 결과를
+                사용합니다.
+            result_url_pattern: 결과 응답 URL 정규식. None이면 RESULT_URL_PATTERN 사용.
+            payload_predicate: 결과 응답 JSON인지 판별하는 함수. 거부된 응답(진행 상태
+                폴링 등)은 건너뛰고 다음 응답을 기다립니다. None이면 파싱 성공 여부로
+                판별합니다.
         """
         self.browser = browser
         self.parser = GenportResultParser()
+        self.capture_network = capture_network
+        self._result_url = re.compile(result_url_pattern or self.RESULT_URL_PATTERN)
+        self.payload_predicate = payload_predicate
 
     async def run(
         self,
@@ -34,21 +65,106 @@ class GenportBacktest:
         """
         page = self.browser.page
 
-        # 전략 페이지로 이동
-        await self.browser.navigate_to_strategy(strategy_id)
-
-        # 백테스트 파라미터 설정
-        await self._set_parameters(params)
-
-        # 백테스트 실행
-        await page.click('button:has-text("백테스트 실행")')
-
-        # 결과 대기 (최대 5분)
-        await page.wait_for_selector(".backtest-result", timeout=300000)
+        with trace_context(strategy_id=strategy_id), tracer.span("genport.run"):
+            # 전략 페이지로 이동
+            with tracer.span("genport.navigate"):
+                await self.browser.navigate_to_strategy(strategy_id)
+
+            # 백테스트 파라미터 설정
+            with tracer.span("genport.fill"):
+                await self._set_parameters(params)
+
+            if self.capture_network:
+                return await self._run_with_network_capture(page)
+
+            # 백테스트 실행
+            with tracer.span("genport.click"):
+                await page.click('button:has-text("백테스트 실행")')
+
+            # 결과 대기 (최대 5분)
+            with tracer.span("genport.wait"):
+                await page.wait_for_selector(".backtest-result", timeout=RESULT_TIMEOUT_MS)
+
+            return await self._read_dom_result(page)
+
+    async def _read_dom_result(self, page: "Page") -> BacktestResult:
+        """렌더링된 결과 영역을 파싱합니다."""
+        with tracer.span("genport.inner_html"):
+            result_html = await page.inner_html(".backtest-result")
+        with tracer.span("genport.parse"):
+            return self.parser.parse(result_html)
+
+    def _is_result_response(self, response: "Response") -> bool:
+        """백테스트 결과 API 응답인지 확인합니다."""
+        return (
+            response.request.resource_type in ("xhr", "fetch")
+            and response.ok
+            and self._result_url.search(response.url) is not None
+        )
+
+    async def _read_network_result(self, response: "Response") -> BacktestResult | None:
+        """결과 API 응답을 파싱합니다. 결과가 아닌 응답이면 None."""
+        try:
+            payload = await response.json()
+            if self.payload_predicate is not None and not self.payload_predicate(payload):
+                return None
+            with tracer.span("genport.parse"):
+                return self.parser.parse_payload(payload)
+        except Exception:
+            # 진행 상태 폴링처럼 형식이 다른 응답은 건너뜀
+            return None
+
+    async def _run_with_network_capture(self, page: "Page") -> BacktestResult:
+        """결과 API 응답과 DOM 렌더링 중 먼저 오는 쪽으로 결과를 읽습니다."""
+        captured: asyncio.Future[BacktestResult] = asyncio.get_running_loop().create_future()
+        reading: set[asyncio.Task[None]] = set()
+
+        async def inspect(response: "Response") -> None:
+            result = await self._read_network_result(response)
+            if result is None:
+                tracer.count("genport.network_skip")
+            elif not captured.done():
+                captured.set_result(result)
+
+        def on_response(response: "Response") -> None:
+            if not captured.done() and self._is_result_response(response):
+                task = asyncio.ensure_future(inspect(response))
+                reading.add(task)
+                task.add_done_callback(reading.discard)
+
+        # 클릭 전에 리스너를 등록해야 빠른 응답을 놓치지 않음
+        page.on("response", on_response)
+        dom_ready: asyncio.Task[Any] | None = None
+        try:
+            with tracer.span("genport.click"):
+                await page.click('button:has-text("백테스트 실행")')
+
+            with tracer.span("genport.wait") as span:
+                dom_ready = asyncio.ensure_future(
+                    page.wait_for_selector(".backtest-result", timeout=RESULT_TIMEOUT_MS)
+                )
+                done, _ = await asyncio.wait(
+                    {captured, dom_ready}, return_when=asyncio.FIRST_COMPLETED
+                )
 
-        # 결과 파싱
-        result_html = await page.inner_html(".backtest-result")
-        return self.parser.parse(result_html)
+                if captured in done:
+                    span.set(source="network")
+                    return captured.result()
+
+                # 결과 응답을 파싱하기 전에 화면이 먼저 렌더링됨
+                tracer.count("genport.network_fallback")
+                span.set(source="dom")
+                await dom_ready
+
+            return await self._read_dom_result(page)
+        finally:
+            page.remove_listener("response", on_response)
+            if not captured.done():
+                captured.cancel()
+            for task in reading:
+                task.cancel()
+            if dom_ready is not None and not dom_ready.done():
+                dom_ready.cancel()
 
     async def _set_parameters(self, params: BacktestParams) -> None:
         """백테스트 파라미터를 설정합니다."""
@@ -67,6 +183,10 @@ class GenportBacktest:
         # 최대 보유 종목 수
         await page.fill('input[name="maxHoldings"]', str(params.max_holdings))
 
+        # 전략별 파라미터 (입력 필드 name 기준)
+        for name, value in params.strategy_params.items():
+            await page.fill(f'input[name="{name}"]', str(value))
+
     async def run_parameter_sweep(
         self,
         strategy_id: str,
@@ -96,6 +216,7 @@ class GenportBacktest:
                     commission_rate=base_params.commission_rate,
                     slippage=base_params.slippage,
                     max_holdings=base_params.max_holdings,
+                    strategy_params=dict(base_params.strategy_params),
                 )
                 setattr(params, param_name, value)
 
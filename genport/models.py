@@ -1,6 +1,6 @@
 """젠포트 데이터 모델."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
@@ -15,6 +15,8 @@ class BacktestParams:
     commission_rate: float = 0.00015  # 수수료율 (0.015%)
     slippage: float = 0.001  # 슬리피지 (0.1%)
     max_holdings: int = 10  # 최대 보유 종목 수
+    # 전략별 파라미터 (입력 필드 name → 값)
+    strategy_params: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -0,0 +1,343 @@
+"""적응형 파라미터 탐색 모듈.
+
+젠포트 백테스트 1회는 수 분이 걸리므로 그리드 전체를 돌리는 대신
+적은 실행 횟수로 좋은 설정을 찾습니다.
+
+- SuccessiveHalving: 짧은 기간(최근 구간)으로 많은 후보를 먼저 평가하고
+  상위 후보만 점점 긴 기간으로 다시 평가합니다.
+- SurrogateSearch: 지금까지의 결과로 가우시안 프로세스 대리 모델을 학습하고,
+  기대 개선량(Expected Improvement)이 가장 큰 후보를 다음에 실행합니다.
+
+두 방식 모두 총 실행 횟수 예산(max_runs)을 넘지 않으며,
+`GenportBacktest.run` 또는 로컬 엔진 러너의 `run`을 그대로 사용합니다.
+
+Example:
+    ```python
+    backtest = GenportBacktest(browser)
+    search = SuccessiveHalving(
+        backtest.run,
+        "12345",
+        base_params,
+        space={"max_holdings": [5, 10, 15, 20], "rebalance_days": [5, 10, 20]},
+        max_runs=20,
+    )
+    best = await search.run()
+    ```
+"""
+
+import itertools
+import math
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, fields, replace
+from datetime import timedelta
+from typing import Any
+
+import numpy as np
+
+from .models import BacktestParams, BacktestResult
+
+BacktestFn = Callable[[str, BacktestParams], Awaitable[BacktestResult]]
+Objective = str | Callable[[BacktestResult], float]
+
+_PARAM_FIELDS = {f.name for f in fields(BacktestParams)} - {"strategy_params"}
+
+
+@dataclass
+class Trial:
+    """실행 1회 기록."""
+
+    overrides: dict[str, Any]
+    params: BacktestParams
+    fidelity: float  # 전체 기간 대비 사용한 기간 비율
+    score: float
+    result: BacktestResult | None = None
+    error: str | None = None
+
+
+@dataclass
+class OptimizationResult:
+    """탐색 결과."""
+
+    best_overrides: dict[str, Any]
+    best_params: BacktestParams
+    best_score: float
+    best_result: BacktestResult | None
+    trials: list[Trial] = field(default_factory=list)
+
+    @property
+    def runs(self) -> int:
+        """사용한 백테스트 실행 횟수."""
+        return len(self.trials)
+
+
+def apply_overrides(base_params: BacktestParams, overrides: dict[str, Any]) -> BacktestParams:
+    """BacktestParams 필드는 그대로, 나머지는 전략 파라미터로 적용합니다."""
+    param_values = {k: v for k, v in overrides.items() if k in _PARAM_FIELDS}
+    strategy_values = {k: v for k, v in overrides.items() if k not in _PARAM_FIELDS}
+    return replace(
+        base_params,
+        **param_values,
+        strategy_params={**base_params.strategy_params, **strategy_values},
+    )
+
+
+def shorten_period(params: BacktestParams, fraction: float) -> BacktestParams:
+    """백테스트 기간을 최근 `fraction` 비율 구간으로 줄입니다."""
+    if fraction >= 1.0:
+        return params
+    total_days = (params.end_date - params.start_date).days
+    days = max(1, round(total_days * fraction))
+    return replace(params, start_date=params.end_date - timedelta(days=days))
+
+
+class _BudgetedSearch:
+    """예산 안에서 백테스트를 실행하고 기록하는 공통 기반."""
+
+    def __init__(
+        self,
+        backtest: BacktestFn,
+        strategy_id: str,
+        base_params: BacktestParams,
+        space: dict[str, list[Any]],
+        objective: Objective = "sharpe_ratio",
+        max_runs: int = 30,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            backtest: (전략 ID, 파라미터)로 백테스트를 실행하는 코루틴 함수.
+                예: GenportBacktest(browser).run
+            strategy_id: 젠포트 전략 ID.
+            base_params: 기본 파라미터.
+            space: 후보 값 목록. BacktestParams 필드가 아닌 키는 전략 파라미터로 전달됩니다.
+            objective: 최대화할 BacktestResult 필드명 또는 점수 함수.
+            max_runs: 총 백테스트 실행 횟수 상한.
+            seed: 후보 샘플링 시드.
+        """
+        if not space or any(not values for values in space.values()):
+            raise ValueError("탐색 공간이 비어있습니다")
+        if max_runs < 1:
+            raise ValueError("max_runs는 1 이상이어야 합니다")
+
+        self.backtest = backtest
+        self.strategy_id = strategy_id
+        self.base_params = base_params
+        self.space = space
+        self.objective = objective
+        self.max_runs = max_runs
+        self.trials: list[Trial] = []
+        self._random = random.Random(seed)
+        self._names = list(space)
+
+    @property
+    def space_size(self) -> int:
+        return math.prod(len(values) for values in self.space.values())
+
+    @property
+    def runs_left(self) -> int:
+        return self.max_runs - len(self.trials)
+
+    def _score(self, result: BacktestResult) -> float:
+        if callable(self.objective):
+            return float(self.objective(result))
+        return float(getattr(result, self.objective))
+
+    def _sample(self, n: int) -> list[tuple[int, ...]]:
+        """서로 다른 후보 n개를 인덱스 튜플로 샘플링합니다."""
+        sizes = [len(self.space[name]) for name in self._names]
+        if n >= self.space_size:
+            return list(itertools.product(*(range(size) for size in sizes)))
+        chosen: set[tuple[int, ...]] = set()
+        while len(chosen) < n:
+            chosen.add(tuple(self._random.randrange(size) for size in sizes))
+        return sorted(chosen)
+
+    def _overrides(self, candidate: tuple[int, ...]) -> dict[str, Any]:
+        return {name: self.space[name][i] for name, i in zip(self._names, candidate, strict=True)}
+
+    async def _evaluate(self, candidate: tuple[int, ...], fidelity: float = 1.0) -> Trial:
+        overrides = self._overrides(candidate)
+        params = shorten_period(apply_overrides(self.base_params, overrides), fidelity)
+        try:
+            result = await self.backtest(self.strategy_id, params)
+            trial = Trial(overrides, params, fidelity, self._score(result), result)
+        except Exception as e:
+            trial = Trial(overrides, params, fidelity, float("-inf"), error=str(e))
+        self.trials.append(trial)
+        return trial
+
+    def _result(self) -> OptimizationResult:
+        full = [t for t in self.trials if t.fidelity >= 1.0] or self.trials
+        best = max(full, key=lambda t: t.score)
+        return OptimizationResult(
+            best_overrides=best.overrides,
+            best_params=apply_overrides(self.base_params, best.overrides),
+            best_score=best.score,
+            best_result=best.result,
+            trials=list(self.trials),
+        )
+
+
+class SuccessiveHalving(_BudgetedSearch):
+    """연속 절반 제거(successive halving) 탐색.
+
+    첫 단계에서 `min_fraction` 길이의 최근 구간으로 후보를 평가하고,
+    단계마다 상위 1/eta만 남기며 기간을 eta배씩 늘려 마지막 단계는 전체 기간으로 평가합니다.
+    """
+
+    def __init__(
+        self,
+        backtest: BacktestFn,
+        strategy_id: str,
+        base_params: BacktestParams,
+        space: dict[str, list[Any]],
+        objective: Objective = "sharpe_ratio",
+        max_runs: int = 30,
+        eta: int = 3,
+        min_fraction: float = 1 / 9,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            eta: 단계별 후보 축소 비율.
+            min_fraction: 첫 단계에서 사용할 기간 비율 (0~1].
+            그 외 인자는 _BudgetedSearch 참고.
+        """
+        super().__init__(backtest, strategy_id, base_params, space, objective, max_runs, seed)
+        if eta < 2:
+            raise ValueError("eta는 2 이상이어야 합니다")
+        if not 0 < min_fraction <= 1:
+            raise ValueError("min_fraction은 (0, 1] 범위여야 합니다")
+        self.eta = eta
+        self.min_fraction = min_fraction
+
+    def _fidelities(self) -> list[float]:
+        rungs = max(0, math.ceil(math.log(1 / self.min_fraction, self.eta) - 1e-9))
+        return [min(1.0, self.min_fraction * self.eta**r) for r in range(rungs + 1)]
+
+    def _rungs(self) -> list[float]:
+        """예산 안에서 사용할 단계별 기간 비율. 예산이 단계 수보다 적으면 앞쪽 단계를 생략합니다."""
+        fidelities = self._fidelities()
+        return fidelities[max(0, len(fidelities) - self.max_runs) :]
+
+    def _plan(self, n: int, rungs: int) -> list[int]:
+        """초기 후보 n개일 때 단계별 평가 후보 수."""
+        return [max(1, n // self.eta**r) for r in range(rungs)]
+
+    def initial_candidates(self) -> int:
+        """예산 안에서 평가할 수 있는 최대 초기 후보 수."""
+        rungs = len(self._rungs())
+        n = min(self.space_size, self.max_runs)
+        while n > 1 and sum(self._plan(n, rungs)) > self.max_runs:
+            n -= 1
+        return n
+
+    async def run(self) -> OptimizationResult:
+        """탐색을 실행합니다."""
+        fidelities = self._rungs()
+        plan = self._plan(self.initial_candidates(), len(fidelities))
+
+        candidates = self._sample(plan[0])
+        for fidelity, keep in zip(fidelities, plan, strict=True):
+            candidates = candidates[:keep]
+            scored = [(await self._evaluate(c, fidelity), c) for c in candidates]
+            scored.sort(key=lambda item: item[0].score, reverse=True)
+            candidates = [c for _, c in scored]
+
+        return self._result()
+
+
+class SurrogateSearch(_BudgetedSearch):
+    """가우시안 프로세스 대리 모델 기반 탐색.
+
+    처음 `n_initial`개는 무작위로 평가하고, 이후에는 평가하지 않은 후보 중
+    기대 개선량이 가장 큰 후보를 하나씩 전체 기간으로 평가합니다.
+    각 파라미터는 후보 목록 내 위치를 [0, 1]로 정규화하여 사용하므로
+    후보 목록은 크기 순으로 정렬되어 있는 것이 좋습니다.
+    """
+
+    def __init__(
+        self,
+        backtest: BacktestFn,
+        strategy_id: str,
+        base_params: BacktestParams,
+        space: dict[str, list[Any]],
+        objective: Objective = "sharpe_ratio",
+        max_runs: int = 30,
+        n_initial: int = 5,
+        length_scale: float = 0.3,
+        max_candidates: int = 2000,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            n_initial: 무작위로 평가할 초기 후보 수.
+            length_scale: RBF 커널 길이 척도 (정규화된 파라미터 공간 기준).
+            max_candidates: 매 단계 획득 함수를 계산할 최대 후보 수.
+            그 외 인자는 _BudgetedSearch 참고.
+        """
+        super().__init__(backtest, strategy_id, base_params, space, objective, max_runs, seed)
+        self.n_initial = max(1, n_initial)
+        self.length_scale = length_scale
+        self.max_candidates = max_candidates
+        self._scales = np.array([max(1, len(self.space[name]) - 1) for name in self._names])
+
+    def _encode(self, candidates: list[tuple[int, ...]]) -> np.ndarray:
+        return np.asarray(candidates, dtype=float) / self._scales
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        sq_dist = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1)
+        return np.exp(-0.5 * sq_dist / self.length_scale**2)
+
+    def _expected_improvement(
+        self, observed: list[tuple[int, ...]], scores: np.ndarray, pool: list[tuple[int, ...]]
+    ) -> np.ndarray:
+        """관측값으로 GP를 학습하고 후보별 기대 개선량을 계산합니다."""
+        x_obs, x_new = self._encode(observed), self._encode(pool)
+        std = scores.std() or 1.0
+        y = (scores - scores.mean()) / std
+
+        k = self._kernel(x_obs, x_obs) + 1e-6 * np.eye(len(observed))
+        chol = np.linalg.cholesky(k)
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, y))
+        k_new = self._kernel(x_new, x_obs)
+        mean = k_new @ alpha
+        v = np.linalg.solve(chol, k_new.T)
+        sigma = np.sqrt(np.clip(1.0 - (v**2).sum(axis=0), 1e-12, None))
+
+        z = (mean - y.max()) / sigma
+        cdf = 0.5 * (1 + np.vectorize(math.erf)(z / math.sqrt(2)))
+        pdf = np.exp(-0.5 * z**2) / math.sqrt(2 * math.pi)
+        return (mean - y.max()) * cdf + sigma * pdf
+
+    def _propose(self, evaluated: dict[tuple[int, ...], float]) -> tuple[int, ...] | None:
+        pool_size = min(self.space_size, self.max_candidates + len(evaluated))
+        pool = [c for c in self._sample(pool_size) if c not in evaluated]
+        if not pool:
+            return None
+
+        finite = {c: s for c, s in evaluated.items() if math.isfinite(s)}
+        if len(finite) < 2:
+            return self._random.choice(pool)
+
+        observed = list(finite)
+        scores = np.array([finite[c] for c in observed])
+        ei = self._expected_improvement(observed, scores, pool)
+        return pool[int(np.argmax(ei))]
+
+    async def run(self) -> OptimizationResult:
+        """탐색을 실행합니다."""
+        evaluated: dict[tuple[int, ...], float] = {}
+        budget = min(self.max_runs, self.space_size)
+
+        for candidate in self._sample(min(self.n_initial, budget)):
+            evaluated[candidate] = (await self._evaluate(candidate)).score
+
+        while len(evaluated) < budget:
+            candidate = self._propose(evaluated)
+            if candidate is None:
+                break
+            evaluated[candidate] = (await self._evaluate(candidate)).score
+
+        return self._result()
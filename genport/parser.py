@@ -34,6 +34,68 @@ class GenportResultParser:
             raw_data=raw_data,
         )
 
+    # 결과 API 응답의 키 → BacktestResult 필드 (snake_case, camelCase 모두 허용)
+    PAYLOAD_KEYS = {
+        "total_return": ("total_return", "totalReturn"),
+        "cagr": ("cagr", "CAGR"),
+        "sharpe_ratio": ("sharpe_ratio", "sharpeRatio", "sharpe"),
+        "max_drawdown": ("max_drawdown", "maxDrawdown", "mdd", "MDD"),
+        "win_rate": ("win_rate", "winRate"),
+        "trade_count": ("trade_count", "tradeCount", "total_trades"),
+    }
+
+    def parse_payload(self, payload: Any) -> BacktestResult:
+        """결과 API 응답(JSON)에서 백테스트 결과를 파싱합니다.
+
+        Args:
+            payload: 젠포트 결과 API 응답. 지표가 "result" 또는 "data" 아래에 있어도 됩니다.
+
+        Returns:
+            파싱된 백테스트 결과.
+
+        Raises:
+            ValueError: 응답에서 지표를 찾을 수 없거나 지표 값이 모두 비어 있는 경우
+                (진행 상태 폴링 등).
+
+        Note:
+            실제 젠포트 API 응답 구조에 맞게 PAYLOAD_KEYS 수정 필요.
+        """
+        metrics = payload
+        while isinstance(metrics, dict):
+            if any(key in metrics for keys in self.PAYLOAD_KEYS.values() for key in keys):
+                break
+            metrics = metrics.get("result", metrics.get("data"))
+        if not isinstance(metrics, dict):
+            raise ValueError("백테스트 결과 지표를 찾을 수 없습니다")
+
+        raw_data: dict[str, Any] = {}
+        for field_name, keys in self.PAYLOAD_KEYS.items():
+            for key in keys:
+                if metrics.get(key) is not None:
+                    raw_data[field_name] = self._to_number(metrics[key], field_name)
+                    break
+        if not raw_data:
+            raise ValueError("백테스트 결과 지표 값이 모두 비어 있습니다")
+
+        return BacktestResult(
+            total_return=raw_data.get("total_return", 0.0),
+            cagr=raw_data.get("cagr", 0.0),
+            sharpe_ratio=raw_data.get("sharpe_ratio", 0.0),
+            max_drawdown=raw_data.get("max_drawdown", 0.0),
+            win_rate=raw_data.get("win_rate", 0.0),
+            trade_count=raw_data.get("trade_count", 0),
+            raw_data={**raw_data, "payload": payload},
+        )
+
+    @staticmethod
+    def _to_number(value: Any, field_name: str) -> float | int:
+        """'12.5%', '1,234' 같은 값을 숫자로 변환합니다."""
+        if isinstance(value, str):
+            value = value.replace(",", "").rstrip("%").strip()
+        if field_name == "trade_count":
+            return int(float(value))
+        return float(value)
+
     def _extract_raw_data(self, html: str) -> dict[str, Any]:
         """HTML에서 원본 데이터를 추출합니다.
 
@@ -0,0 +1,424 @@
+"""젠포트 멀티 프로세스 스윕 오케스트레이터.
+
+`BacktestParams` 작업을 여러 워커 프로세스에 분산합니다. 각 워커는 자신만의
+러너(젠포트 브라우저 또는 로컬 엔진)와 이벤트 루프를 가지며, 공유 작업 큐에서
+작업을 하나씩 가져가므로 먼저 끝난 워커가 남은 작업을 가져가게 됩니다.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Protocol
+
+from src.utils.tracing import trace_context, tracer
+
+from .models import BacktestParams, BacktestResult
+
+if TYPE_CHECKING:
+    from .backtest import GenportBacktest
+    from .browser import GenportBrowser
+
+
+class BacktestRunner(Protocol):
+    """워커 프로세스에서 백테스트를 실행하는 러너."""
+
+    async def start(self) -> None:
+        """러너를 준비합니다 (브라우저 실행, 엔진 로드 등)."""
+        ...
+
+    async def close(self) -> None:
+        """러너 자원을 해제합니다."""
+        ...
+
+    async def run(self, strategy_id: str, params: BacktestParams) -> BacktestResult:
+        """백테스트 1회를 실행합니다."""
+        ...
+
+
+RunnerFactory = Callable[[], BacktestRunner]
+
+BUSY_POLL_INTERVAL = 0.05  # 타임아웃된 엔진 호출이 끝났는지 확인하는 주기 (초)
+
+
+class GenportRunner:
+    """워커 전용 브라우저로 젠포트 백테스트를 실행하는 러너."""
+
+    def __init__(self, headless: bool = True, login: bool = True):
+        """
+        Args:
+            headless: 헤드리스 모드 실행 여부.
+            login: 시작 시 로그인 여부. 로그인 정보는 환경변수에서 읽습니다.
+        """
+        self.headless = headless
+        self.login = login
+        self._browser: GenportBrowser | None = None
+        self._backtest: GenportBacktest | None = None
+
+    async def start(self) -> None:
+        # Playwright는 워커 프로세스에서만 로드
+        from .backtest import GenportBacktest
+        from .browser import GenportBrowser
+
+        self._browser = GenportBrowser(headless=self.headless)
+        await self._browser.start()
+        if self.login and not await self._browser.login():
+            raise RuntimeError("젠포트 로그인 실패")
+        self._backtest = GenportBacktest(self._browser)
+
+    async def close(self) -> None:
+        if self._browser:
+            await self._browser.close()
+
+    async def run(self, strategy_id: str, params: BacktestParams) -> BacktestResult:
+        if not self._backtest:
+            raise RuntimeError("러너가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        return await self._backtest.run(strategy_id, params)
+
+
+class LocalEngineRunner:
+    """로컬 엔진 함수를 실행하는 러너.
+
+    `engine`은 워커 프로세스로 전달되므로 모듈 수준 함수여야 합니다.
+    동기 함수는 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+    스레드는 중단할 수 없으므로 `job_timeout`은 권고 사항입니다. 타임아웃이 나도
+    엔진 호출은 스레드에서 끝까지 실행되며, 그동안(`busy`) 워커는 같은 작업을
+    재시도하지 않고 다음 작업도 가져가지 않으므로 워커당 동시 실행은 1건으로 유지됩니다.
+    """
+
+    def __init__(self, engine: Callable[[str, BacktestParams], BacktestResult]):
+        """
+        Args:
+            engine: (전략 ID, 파라미터)를 받아 결과를 반환하는 함수.
+        """
+        self.engine = engine
+        self._running = 0
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> bool:
+        """타임아웃된 엔진 호출이 아직 스레드에서 실행 중인지 여부."""
+        with self._lock:
+            return self._running > 0
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def run(self, strategy_id: str, params: BacktestParams) -> BacktestResult:
+        with trace_context(strategy_id=strategy_id), tracer.span("engine.run"):
+            with self._lock:
+                self._running += 1
+            return await asyncio.to_thread(self._call, strategy_id, params)
+
+    def _call(self, strategy_id: str, params: BacktestParams) -> BacktestResult:
+        try:
+            return self.engine(strategy_id, params)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+@dataclass
+class SweepJob:
+    """스윕 작업 1건."""
+
+    job_id: int
+    strategy_id: str
+    overrides: dict[str, Any]  # 기본 파라미터 대비 변경된 값
+    params: BacktestParams
+
+
+@dataclass
+class SweepOutcome:
+    """스윕 작업 결과."""
+
+    job: SweepJob
+    result: BacktestResult | None
+    error: str | None
+    attempts: int  # 시도 횟수 (재시도 포함)
+    worker_id: int
+    elapsed: float  # 소요 시간 (초)
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+
+@dataclass
+class SweepProgress:
+    """스윕 진행 상황."""
+
+    total: int
+    completed: int
+    failed: int
+    elapsed: float
+    last: SweepOutcome
+
+    @property
+    def remaining(self) -> int:
+        return self.total - self.completed
+
+    @property
+    def eta(self) -> float:
+        """남은 예상 시간 (초)."""
+        if self.completed == 0:
+            return float("inf")
+        return self.elapsed / self.completed * self.remaining
+
+
+def expand_grid(
+    base_params: BacktestParams,
+    param_grid: dict[str, list[Any]],
+) -> list[tuple[dict[str, Any], BacktestParams]]:
+    """파라미터 그리드의 모든 조합을 생성합니다.
+
+    Args:
+        base_params: 기본 파라미터.
+        param_grid: 스윕할 파라미터 그리드. 예: {"max_holdings": [5, 10], "slippage": [0.001]}
+
+    Returns:
+        (변경된 값, 파라미터) 튜플 리스트.
+    """
+    valid = {f.name for f in fields(BacktestParams)}
+    unknown = set(param_grid) - valid
+    if unknown:
+        raise ValueError(f"알 수 없는 파라미터: {sorted(unknown)}")
+
+    names = list(param_grid)
+    combos = []
+    for values in itertools.product(*(param_grid[name] for name in names)):
+        overrides = dict(zip(names, values, strict=True))
+        combos.append((overrides, replace(base_params, **overrides)))
+    return combos
+
+
+def _worker_main(
+    worker_id: int,
+    runner_factory: RunnerFactory,
+    job_queue: "queue.Queue[SweepJob | None]",
+    result_queue: "queue.Queue[SweepOutcome]",
+    max_retries: int,
+    job_timeout: float,
+    retry_budget: int,
+) -> int:
+    """워커 프로세스 엔트리포인트. 처리한 작업 수를 반환합니다."""
+    return asyncio.run(
+        _worker_loop(
+            worker_id,
+            runner_factory,
+            job_queue,
+            result_queue,
+            max_retries,
+            job_timeout,
+            retry_budget,
+        )
+    )
+
+
+async def _worker_loop(
+    worker_id: int,
+    runner_factory: RunnerFactory,
+    job_queue: "queue.Queue[SweepJob | None]",
+    result_queue: "queue.Queue[SweepOutcome]",
+    max_retries: int,
+    job_timeout: float,
+    retry_budget: int,
+) -> int:
+    runner = runner_factory()
+    await runner.start()
+
+    processed = 0
+    retries_left = retry_budget
+    try:
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+
+            started = time.perf_counter()
+            attempts = 0
+            result = None
+            error = None
+            while True:
+                attempts += 1
+                try:
+                    result = await asyncio.wait_for(
+                        runner.run(job.strategy_id, job.params), timeout=job_timeout
+                    )
+                    error = None
+                    break
+                except TimeoutError:
+                    error = f"타임아웃 ({job_timeout}초)"
+                    # 중단되지 않은 이전 시도와 겹쳐 실행되지 않도록 재시도하지 않음
+                    if getattr(runner, "busy", False):
+                        break
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+
+                # 작업별 재시도 횟수와 워커 전체 재시도 예산을 모두 확인
+                if attempts > max_retries or retries_left <= 0:
+                    break
+                retries_left -= 1
+
+            result_queue.put(
+                SweepOutcome(
+                    job=job,
+                    result=result,
+                    error=error,
+                    attempts=attempts,
+                    worker_id=worker_id,
+                    elapsed=time.perf_counter() - started,
+                )
+            )
+            processed += 1
+
+            # 타임아웃된 엔진 호출이 끝나기 전에 다음 작업을 겹쳐 실행하지 않음
+            while getattr(runner, "busy", False):
+                await asyncio.sleep(BUSY_POLL_INTERVAL)
+    finally:
+        await runner.close()
+
+    return processed
+
+
+class SweepOrchestrator:
+    """멀티 프로세스 파라미터 스윕 실행기.
+
+    Example:
+        ```python
+        from functools import partial
+
+        orchestrator = SweepOrchestrator(partial(GenportRunner, headless=True), max_workers=4)
+        outcomes = orchestrator.run("12345", base_params, {"max_holdings": [5, 10, 15]})
+        ```
+    """
+
+    POLL_INTERVAL = 0.5  # 결과 큐 확인 주기 (초)
+
+    def __init__(
+        self,
+        runner_factory: RunnerFactory,
+        max_workers: int | None = None,
+        max_retries: int = 2,
+        job_timeout: float = 600.0,
+        retry_budget: int = 10,
+        progress: Callable[[SweepProgress], None] | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ):
+        """
+        Args:
+            runner_factory: 워커마다 러너를 생성하는 함수. 프로세스 간 전달되므로
+                pickle 가능해야 합니다 (모듈 수준 클래스/함수, functools.partial 등).
+            max_workers: 워커 프로세스 수. None이면 CPU 코어 수.
+            max_retries: 작업별 최대 재시도 횟수.
+            job_timeout: 작업 1회 시도의 타임아웃 (초). `LocalEngineRunner`에서는 권고
+                사항이며, 엔진 호출이 아직 실행 중이면 재시도하지 않습니다.
+            retry_budget: 워커별 전체 재시도 예산. 소진되면 실패 작업을 재시도하지 않습니다.
+            progress: 작업이 끝날 때마다 호출되는 진행 상황 콜백.
+            mp_context: 멀티프로세싱 컨텍스트. None이면 spawn.
+        """
+        self.runner_factory = runner_factory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_retries = max_retries
+        self.job_timeout = job_timeout
+        self.retry_budget = retry_budget
+        self.progress = progress
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+
+    def run(
+        self,
+        strategy_id: str,
+        base_params: BacktestParams,
+        param_grid: dict[str, list[Any]],
+    ) -> list[SweepOutcome]:
+        """파라미터 그리드 전체 조합을 실행합니다.
+
+        Args:
+            strategy_id: 젠포트 전략 ID.
+            base_params: 기본 파라미터.
+            param_grid: 스윕할 파라미터 그리드.
+
+        Returns:
+            작업 ID 순으로 정렬된 결과 리스트.
+        """
+        jobs = [
+            SweepJob(job_id=i, strategy_id=strategy_id, overrides=overrides, params=params)
+            for i, (overrides, params) in enumerate(expand_grid(base_params, param_grid))
+        ]
+        return self.run_jobs(jobs)
+
+    def run_jobs(self, jobs: list[SweepJob]) -> list[SweepOutcome]:
+        """작업 목록을 워커 프로세스에 분산 실행합니다."""
+        if not jobs:
+            return []
+
+        num_workers = min(self.max_workers, len(jobs))
+        started = time.perf_counter()
+        outcomes: dict[int, SweepOutcome] = {}
+        failed = 0
+
+        with self.mp_context.Manager() as manager:
+            job_queue = manager.Queue()
+            result_queue = manager.Queue()
+            for job in jobs:
+                job_queue.put(job)
+            for _ in range(num_workers):
+                job_queue.put(None)
+
+            with ProcessPoolExecutor(max_workers=num_workers, mp_context=self.mp_context) as pool:
+                workers: list[Future[int]] = [
+                    pool.submit(
+                        _worker_main,
+                        worker_id,
+                        self.runner_factory,
+                        job_queue,
+                        result_queue,
+                        self.max_retries,
+                        self.job_timeout,
+                        self.retry_budget,
+                    )
+                    for worker_id in range(num_workers)
+                ]
+
+                while len(outcomes) < len(jobs):
+                    try:
+                        outcome = result_queue.get(timeout=self.POLL_INTERVAL)
+                    except queue.Empty:
+                        if all(w.done() for w in workers) and result_queue.empty():
+                            break
+                        continue
+
+                    outcomes[outcome.job.job_id] = outcome
+                    if not outcome.ok:
+                        failed += 1
+                    if self.progress:
+                        self.progress(
+                            SweepProgress(
+                                total=len(jobs),
+                                completed=len(outcomes),
+                                failed=failed,
+                                elapsed=time.perf_counter() - started,
+                                last=outcome,
+                            )
+                        )
+
+                # 워커 시작 실패 등으로 처리되지 않은 작업
+                worker_errors = [str(w.exception()) for w in workers if w.exception()]
+                error = worker_errors[0] if worker_errors else "워커가 작업을 처리하지 못했습니다"
+                for job in jobs:
+                    if job.job_id not in outcomes:
+                        outcomes[job.job_id] = SweepOutcome(
+                            job=job, result=None, error=error, attempts=0, worker_id=-1, elapsed=0.0
+                        )
+
+        return [outcomes[job.job_id] for job in jobs]
@@ -0,0 +1,123 @@
+"""IPC 프로토콜 및 시세 모델 벤치마크.
+
+10만 건의 IPC 메시지 직렬화/역직렬화와 캔들 생성에 드는 시간과 메모리를 측정합니다.
+pydantic이 설치되어 있으면 이전 pydantic 모델과 비교합니다.
+
+실행 방법:
+    uv run python scripts/bench_ipc_protocol.py
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.broker.interface import OHLCV  # noqa: E402
+from src.broker.kiwoom.protocol import IPCMessage, IPCResponse  # noqa: E402
+
+N = 100_000
+
+
+@dataclass
+class DictOHLCV:
+    """이전 방식의 캔들 (__dict__ 보유)."""
+
+    timestamp: datetime
+    open: Decimal
+    high: Decimal
+    low: Decimal
+    close: Decimal
+    volume: int
+
+
+def timed(label: str, fn: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms  ({elapsed / N * 1e6:6.2f} us/op)")
+
+
+def measure_memory(label: str, fn: Callable[[], list[Any]]) -> None:
+    tracemalloc.start()
+    objects = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40} {current / len(objects):9.1f} B/obj")
+
+
+def bench_messages() -> None:
+    raw_response = IPCResponse(
+        success=True,
+        data={"order_id": "0012345", "status": "submitted"},
+        request_id="6f1c2d7e-1f7a-4b1e-9d1c-6a0b3c2d1e0f",
+    ).to_json()
+
+    def encode() -> None:
+        for i in range(N):
+            IPCMessage(method="submit_order", params={"symbol": "005930", "qty": i}).to_json()
+
+    timed("protocol encode", encode)
+    timed(
+        "protocol decode (validate)",
+        lambda: [IPCResponse.from_json(raw_response) for _ in range(N)],
+    )
+    timed(
+        "protocol decode (trusted)",
+        lambda: [IPCResponse.from_json(raw_response, validate=False) for _ in range(N)],
+    )
+
+    try:
+        from pydantic import BaseModel
+    except ImportError:
+        print("pydantic 미설치: 비교 생략")
+        return
+
+    class PydanticMessage(BaseModel):
+        method: str
+        params: dict[str, Any] = {}
+        request_id: str | None = None
+
+    class PydanticResponse(BaseModel):
+        success: bool
+        data: Any = None
+        error: str | None = None
+        request_id: str | None = None
+
+    def pydantic_encode() -> None:
+        for i in range(N):
+            PydanticMessage(
+                method="submit_order", params={"symbol": "005930", "qty": i}
+            ).model_dump_json()
+
+    timed("pydantic encode", pydantic_encode)
+    timed(
+        "pydantic decode",
+        lambda: [PydanticResponse.model_validate_json(raw_response) for _ in range(N)],
+    )
+
+
+def bench_candles() -> None:
+    ts = datetime(2024, 1, 2, 9, 0)
+    price = Decimal("70000")
+
+    def make(cls: type) -> list[Any]:
+        return [cls(ts, price, price, price, price, i) for i in range(N)]
+
+    timed("OHLCV (slots) create", lambda: make(OHLCV))
+    timed("OHLCV (__dict__) create", lambda: make(DictOHLCV))
+    measure_memory("OHLCV (slots) memory", lambda: make(OHLCV))
+    measure_memory("OHLCV (__dict__) memory", lambda: make(DictOHLCV))
+
+
+if __name__ == "__main__":
+    print(f"== IPC 메시지 ({N:,}건) ==")
+    bench_messages()
+    print(f"\n== 캔들 ({N:,}건) ==")
+    bench_candles()
@@ -1,5 +1,22 @@
 # Broker API integrations
-from .interface import BrokerInterface
+#
+# 하위 모듈은 실제로 접근할 때 로드합니다 (PEP 562).
+from typing import TYPE_CHECKING
 
-__all__ = ["BrokerInterface"]
+from src.utils.lazy import lazy_module
 
+if TYPE_CHECKING:
+    from .interface import BrokerInterface
+    from .risk import RiskGate, RiskLimits, RiskRejectedError, SymbolLimits
+
+_LAZY_ATTRS = {
+    "BrokerInterface": ".interface",
+    "RiskGate": ".risk",
+    "RiskLimits": ".risk",
+    "RiskRejectedError": ".risk",
+    "SymbolLimits": ".risk",
+}
+
+__all__ = ["BrokerInterface", "RiskGate", "RiskLimits", "RiskRejectedError", "SymbolLimits"]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRS)
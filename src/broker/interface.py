@@ -22,7 +22,7 @@ class OrderType(Enum):
     LIMIT = "limit"  # 지정가
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """주문 정보."""
 
@@ -35,7 +35,7 @@ class Order:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """포지션 정보."""
 
@@ -46,7 +46,7 @@ class Position:
     unrealized_pnl: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCV:
     """캔들 데이터."""
 
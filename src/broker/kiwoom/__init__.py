@@ -3,6 +3,7 @@
 32비트/64비트 분리 아키텍처:
 - server.py: 32비트 Python에서 실행, 키움 API 직접 연동
 - client.py: 64비트 Python에서 실행, 서버와 ZeroMQ로 통신
+- cache.py: 서버가 발행하는 체결/잔고 이벤트로 갱신되는 계좌 캐시
 
 64비트 메인 프로세스에서는 KiwoomClient를 사용하세요:
 
@@ -11,8 +12,25 @@
     client = KiwoomClient()
     if client.connect():
         balance = client.get_balance()
+
+zmq, loguru 등은 KiwoomClient에 처음 접근할 때 로드합니다 (PEP 562).
 """
 
-from src.broker.kiwoom.client import KiwoomClient, KiwoomClientError
+from typing import TYPE_CHECKING
+
+from src.utils.lazy import lazy_module
+
+if TYPE_CHECKING:
+    from src.broker.kiwoom.cache import AccountCache, Fill
+    from src.broker.kiwoom.client import KiwoomClient, KiwoomClientError
+
+_LAZY_ATTRS = {
+    "AccountCache": "src.broker.kiwoom.cache",
+    "Fill": "src.broker.kiwoom.cache",
+    "KiwoomClient": "src.broker.kiwoom.client",
+    "KiwoomClientError": "src.broker.kiwoom.client",
+}
+
+__all__ = ["AccountCache", "Fill", "KiwoomClient", "KiwoomClientError"]
 
-__all__ = ["KiwoomClient", "KiwoomClientError"]
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRS)
@@ -0,0 +1,214 @@
+"""키움 계좌 상태 캐시.
+
+잔고와 포지션을 한 번 조회(seed)한 뒤, 서버가 PUB 소켓으로 발행하는
+체결/포지션/잔고 이벤트로 갱신합니다. 조회는 메모리에서 처리하므로
+매 의사결정마다 IPC 왕복을 하지 않아도 됩니다.
+
+이벤트 번호(seq)가 건너뛰거나 서버가 재시작(epoch 변경)되면 캐시를
+오래된(stale) 상태로 표시하고, 다음 조회 시 서버에서 다시 불러옵니다.
+`refresh()`로 언제든 서버 상태와 명시적으로 맞출 수 있습니다.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import zmq
+from loguru import logger
+
+from src.broker.interface import OrderSide, Position
+from src.broker.kiwoom.protocol import ACCOUNT_TOPICS, IPCEvent, ProtocolError
+from src.utils.tracing import tracer
+
+if TYPE_CHECKING:
+    from src.broker.kiwoom.client import KiwoomClient
+
+
+@dataclass(slots=True)
+class Fill:
+    """체결 정보."""
+
+    order_id: str
+    symbol: str
+    side: OrderSide
+    quantity: int
+    price: Decimal
+    seq: int  # 서버 이벤트 번호
+
+
+class AccountCache:
+    """이벤트 기반 계좌 상태 캐시.
+
+    `KiwoomClient`와 마찬가지로 스레드 안전하지 않으므로 한 스레드에서만 사용하세요.
+
+    Example:
+        ```python
+        cache = AccountCache(client)
+        while trading:
+            cash = cache.balance()  # IPC 없이 메모리에서 조회
+            holdings = cache.positions()
+        ```
+    """
+
+    def __init__(self, client: "KiwoomClient", max_fills: int = 1000) -> None:
+        """
+        Args:
+            client: 초기 조회와 재조회에 사용할 클라이언트.
+            max_fills: 보관할 최근 체결 수.
+        """
+        self.client = client
+        self.version = 0  # 캐시 상태가 바뀔 때마다 증가
+        self.seq = 0  # 마지막으로 반영한 서버 이벤트 번호
+        self.stale = True
+        self._epoch: str | None = None
+        self._balance = Decimal("0")
+        self._positions: dict[str, Position] = {}
+        self._fills: deque[Fill] = deque(maxlen=max_fills)
+        self._context: zmq.Context | None = None
+        self._socket: zmq.Socket | None = None
+
+    # === 조회 ===
+
+    def balance(self) -> Decimal:
+        """예수금."""
+        self._sync()
+        return self._balance
+
+    def positions(self) -> list[Position]:
+        """보유 포지션 목록."""
+        self._sync()
+        return list(self._positions.values())
+
+    def position(self, symbol: str) -> Position | None:
+        """종목의 보유 포지션. 없으면 None."""
+        self._sync()
+        return self._positions.get(symbol)
+
+    def fills(self) -> list[Fill]:
+        """최근 체결 목록 (오래된 순)."""
+        self._sync()
+        return list(self._fills)
+
+    # === 동기화 ===
+
+    def refresh(self) -> None:
+        """서버에서 잔고와 포지션을 다시 조회하여 캐시를 맞춥니다.
+
+        조회 직전의 이벤트 번호를 기록해 두고, 조회 중에 도착한 이벤트는
+        그 이후 번호만 반영합니다. position/balance 이벤트는 변동 후 전체 상태를
+        담고 있으므로 조회 결과에 다시 적용해도 최종 상태는 같습니다.
+        """
+        with tracer.span("kiwoom.cache.refresh"):
+            info = self.client._send_request("get_event_info")
+            if self._socket is None:
+                self._subscribe(info["address"])
+            balance = self.client._fetch_balance()
+            positions = self.client._fetch_positions()
+
+            self._epoch = info["epoch"]
+            self.seq = info["seq"]
+            self._balance = balance
+            self._positions = {p.symbol: p for p in positions}
+            self.stale = False
+            self.version += 1
+            self.poll()
+
+    def poll(self) -> int:
+        """수신된 이벤트를 모두 반영하고 반영한 이벤트 수를 반환합니다 (논블로킹)."""
+        if self._socket is None:
+            return 0
+        applied = 0
+        while True:
+            try:
+                raw = self._socket.recv_multipart(zmq.NOBLOCK)[-1]
+            except zmq.Again:
+                break
+            try:
+                event = IPCEvent.from_json(raw, validate=self.client.validate)
+            except ProtocolError as e:
+                logger.warning(f"계좌 이벤트 형식 오류: {e}")
+                self.stale = True
+                continue
+
+            if event.epoch != self._epoch:
+                # 서버 재시작: 이전 상태를 신뢰할 수 없음
+                self.stale = True
+                continue
+            if event.seq <= self.seq:
+                continue  # 이미 조회 결과에 반영된 이벤트
+            if event.seq != self.seq + 1:
+                logger.warning(f"계좌 이벤트 누락: {self.seq + 1} ~ {event.seq - 1}")
+                self.stale = True
+            self.seq = event.seq
+            self._apply(event)
+            applied += 1
+
+        if applied:
+            self.version += 1
+            tracer.count("kiwoom.cache.events", applied)
+        return applied
+
+    def close(self) -> None:
+        """이벤트 구독을 해제합니다."""
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+        if self._context:
+            self._context.term()
+            self._context = None
+        self.stale = True
+
+    def _sync(self) -> None:
+        """조회 전 수신된 이벤트를 반영하고, 필요하면 서버에서 다시 불러옵니다."""
+        self.poll()
+        if self.stale:
+            tracer.count("kiwoom.cache.miss")
+            self.refresh()
+
+    def _subscribe(self, address: str) -> None:
+        self._context = zmq.Context()
+        self._socket = self._context.socket(zmq.SUB)
+        self._socket.setsockopt(zmq.LINGER, 0)
+        for topic in ACCOUNT_TOPICS:
+            self._socket.setsockopt(zmq.SUBSCRIBE, topic.encode("utf-8"))
+        self._socket.connect(address)
+
+    def _apply(self, event: IPCEvent) -> None:
+        data = event.data
+        if event.topic == "balance":
+            self._balance = Decimal(data["balance"])
+        elif event.topic == "position":
+            symbol = data["symbol"]
+            quantity = data["quantity"]
+            if quantity == 0:
+                self._positions.pop(symbol, None)
+                return
+            avg_price = Decimal(data["avg_price"])
+            current_price = Decimal(data["current_price"])
+            self._positions[symbol] = Position(
+                symbol=symbol,
+                quantity=quantity,
+                avg_price=avg_price,
+                current_price=current_price,
+                unrealized_pnl=Decimal(
+                    data.get("unrealized_pnl", (current_price - avg_price) * quantity)
+                ),
+            )
+        elif event.topic == "fill":
+            self._fills.append(
+                Fill(
+                    order_id=data["order_id"],
+                    symbol=data["symbol"],
+                    side=OrderSide(data["side"]),
+                    quantity=data["quantity"],
+                    price=Decimal(data["price"]),
+                    seq=event.seq,
+                )
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"AccountCache(version={self.version}, seq={self.seq}, stale={self.stale}, "
+            f"positions={len(self._positions)})"
+        )
@@ -2,6 +2,8 @@
 
 64비트 메인 프로세스에서 실행되며, 32비트 키움 서버와 ZeroMQ로 통신합니다.
 BrokerInterface를 구현하여 다른 브로커와 동일한 인터페이스를 제공합니다.
+`cache_account=True`로 생성하면 잔고/포지션 조회를 서버 이벤트로 갱신되는
+계좌 캐시(AccountCache)에서 처리합니다.
 """
 
 import os
@@ -12,7 +14,6 @@ from typing import Any
 
 import zmq
 from loguru import logger
-from pydantic import BaseModel
 
 from src.broker.interface import (
     OHLCV,
@@ -22,6 +23,9 @@ from src.broker.interface import (
     OrderType,
     Position,
 )
+from src.broker.kiwoom.cache import AccountCache
+from src.broker.kiwoom.protocol import IPCMessage, IPCResponse, ProtocolError
+from src.utils.tracing import tracer
 
 # 서버 설정
 DEFAULT_PORT = 5555
@@ -29,23 +33,6 @@ SERVER_ADDRESS = f"tcp://127.0.0.1:{os.getenv('KIWOOM_IPC_PORT', DEFAULT_PORT)}"
 DEFAULT_TIMEOUT_MS = 5000
 
 
-class IPCMessage(BaseModel):
-    """IPC 메시지 포맷."""
-
-    method: str
-    params: dict[str, Any] = {}
-    request_id: str | None = None
-
-
-class IPCResponse(BaseModel):
-    """IPC 응답 포맷."""
-
-    success: bool
-    data: Any = None
-    error: str | None = None
-    request_id: str | None = None
-
-
 class KiwoomClientError(Exception):
     """키움 클라이언트 오류."""
 
@@ -70,14 +57,22 @@ class KiwoomClient(BrokerInterface):
         self,
         server_address: str = SERVER_ADDRESS,
         timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        validate: bool = True,
+        cache_account: bool = False,
     ) -> None:
         """
         Args:
             server_address: 키움 서버 주소 (기본: tcp://127.0.0.1:5555)
             timeout_ms: 요청 타임아웃 (밀리초)
+            validate: 응답 메시지 검증 여부. 신뢰할 수 있는 로컬호스트 링크에서는 False로 생략 가능
+            cache_account: True면 get_balance()/get_positions()를 계좌 캐시에서 처리합니다.
+                첫 조회 시 한 번 서버에서 불러오고, 이후에는 체결/잔고 이벤트로 갱신합니다.
         """
         self.server_address = server_address
         self.timeout_ms = timeout_ms
+        self.validate = validate
+        self.cache_account = cache_account
+        self._account_cache: AccountCache | None = None
         self._context: zmq.Context | None = None
         self._socket: zmq.Socket | None = None
         self._connected = False
@@ -104,24 +99,32 @@ class KiwoomClient(BrokerInterface):
             request_id=request_id,
         )
 
-        try:
-            socket.send_string(msg.model_dump_json())
-            response_str = socket.recv_string()
-            response = IPCResponse.model_validate_json(response_str)
+        with tracer.span("kiwoom.request", method=method, request_id=request_id):
+            try:
+                socket.send_string(msg.to_json())
+                response_str = socket.recv_string()
+                response = IPCResponse.from_json(response_str, validate=self.validate)
 
-            if not response.success:
-                raise KiwoomClientError(response.error or "알 수 없는 오류")
+                if not response.success:
+                    tracer.count("kiwoom.request.failed")
+                    raise KiwoomClientError(response.error or "알 수 없는 오류")
 
-            return response.data
+                return response.data
 
-        except zmq.Again:
-            # 타임아웃 발생 시 소켓 재생성
-            self._reset_socket()
-            raise KiwoomClientError(f"요청 타임아웃: {method}")
+            except zmq.Again as e:
+                # 타임아웃 발생 시 소켓 재생성
+                tracer.count("kiwoom.request.timeout")
+                self._reset_socket()
+                raise KiwoomClientError(f"요청 타임아웃: {method}") from e
 
-        except zmq.ZMQError as e:
-            self._reset_socket()
-            raise KiwoomClientError(f"통신 오류: {e}")
+            except zmq.ZMQError as e:
+                tracer.count("kiwoom.request.error")
+                self._reset_socket()
+                raise KiwoomClientError(f"통신 오류: {e}") from e
+
+            except ProtocolError as e:
+                tracer.count("kiwoom.request.error")
+                raise KiwoomClientError(f"응답 형식 오류: {e}") from e
 
     def _reset_socket(self) -> None:
         """소켓을 재설정합니다."""
@@ -129,6 +132,17 @@ class KiwoomClient(BrokerInterface):
             self._socket.close()
             self._socket = None
 
+    @property
+    def account_cache(self) -> AccountCache:
+        """계좌 캐시 (처음 접근할 때 생성)."""
+        if self._account_cache is None:
+            self._account_cache = AccountCache(self)
+        return self._account_cache
+
+    def refresh(self) -> None:
+        """계좌 캐시를 서버 상태와 다시 맞춥니다."""
+        self.account_cache.refresh()
+
     def ping(self) -> bool:
         """서버 연결 테스트."""
         try:
@@ -160,6 +174,8 @@ class KiwoomClient(BrokerInterface):
         except KiwoomClientError as e:
             logger.warning(f"연결 해제 중 오류: {e}")
         finally:
+            if self._account_cache:
+                self._account_cache.close()
             self._reset_socket()
             if self._context:
                 self._context.term()
@@ -167,11 +183,21 @@ class KiwoomClient(BrokerInterface):
 
     def get_balance(self) -> Decimal:
         """계좌 잔고를 조회합니다."""
-        result = self._send_request("get_balance")
-        return Decimal(result.get("balance", "0"))
+        if self.cache_account:
+            return self.account_cache.balance()
+        return self._fetch_balance()
 
     def get_positions(self) -> list[Position]:
         """보유 포지션 목록을 조회합니다."""
+        if self.cache_account:
+            return self.account_cache.positions()
+        return self._fetch_positions()
+
+    def _fetch_balance(self) -> Decimal:
+        result = self._send_request("get_balance")
+        return Decimal(result.get("balance", "0"))
+
+    def _fetch_positions(self) -> list[Position]:
         result = self._send_request("get_positions")
         positions = []
         for pos in result:
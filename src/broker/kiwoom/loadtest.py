@@ -0,0 +1,321 @@
+"""키움 IPC 부하 테스트.
+
+여러 클라이언트 스레드가 조회/주문 요청을 섞어 보내면서 요청별 지연 시간과
+처리량을 측정합니다. 서버 주소를 지정하지 않으면 모의 백엔드(SimulatorBackend)로
+서버를 띄워 키움 OCX나 Qt 없이 일반 Linux에서 실행할 수 있습니다.
+
+실행 방법:
+    uv run python -m src.broker.kiwoom.loadtest --clients 4 --duration 10
+    uv run python -m src.broker.kiwoom.loadtest --endpoint tcp://127.0.0.1:5555
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import zmq
+from loguru import logger
+
+from src.broker.interface import Order, OrderSide, OrderType
+from src.broker.kiwoom.client import KiwoomClient, KiwoomClientError
+from src.broker.kiwoom.server import KiwoomServer
+from src.broker.kiwoom.simulator import SimulatorBackend, synthetic_ticks
+from src.utils.tracing import Histogram
+
+# 요청 종류별 비율
+DEFAULT_MIX = {
+    "ping": 0.1,
+    "get_balance": 0.25,
+    "get_positions": 0.25,
+    "submit_order": 0.25,
+    "cancel_order": 0.1,
+    "get_historical_data": 0.05,
+}
+SAMPLE_LIMIT = 100_000  # 백분위수 계산에 보관할 지연 시간 샘플 수
+
+
+@dataclass
+class LoadTestReport:
+    """부하 테스트 결과."""
+
+    duration: float  # 측정 시간 (초)
+    clients: int
+    latency: dict[str, Histogram] = field(default_factory=dict)  # 요청 종류별 지연 (밀리초)
+    overall: Histogram = field(default_factory=lambda: Histogram(max_samples=SAMPLE_LIMIT))
+    errors: dict[str, int] = field(default_factory=dict)  # 요청 종류별 실패 수
+    events: int = 0  # 수신한 서버 이벤트 수
+
+    @property
+    def requests(self) -> int:
+        return sum(h.count for h in self.latency.values())
+
+    @property
+    def throughput(self) -> float:
+        """초당 요청 수."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def event_rate(self) -> float:
+        """초당 수신 이벤트 수."""
+        return self.events / self.duration if self.duration else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """요청 종류별 count/errors/p50/p95/p99/max와 전체 처리량."""
+        methods = {
+            method: {**histogram.summary(), "errors": self.errors.get(method, 0)}
+            for method, histogram in sorted(self.latency.items())
+        }
+        return {
+            "requests": self.requests,
+            "errors": sum(self.errors.values()),
+            "throughput": self.throughput,
+            "event_rate": self.event_rate,
+            "latency": self.overall.summary(),
+            "methods": methods,
+        }
+
+    def format(self) -> str:
+        """표 형식 문자열."""
+        summary = self.summary()
+        lines = [
+            f"{self.clients} clients, {self.duration:.1f}s: "
+            f"{summary['requests']} requests ({summary['throughput']:.0f} req/s), "
+            f"{summary['errors']} errors, {self.events} events ({self.event_rate:.0f}/s)",
+            f"{'method':<22}{'count':>8}{'errors':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+        rows = list(summary["methods"].items()) + [("(all)", summary["latency"])]
+        for method, s in rows:
+            lines.append(
+                f"{method:<22}{s['count']:>8}{s.get('errors', summary['errors']):>8}"
+                f"{s['p50']:>9.3f}{s['p95']:>9.3f}{s['p99']:>9.3f}{s['max']:>9.3f}"
+            )
+        lines.append("(지연 시간 단위: ms)")
+        return "\n".join(lines)
+
+
+class _Worker:
+    """클라이언트 1개로 요청을 반복하는 부하 생성기."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        mix: dict[str, float],
+        symbols: list[str],
+        seed: int,
+        timeout_ms: int,
+        validate: bool,
+    ):
+        self.client = KiwoomClient(endpoint, timeout_ms=timeout_ms, validate=validate)
+        self.rng = random.Random(seed)
+        self.symbols = symbols
+        self.methods = list(mix)
+        self.weights = list(mix.values())
+        self.samples: dict[str, list[float]] = {method: [] for method in mix}
+        self.errors: dict[str, int] = {}
+        self._resting: list[str] = []  # 취소 대상 지정가 주문
+        self._calls: dict[str, Callable[[], Any]] = {
+            "ping": self.client.ping,
+            "get_balance": self.client.get_balance,
+            "get_positions": self.client.get_positions,
+            "submit_order": self._submit_order,
+            "cancel_order": self._cancel_order,
+            "get_historical_data": self._get_historical_data,
+        }
+
+    def _submit_order(self) -> str:
+        symbol = self.rng.choice(self.symbols)
+        if self.rng.random() < 0.5:
+            return self.client.submit_order(
+                Order(symbol=symbol, side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=1)
+            )
+        # 체결되지 않는 지정가 주문 (취소 요청 대상)
+        order_id = self.client.submit_order(
+            Order(
+                symbol=symbol,
+                side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                quantity=1,
+                price=Decimal("1000"),
+            )
+        )
+        self._resting.append(order_id)
+        return order_id
+
+    def _cancel_order(self) -> bool:
+        order_id = self._resting.pop() if self._resting else "UNKNOWN"
+        return self.client.cancel_order(order_id)
+
+    def _get_historical_data(self) -> Any:
+        return self.client.get_historical_data(
+            self.rng.choice(self.symbols), datetime(2000, 1, 1), datetime(2100, 1, 1)
+        )
+
+    def run(self, start: threading.Barrier, deadline: list[float]) -> None:
+        start.wait()
+        perf_counter = time.perf_counter
+        while perf_counter() < deadline[0]:
+            method = self.rng.choices(self.methods, self.weights)[0]
+            began = perf_counter()
+            try:
+                self._calls[method]()
+            except KiwoomClientError:
+                self.errors[method] = self.errors.get(method, 0) + 1
+            self.samples[method].append((perf_counter() - began) * 1000)
+        self.client.disconnect()
+
+
+def _count_events(address: str, stop: threading.Event, counter: list[int]) -> None:
+    context = zmq.Context()
+    socket = context.socket(zmq.SUB)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.setsockopt(zmq.SUBSCRIBE, b"")
+    socket.connect(address)
+    try:
+        while not stop.is_set():
+            if socket.poll(50):
+                while True:
+                    try:
+                        socket.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    counter[0] += 1
+    finally:
+        socket.close()
+        context.term()
+
+
+def run_load_test(
+    endpoint: str,
+    clients: int = 4,
+    duration: float = 10.0,
+    mix: dict[str, float] | None = None,
+    symbols: list[str] | None = None,
+    seed: int = 0,
+    timeout_ms: int = 5000,
+    validate: bool = True,
+) -> LoadTestReport:
+    """부하 테스트를 실행합니다.
+
+    Args:
+        endpoint: 서버 주소.
+        clients: 동시 클라이언트(스레드) 수.
+        duration: 측정 시간 (초).
+        mix: 요청 종류별 비율. None이면 DEFAULT_MIX.
+        symbols: 주문/조회 종목. None이면 ["005930"].
+        seed: 요청 순서 난수 시드.
+        timeout_ms: 요청 타임아웃 (밀리초).
+        validate: 응답 메시지 검증 여부.
+
+    Returns:
+        요청 종류별 지연 시간과 처리량.
+    """
+    mix = mix or DEFAULT_MIX
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise ValueError(f"알 수 없는 요청 종류: {sorted(unknown)}")
+    symbols = symbols or ["005930"]
+
+    info_client = KiwoomClient(endpoint, timeout_ms=timeout_ms)
+    try:
+        event_address = info_client._send_request("get_event_info")["address"]
+    finally:
+        info_client.disconnect()
+
+    workers = [
+        _Worker(endpoint, mix, symbols, seed + i, timeout_ms, validate) for i in range(clients)
+    ]
+    start = threading.Barrier(clients + 1)
+    deadline = [0.0]
+    threads = [threading.Thread(target=w.run, args=(start, deadline)) for w in workers]
+    stop_events = threading.Event()
+    events = [0]
+    event_thread = threading.Thread(target=_count_events, args=(event_address, stop_events, events))
+
+    event_thread.start()
+    for thread in threads:
+        thread.start()
+    began = time.perf_counter()
+    deadline[0] = began + duration
+    start.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    stop_events.set()
+    event_thread.join()
+
+    report = LoadTestReport(duration=elapsed, clients=clients, events=events[0])
+    for worker in workers:
+        for method, samples in worker.samples.items():
+            histogram = report.latency.setdefault(method, Histogram(max_samples=SAMPLE_LIMIT))
+            for sample in samples:
+                histogram.observe(sample)
+                report.overall.observe(sample)
+        for method, count in worker.errors.items():
+            report.errors[method] = report.errors.get(method, 0) + count
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="키움 IPC 부하 테스트")
+    parser.add_argument("--endpoint", help="서버 주소. 생략하면 모의 백엔드 서버를 실행합니다.")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--symbols", default="005930,000660,035720")
+    parser.add_argument("--ticks", type=int, default=200_000, help="재생할 합성 틱 수")
+    parser.add_argument("--speed", type=float, default=10.0, help="틱 재생 배속")
+    parser.add_argument("--fill-latency-ms", type=float, default=20.0)
+    parser.add_argument("--slippage-bps", type=float, default=5.0)
+    parser.add_argument("--tr-limit", type=int, default=0, help="1초당 TR 제한 (0: 제한 없음)")
+    parser.add_argument("--no-validate", action="store_true", help="메시지 검증 생략")
+    args = parser.parse_args()
+
+    # 요청마다 남는 INFO 로그가 측정값을 왜곡하지 않도록 경고 이상만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    symbols = args.symbols.split(",")
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        backend = SimulatorBackend(
+            synthetic_ticks(symbols, count=args.ticks),
+            initial_cash=Decimal("1000000000000"),
+            fill_latency_ms=args.fill_latency_ms,
+            slippage_bps=args.slippage_bps,
+            speed=args.speed,
+            tr_limit=args.tr_limit or None,
+            order_limit=args.tr_limit or None,
+        )
+        server = KiwoomServer(
+            bind_address="tcp://127.0.0.1:*",
+            event_address="tcp://127.0.0.1:*",
+            validate=not args.no_validate,
+            backend=backend,
+        )
+        thread = server.start_thread()
+        endpoint = server.endpoint
+
+    try:
+        report = run_load_test(
+            endpoint,
+            clients=args.clients,
+            duration=args.duration,
+            symbols=symbols,
+            validate=not args.no_validate,
+        )
+        print(report.format())
+    finally:
+        if server is not None:
+            server.stop()
+            thread.join()
+
+
+if __name__ == "__main__":
+    main()
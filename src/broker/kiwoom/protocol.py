@@ -0,0 +1,196 @@
+"""키움 IPC 프로토콜.
+
+클라이언트(64비트)와 서버(32비트)가 공유하는 메시지 포맷과 직렬화 함수입니다.
+요청/응답은 REQ-ROUTER 소켓으로, 체결/잔고 이벤트는 PUB-SUB 소켓으로 주고받습니다.
+메시지는 `__slots__` 데이터클래스로 정의하고, 검증 함수는 모듈 로드 시
+한 번만 만들어 재사용합니다. 신뢰할 수 있는 로컬호스트 링크에서는
+`validate=False`로 검증을 생략할 수 있습니다.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_decode = json.JSONDecoder().decode
+
+_NoneType = type(None)
+
+# 계좌 이벤트 토픽 (번호가 연속으로 매겨짐). 그 외 토픽(시세 "tick")은 번호를 따로 매김
+ACCOUNT_TOPICS = ("fill", "position", "balance")
+
+
+class ProtocolError(ValueError):
+    """IPC 메시지 형식 오류."""
+
+    pass
+
+
+@dataclass(slots=True)
+class IPCMessage:
+    """IPC 메시지 포맷."""
+
+    method: str
+    params: dict[str, Any] = field(default_factory=dict)
+    request_id: str | None = None
+
+    def to_json(self) -> str:
+        """JSON 문자열로 직렬화합니다."""
+        return _encode(
+            {"method": self.method, "params": self.params, "request_id": self.request_id}
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes, validate: bool = True) -> "IPCMessage":
+        """JSON 문자열에서 메시지를 생성합니다.
+
+        Args:
+            raw: JSON 문자열.
+            validate: 필드 타입 검증 여부. False면 필드 타입을 검사하지 않고 바로 생성합니다.
+        """
+        obj = _loads(raw)
+        if validate:
+            return _validate_message(obj)
+        try:
+            return cls(obj["method"], obj.get("params") or {}, obj.get("request_id"))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ProtocolError(f"메시지 형식 오류: {e!r}") from e
+
+
+@dataclass(slots=True)
+class IPCResponse:
+    """IPC 응답 포맷."""
+
+    success: bool
+    data: Any = None
+    error: str | None = None
+    request_id: str | None = None
+
+    def to_json(self) -> str:
+        """JSON 문자열로 직렬화합니다."""
+        return _encode(
+            {
+                "success": self.success,
+                "data": self.data,
+                "error": self.error,
+                "request_id": self.request_id,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes, validate: bool = True) -> "IPCResponse":
+        """JSON 문자열에서 응답을 생성합니다.
+
+        Args:
+            raw: JSON 문자열.
+            validate: 필드 타입 검증 여부. False면 필드 타입을 검사하지 않고 바로 생성합니다.
+        """
+        obj = _loads(raw)
+        if validate:
+            return _validate_response(obj)
+        try:
+            return cls(obj["success"], obj.get("data"), obj.get("error"), obj.get("request_id"))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ProtocolError(f"메시지 형식 오류: {e!r}") from e
+
+
+@dataclass(slots=True)
+class IPCEvent:
+    """서버가 발행하는 계좌 이벤트 포맷.
+
+    `seq`는 서버 인스턴스(`epoch`)마다 계좌 이벤트와 시세 이벤트 각각 1부터 연속으로
+    증가하므로, 수신 측에서 누락된 이벤트나 서버 재시작을 감지할 수 있습니다.
+    """
+
+    topic: str  # "fill" | "position" | "balance" | "tick"
+    seq: int
+    epoch: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """JSON 문자열로 직렬화합니다."""
+        return _encode(
+            {"topic": self.topic, "seq": self.seq, "epoch": self.epoch, "data": self.data}
+        )
+
+    @classmethod
+    def from_json(cls, raw: str | bytes, validate: bool = True) -> "IPCEvent":
+        """JSON 문자열에서 이벤트를 생성합니다.
+
+        Args:
+            raw: JSON 문자열.
+            validate: 필드 타입 검증 여부. False면 필드 타입을 검사하지 않고 바로 생성합니다.
+        """
+        obj = _loads(raw)
+        if validate:
+            return _validate_event(obj)
+        try:
+            return cls(obj["topic"], obj["seq"], obj["epoch"], obj.get("data") or {})
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ProtocolError(f"메시지 형식 오류: {e!r}") from e
+
+
+def _loads(raw: str | bytes) -> Any:
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    try:
+        return _decode(raw)
+    except ValueError as e:
+        raise ProtocolError(f"JSON 파싱 실패: {e}") from e
+
+
+def _compile_validator(
+    cls: Callable[..., T],
+    schema: tuple[tuple[str, tuple[type, ...], bool, Any], ...],
+) -> Callable[[Any], T]:
+    """(필드명, 허용 타입, 필수 여부, 기본값) 스키마로 검증 함수를 만듭니다."""
+
+    def validate(obj: Any) -> T:
+        if not isinstance(obj, dict):
+            raise ProtocolError(f"JSON 객체가 필요합니다: {type(obj).__name__}")
+        values = []
+        for name, types, required, default in schema:
+            if name in obj:
+                value = obj[name]
+                if types and not isinstance(value, types):
+                    raise ProtocolError(f"'{name}' 필드 타입 오류: {type(value).__name__}")
+            elif required:
+                raise ProtocolError(f"필수 필드 누락: '{name}'")
+            else:
+                value = default() if callable(default) else default
+            values.append(value)
+        return cls(*values)
+
+    return validate
+
+
+# 모듈 로드 시 한 번만 생성되는 검증 함수
+_validate_message = _compile_validator(
+    IPCMessage,
+    (
+        ("method", (str,), True, None),
+        ("params", (dict,), False, dict),
+        ("request_id", (str, _NoneType), False, None),
+    ),
+)
+_validate_response = _compile_validator(
+    IPCResponse,
+    (
+        ("success", (bool,), True, None),
+        ("data", (), False, None),
+        ("error", (str, _NoneType), False, None),
+        ("request_id", (str, _NoneType), False, None),
+    ),
+)
+_validate_event = _compile_validator(
+    IPCEvent,
+    (
+        ("topic", (str,), True, None),
+        ("seq", (int,), True, None),
+        ("epoch", (str,), True, None),
+        ("data", (dict,), False, dict),
+    ),
+)
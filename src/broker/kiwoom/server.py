@@ -3,110 +3,372 @@
 32비트 Python에서 실행되며, 64비트 메인 프로세스와 ZeroMQ로 통신합니다.
 키움 OpenAPI+는 32비트 COM 객체이므로 반드시 32비트 Python에서 실행해야 합니다.
 
+서버는 Qt 이벤트 루프 위에서 동작합니다. ZeroMQ 소켓의 파일 디스크립터를
+QSocketNotifier로 감시하여 요청이 도착하는 즉시 처리하고, TR 조회처럼
+키움 이벤트(OnReceiveTrData 등)로 결과가 오는 요청은 request_id로 추적하다가
+이벤트 콜백에서 응답합니다. 따라서 여러 요청이 동시에 진행될 수 있습니다.
+응답 이벤트가 오지 않는 TR은 제한 시간이 지나면 실패 응답을 보내고 화면번호를
+반환하며, OnReceiveMsg로 오류 메시지가 오면 해당 요청을 바로 실패 처리합니다.
+체결/잔고 변동(OnReceiveChejanData)은 PUB 소켓으로 발행하여 클라이언트의
+계좌 캐시(AccountCache)가 조회 요청 없이 갱신되도록 합니다.
+QApplication이 없으면 ZeroMQ poll 루프로 동작합니다 (키움 OCX 없이 테스트용).
+키움 OCX 대신 백엔드(예: simulator.SimulatorBackend)를 지정하면 요청을 백엔드에 위임합니다.
+
 실행 방법:
     .venv-kiwoom-32\\Scripts\\python.exe -m src.broker.kiwoom.server
 """
 
-import json
 import os
 import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
-from typing import Any
+from typing import Any, Protocol
 
 import zmq
 from dotenv import load_dotenv
 from loguru import logger
-from pydantic import BaseModel
 
-# PyQt5는 키움 API 이벤트 루프에 필요
-from PyQt5.QtWidgets import QApplication
+from src.broker.kiwoom.protocol import ACCOUNT_TOPICS, IPCEvent, IPCMessage, IPCResponse
 
 load_dotenv()
 
 # 서버 설정
 DEFAULT_PORT = 5555
 BIND_ADDRESS = f"tcp://127.0.0.1:{os.getenv('KIWOOM_IPC_PORT', DEFAULT_PORT)}"
+DEFAULT_EVENT_PORT = 5556
+EVENT_ADDRESS = f"tcp://127.0.0.1:{os.getenv('KIWOOM_EVENT_PORT', DEFAULT_EVENT_PORT)}"
+
+# 키움 OpenAPI+ 설정
+KIWOOM_PROG_ID = "KHOPENAPI.KHOpenAPICtrl.1"
+SCREEN_NO_START = 1000
+SCREEN_NO_COUNT = 100  # 동시에 진행 가능한 TR 수 (키움 화면번호 최대 200개)
+TR_TIMEOUT = 30.0  # TR 응답 제한 시간 (초)
+# OnReceiveMsg 메시지 중 요청 실패로 처리할 키워드
+TR_ERROR_KEYWORDS = ("오류", "실패", "제한", "초과", "불가")
+
+# OnReceiveChejanData FID
+FID_ORDER_NO = 9203  # 주문번호
+FID_SYMBOL = 9001  # 종목코드
+FID_SIDE = 907  # 매도수구분 (1: 매도, 2: 매수)
+FID_FILL_PRICE = 914  # 단위체결가
+FID_FILL_QUANTITY = 915  # 단위체결량
+FID_CURRENT_PRICE = 10  # 현재가
+FID_HOLDING_QUANTITY = 930  # 보유수량
+FID_AVG_PRICE = 931  # 매입단가
+FID_DEPOSIT = 951  # 예수금
+
+# 응답을 이벤트 콜백에서 보내는 요청임을 나타내는 핸들러 반환값
+DEFERRED = object()
+
+
+def create_kiwoom_ocx() -> Any:
+    """키움 OpenAPI+ OCX 컨트롤을 생성합니다 (Windows 32비트 전용)."""
+    from PyQt5.QAxContainer import QAxWidget
 
+    return QAxWidget(KIWOOM_PROG_ID)
 
-class IPCMessage(BaseModel):
-    """IPC 메시지 포맷."""
 
+def _to_int(value: str) -> int:
+    """키움 숫자 문자열("000123", "+70000", "-1500")을 정수로 변환합니다."""
+    value = value.strip()
+    return int(value) if value else 0
+
+
+@dataclass
+class PendingRequest:
+    """키움 이벤트를 기다리는 요청."""
+
+    identity: bytes  # ZeroMQ ROUTER 클라이언트 식별자
+    request_id: str
     method: str
-    params: dict[str, Any] = {}
-    request_id: str | None = None
+    screen_no: str | None = None
+    parse: Callable[[str, str], Any] | None = None  # (tr_code, rq_name) -> 응답 데이터
+    deadline: float | None = None  # 응답 제한 시각 (time.monotonic 기준)
+
+
+class KiwoomBackend(Protocol):
+    """키움 OCX 대신 요청을 처리하는 백엔드 (모의 거래, 재생 등).
 
+    핸들러 메서드는 요청 파라미터를 받아 응답 데이터를 반환합니다.
+    모든 메서드는 서버 이벤트 루프 스레드에서 호출됩니다.
+    """
+
+    def attach(self, publish: Callable[[str, dict[str, Any]], int]) -> None:
+        """서버의 이벤트 발행 함수를 연결합니다."""
+        ...
+
+    def process(self) -> float | None:
+        """예정된 작업(체결, 시세 재생 등)을 처리하고 다음 호출까지의 시간(초)을 반환합니다."""
+        ...
+
+    def connect(self, params: dict) -> dict: ...
+
+    def get_balance(self, params: dict) -> dict: ...
+
+    def get_positions(self, params: dict) -> list: ...
 
-class IPCResponse(BaseModel):
-    """IPC 응답 포맷."""
+    def submit_order(self, params: dict) -> dict: ...
 
-    success: bool
-    data: Any = None
-    error: str | None = None
-    request_id: str | None = None
+    def cancel_order(self, params: dict) -> dict: ...
+
+    def get_historical_data(self, params: dict) -> list: ...
 
 
 class KiwoomServer:
     """키움 API 브로커 서버.
 
-    ZeroMQ REP 소켓으로 명령을 수신하고,
+    ZeroMQ ROUTER 소켓으로 명령을 수신하고,
     키움 OpenAPI+를 통해 실행 후 결과를 반환합니다.
+    체결/포지션/잔고 변동은 PUB 소켓으로 발행합니다.
     """
 
-    def __init__(self, bind_address: str = BIND_ADDRESS) -> None:
+    POLL_INTERVAL_MS = 100  # Qt 없이 실행할 때 poll 타임아웃 (중지 확인 주기)
+    EXPIRY_INTERVAL_MS = 1000  # Qt 이벤트 루프에서 TR 제한 시간을 확인하는 주기
+
+    def __init__(
+        self,
+        bind_address: str = BIND_ADDRESS,
+        validate: bool = True,
+        ocx: Any = None,
+        event_address: str = EVENT_ADDRESS,
+        backend: KiwoomBackend | None = None,
+        tr_timeout: float = TR_TIMEOUT,
+    ) -> None:
+        """
+        Args:
+            bind_address: 바인딩 주소 (기본: tcp://127.0.0.1:5555)
+            validate: 요청 메시지 검증 여부. 신뢰할 수 있는 로컬호스트 링크에서는 False로 생략 가능
+            ocx: 키움 OpenAPI+ OCX 컨트롤 (create_kiwoom_ocx()). None이면 모의 응답을 반환합니다.
+            event_address: 계좌 이벤트 발행 주소 (기본: tcp://127.0.0.1:5556)
+            backend: 요청을 처리할 백엔드. ocx와 함께 지정할 수 없습니다.
+            tr_timeout: TR 응답 제한 시간 (초). 지나면 실패 응답을 보내고 화면번호를 반환합니다.
+        """
+        if ocx is not None and backend is not None:
+            raise ValueError("ocx와 backend는 함께 지정할 수 없습니다")
         self.bind_address = bind_address
+        self.event_address = event_address
+        self.validate = validate
+        self.tr_timeout = tr_timeout
         self._context: zmq.Context | None = None
         self._socket: zmq.Socket | None = None
-        self._kiwoom: Any = None  # TODO: KiwoomAPI 인스턴스
+        self._pub: zmq.Socket | None = None
+        self._epoch = uuid.uuid4().hex
+        self._event_seq = 0  # 계좌 이벤트 번호
+        self._market_seq = 0  # 시세 이벤트 번호
+        self._backend = backend
+        self._backend_timer: Any = None
+        self._expiry_timer: Any = None
+        self._loop_thread: threading.Thread | None = None
+        self._notifier: Any = None
+        self._kiwoom: Any = ocx
         self._running = False
-
-    def start(self) -> None:
-        """서버를 시작합니다."""
+        self._processing = False
+        self._current: PendingRequest | None = None
+        self._pending: dict[str, PendingRequest] = {}
+        self._free_screens = [str(SCREEN_NO_START + i) for i in range(SCREEN_NO_COUNT)]
+        self._account = os.getenv("KIWOOM_ACCOUNT", "")
+
+        if self._kiwoom is not None:
+            self._kiwoom.OnEventConnect.connect(self._on_event_connect)
+            self._kiwoom.OnReceiveTrData.connect(self._on_receive_tr_data)
+            self._kiwoom.OnReceiveMsg.connect(self._on_receive_msg)
+            self._kiwoom.OnReceiveChejanData.connect(self._on_receive_chejan_data)
+
+    @property
+    def endpoint(self) -> str:
+        """실제 바인딩된 주소 (포트를 *로 지정한 경우 할당된 포트 포함)."""
+        if self._socket is None:
+            return self.bind_address
+        return self._socket.getsockopt_string(zmq.LAST_ENDPOINT)
+
+    @property
+    def event_endpoint(self) -> str:
+        """실제 바인딩된 이벤트 발행 주소."""
+        if self._pub is None:
+            return self.event_address
+        return self._pub.getsockopt_string(zmq.LAST_ENDPOINT)
+
+    @property
+    def pending_count(self) -> int:
+        """키움 이벤트를 기다리는 요청 수."""
+        return len(self._pending)
+
+    def start(self, block: bool = True, use_qt: bool | None = None) -> None:
+        """서버를 시작합니다.
+
+        QApplication이 있으면 Qt 이벤트 루프에 소켓을 등록하고, 없으면 poll 루프로 동작합니다.
+
+        Args:
+            block: True면 이벤트 루프를 실행하고 종료될 때까지 반환하지 않습니다.
+                False면 소켓만 등록합니다 (이미 실행 중인 Qt 루프에 붙일 때).
+            use_qt: Qt 이벤트 루프 사용 여부. None이면 QApplication 존재 여부로 결정합니다.
+        """
         logger.info(f"키움 브로커 서버 시작: {self.bind_address}")
 
         self._context = zmq.Context()
-        self._socket = self._context.socket(zmq.REP)
+        self._socket = self._context.socket(zmq.ROUTER)
+        self._socket.setsockopt(zmq.LINGER, 0)
         self._socket.bind(self.bind_address)
-
-        # TODO: 키움 API 초기화
-        # self._kiwoom = KiwoomAPI()
-        # self._kiwoom.connect()
-
+        self._pub = self._context.socket(zmq.PUB)
+        self._pub.setsockopt(zmq.LINGER, 0)
+        self._pub.bind(self.event_address)
         self._running = True
+        if self._backend is not None:
+            self._backend.attach(self.publish)
+
+        app = self._qt_application() if use_qt is not False else None
+        if use_qt and app is None:
+            raise RuntimeError("QApplication이 생성되지 않았습니다")
+        if app is not None:
+            from PyQt5.QtCore import QSocketNotifier, QTimer
+
+            fd = self._socket.getsockopt(zmq.FD)
+            self._notifier = QSocketNotifier(fd, QSocketNotifier.Read)
+            self._notifier.activated.connect(self._process_events)
+            if self._kiwoom is not None:
+                self._expiry_timer = QTimer()
+                self._expiry_timer.timeout.connect(self._expire_pending)
+                self._expiry_timer.start(
+                    max(1, min(self.EXPIRY_INTERVAL_MS, int(self.tr_timeout * 1000)))
+                )
+            if self._backend is not None:
+                self._backend_timer = QTimer()
+                self._backend_timer.setSingleShot(True)
+                self._backend_timer.timeout.connect(self._process_backend)
+            logger.info("서버 준비 완료 (Qt 이벤트 루프), 요청 대기 중...")
+            # 알림 등록 전에 도착한 메시지 처리 (ZeroMQ FD는 엣지 트리거)
+            self._process_events()
+            if block:
+                app.exec_()
+                self.stop()
+            return
+
         logger.info("서버 준비 완료, 요청 대기 중...")
+        if block:
+            self._run_loop()
 
-        self._run_loop()
+    def start_thread(self) -> threading.Thread:
+        """poll 루프를 백그라운드 스레드에서 실행합니다 (Qt 없이 모의 백엔드로 실행할 때).
+
+        소켓은 호출한 스레드에서 바인딩하므로 반환 즉시 접속할 수 있습니다.
+        종료하려면 stop()을 호출한 뒤 스레드를 join하세요.
+        """
+        self.start(block=False, use_qt=False)
+        self._loop_thread = threading.Thread(target=self._run_loop, name="kiwoom-server")
+        self._loop_thread.start()
+        return self._loop_thread
 
     def stop(self) -> None:
         """서버를 중지합니다."""
+        if not self._running:
+            return
         self._running = False
+        if self._loop_thread is not None and self._loop_thread is not threading.current_thread():
+            # 소켓은 루프 스레드가 다음 poll 주기에 정리
+            return
+        self._close()
+
+    def _close(self) -> None:
+        if self._expiry_timer is not None:
+            self._expiry_timer.stop()
+            self._expiry_timer = None
+        if self._backend_timer is not None:
+            self._backend_timer.stop()
+            self._backend_timer = None
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
         if self._socket:
             self._socket.close()
+            self._socket = None
+        if self._pub:
+            self._pub.close()
+            self._pub = None
         if self._context:
             self._context.term()
+            self._context = None
+        self._pending.clear()
         logger.info("서버 종료")
 
+    @staticmethod
+    def _qt_application() -> Any:
+        """실행 중인 QApplication 인스턴스 (없거나 PyQt5 미설치 시 None)."""
+        try:
+            from PyQt5.QtCore import QCoreApplication
+        except ImportError:
+            return None
+        return QCoreApplication.instance()
+
     def _run_loop(self) -> None:
-        """메인 이벤트 루프."""
+        """Qt 없이 실행할 때의 이벤트 루프."""
         while self._running:
             try:
-                # 요청 수신 (타임아웃 1초)
-                if self._socket.poll(1000):
-                    message = self._socket.recv_string()
-                    response = self._handle_request(message)
-                    self._socket.send_string(response)
+                timeout = self.POLL_INTERVAL_MS
+                if self._backend is not None:
+                    delay = self._backend.process()
+                    if delay is not None:
+                        timeout = min(timeout, int(delay * 1000))
+                if self._socket.poll(timeout):
+                    self._process_events()
+                self._expire_pending()
             except zmq.ZMQError as e:
+                if not self._running:
+                    break
                 logger.error(f"ZMQ 오류: {e}")
             except KeyboardInterrupt:
                 logger.info("키보드 인터럽트 수신")
                 break
 
-        self.stop()
-
-    def _handle_request(self, raw_message: str) -> str:
-        """요청을 처리하고 응답을 반환합니다."""
+        self._running = False
+        self._close()
+
+    def _process_backend(self) -> None:
+        """Qt 타이머 콜백: 백엔드 예약 작업을 처리하고 다음 호출을 예약합니다."""
+        if self._backend is None or self._backend_timer is None:
+            return
+        delay = self._backend.process()
+        if delay is not None:
+            self._backend_timer.start(int(delay * 1000))
+
+    def _process_events(self, *_: Any) -> None:
+        """수신 대기 중인 요청을 모두 처리합니다."""
+        if self._processing or self._socket is None:
+            return
+        self._processing = True
+        try:
+            # ZeroMQ FD 알림은 엣지 트리거이므로 POLLIN이 사라질 때까지 읽어야 함
+            while self._socket is not None and self._socket.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                frames = self._socket.recv_multipart(zmq.NOBLOCK)
+                identity, payload = frames[0], frames[-1]
+                response = self._handle_request(payload.decode("utf-8"), identity)
+                if response is not None:
+                    self._send(identity, response)
+        except zmq.Again:
+            pass
+        except zmq.ZMQError as e:
+            logger.error(f"ZMQ 오류: {e}")
+        finally:
+            self._processing = False
+            # 새 주문 등으로 백엔드 일정이 바뀌었을 수 있음
+            if self._backend_timer is not None:
+                self._process_backend()
+
+    def _send(self, identity: bytes, response: str) -> None:
+        """ROUTER 소켓으로 응답을 보냅니다 (REQ 클라이언트용 빈 구분 프레임 포함)."""
+        if self._socket is None:
+            return
+        self._socket.send_multipart([identity, b"", response.encode("utf-8")])
+
+    def _handle_request(self, raw_message: str, identity: bytes = b"") -> str | None:
+        """요청을 처리하고 응답을 반환합니다. 응답이 나중에 전송되는 경우 None."""
+        request_id = None
         try:
-            msg = IPCMessage.model_validate_json(raw_message)
+            msg = IPCMessage.from_json(raw_message, validate=self.validate)
+            request_id = msg.request_id
             logger.debug(f"요청 수신: {msg.method}")
 
             # 메서드 라우팅
@@ -116,21 +378,287 @@ class KiwoomServer:
                     success=False,
                     error=f"알 수 없는 메서드: {msg.method}",
                     request_id=msg.request_id,
-                ).model_dump_json()
+                ).to_json()
 
-            result = handler(msg.params)
+            self._current = PendingRequest(
+                identity=identity,
+                request_id=msg.request_id or uuid.uuid4().hex,
+                method=msg.method,
+            )
+            try:
+                result = handler(msg.params)
+            finally:
+                self._current = None
+
+            if result is DEFERRED:
+                return None
             return IPCResponse(
                 success=True,
                 data=result,
                 request_id=msg.request_id,
-            ).model_dump_json()
+            ).to_json()
 
         except Exception as e:
             logger.exception(f"요청 처리 오류: {e}")
             return IPCResponse(
                 success=False,
                 error=str(e),
-            ).model_dump_json()
+                request_id=request_id,
+            ).to_json()
+
+    def publish(self, topic: str, data: dict[str, Any]) -> int:
+        """이벤트를 발행하고 이벤트 번호를 반환합니다.
+
+        계좌 이벤트와 시세 이벤트는 번호를 따로 매기므로, 계좌 이벤트만 구독하는
+        클라이언트도 번호로 누락을 감지할 수 있습니다.
+
+        Args:
+            topic: 계좌 이벤트 "fill" (체결), "position" (포지션 변동), "balance" (예수금 변동)
+                또는 시세 이벤트 "tick".
+            data: 이벤트 데이터. position/balance는 변동 후의 전체 상태를 담습니다.
+        """
+        if topic in ACCOUNT_TOPICS:
+            self._event_seq += 1
+            seq = self._event_seq
+        else:
+            self._market_seq += 1
+            seq = self._market_seq
+        if self._pub is not None:
+            event = IPCEvent(topic=topic, seq=seq, epoch=self._epoch, data=data)
+            self._pub.send_multipart([topic.encode("utf-8"), event.to_json().encode("utf-8")])
+        return seq
+
+    # === 비동기 요청 추적 ===
+
+    def _defer(
+        self,
+        key: str,
+        parse: Callable[[str, str], Any] | None = None,
+        timeout: float | None = None,
+    ) -> PendingRequest:
+        """현재 요청을 이벤트 대기 상태로 등록합니다.
+
+        Args:
+            key: 응답 이벤트에서 요청을 찾을 키.
+            parse: 응답 데이터 변환 함수.
+            timeout: 응답 제한 시간 (초). None이면 제한 없음 (로그인 창 대기 등).
+
+        Raises:
+            ValueError: 같은 키의 요청이 이미 대기 중인 경우 (앞선 요청은 그대로 유지).
+        """
+        if self._current is None:
+            raise RuntimeError("요청 처리 중이 아닙니다")
+        if key in self._pending:
+            raise ValueError(f"같은 요청 ID가 이미 처리 중입니다: {key}")
+        pending = self._current
+        pending.parse = parse
+        if timeout is not None:
+            pending.deadline = time.monotonic() + timeout
+        self._pending[key] = pending
+        return pending
+
+    def _expire_pending(self) -> None:
+        """제한 시간이 지난 요청에 실패 응답을 보냅니다.
+
+        응답을 보내면 ZeroMQ FD 알림이 소모될 수 있으므로 OCX 콜백과 마찬가지로 수신
+        대기 중인 요청을 다시 처리합니다.
+        """
+        if not self._pending:
+            return
+        now = time.monotonic()
+        expired = [
+            key
+            for key, pending in self._pending.items()
+            if pending.deadline is not None and pending.deadline <= now
+        ]
+        for key in expired:
+            logger.warning(f"TR 응답 시간 초과: {key}")
+            self._fail(key, f"TR 응답 시간 초과 ({self.tr_timeout}초)")
+        if expired:
+            self._process_events()
+
+    def _complete(self, key: str, data: Any) -> None:
+        """대기 중인 요청에 성공 응답을 보냅니다."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        self._release_screen(pending)
+        self._send(
+            pending.identity,
+            IPCResponse(success=True, data=data, request_id=pending.request_id).to_json(),
+        )
+
+    def _fail(self, key: str, error: str) -> None:
+        """대기 중인 요청에 실패 응답을 보냅니다."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        self._release_screen(pending)
+        self._send(
+            pending.identity,
+            IPCResponse(success=False, error=error, request_id=pending.request_id).to_json(),
+        )
+
+    def _acquire_screen(self) -> str:
+        if not self._free_screens:
+            raise RuntimeError("진행 중인 TR 요청이 너무 많습니다")
+        return self._free_screens.pop()
+
+    def _release_screen(self, pending: PendingRequest) -> None:
+        if pending.screen_no is not None:
+            self._free_screens.append(pending.screen_no)
+            pending.screen_no = None
+
+    def _call(self, signature: str, *args: Any) -> Any:
+        """OCX 메서드를 호출합니다."""
+        return self._kiwoom.dynamicCall(signature, list(args))
+
+    def _request_tr(
+        self,
+        tr_code: str,
+        inputs: dict[str, str],
+        parse: Callable[[str, str], Any],
+    ) -> object:
+        """TR 조회를 요청하고, OnReceiveTrData 이벤트에서 응답하도록 등록합니다.
+
+        request_id를 rqname으로 사용하여 동시에 진행 중인 여러 TR을 구분합니다.
+        """
+        pending = self._defer(self._current.request_id, parse, self.tr_timeout)
+        pending.screen_no = self._acquire_screen()
+        for key, value in inputs.items():
+            self._call("SetInputValue(QString, QString)", key, value)
+        ret = self._call(
+            "CommRqData(QString, QString, int, QString)",
+            pending.request_id,
+            tr_code,
+            0,
+            pending.screen_no,
+        )
+        if ret != 0:
+            self._pending.pop(pending.request_id, None)
+            self._release_screen(pending)
+            raise RuntimeError(f"TR 요청 실패: {tr_code} (오류 코드 {ret})")
+        return DEFERRED
+
+    def _comm_data(self, tr_code: str, rq_name: str, index: int, item: str) -> str:
+        value = self._call(
+            "GetCommData(QString, QString, int, QString)", tr_code, rq_name, index, item
+        )
+        return str(value).strip()
+
+    # === 키움 이벤트 콜백 ===
+
+    def _on_event_connect(self, err_code: int) -> None:
+        """로그인 결과 이벤트."""
+        connected = err_code == 0
+        logger.info(f"키움 API 로그인 결과: {err_code}")
+        for key in [k for k, p in self._pending.items() if p.method == "connect"]:
+            if connected:
+                self._complete(key, {"connected": True})
+            else:
+                self._fail(key, f"로그인 실패 (오류 코드 {err_code})")
+        self._process_events()
+
+    def _on_receive_tr_data(self, screen_no: str, rq_name: str, tr_code: str, *args: Any) -> None:
+        """TR 조회 결과 이벤트."""
+        pending = self._pending.get(rq_name)
+        if pending is None:
+            return
+        try:
+            data = pending.parse(tr_code, rq_name) if pending.parse else None
+        except Exception as e:
+            logger.exception(f"TR 응답 처리 오류: {e}")
+            self._fail(rq_name, str(e))
+        else:
+            self._complete(rq_name, data)
+        # 응답 전송으로 소켓 상태가 바뀌었을 수 있으므로 대기 중인 요청 확인
+        self._process_events()
+
+    def _on_receive_msg(self, screen_no: str, rq_name: str, tr_code: str, msg: str) -> None:
+        """서버 메시지 이벤트. 대기 중인 TR의 오류 메시지면 요청을 실패 처리합니다."""
+        logger.debug(f"키움 메시지 [{rq_name}/{tr_code}]: {msg}")
+        if rq_name not in self._pending or not any(k in msg for k in TR_ERROR_KEYWORDS):
+            return
+        self._fail(rq_name, f"TR 요청 실패: {tr_code} ({msg.strip()})")
+        self._process_events()
+
+    def _on_receive_chejan_data(self, gubun: str, item_cnt: int, fid_list: str) -> None:
+        """체결/잔고 이벤트. 클라이언트 계좌 캐시로 발행합니다."""
+        symbol = self._chejan(FID_SYMBOL).lstrip("A")
+        if gubun == "0":
+            # 주문 접수/확인 통보에는 체결량이 없음
+            quantity = _to_int(self._chejan(FID_FILL_QUANTITY))
+            if quantity == 0:
+                return
+            self.publish(
+                "fill",
+                {
+                    "order_id": self._chejan(FID_ORDER_NO),
+                    "symbol": symbol,
+                    "side": "sell" if self._chejan(FID_SIDE) == "1" else "buy",
+                    "quantity": quantity,
+                    "price": str(abs(_to_int(self._chejan(FID_FILL_PRICE)))),
+                },
+            )
+        elif gubun == "1":
+            self.publish(
+                "position",
+                {
+                    "symbol": symbol,
+                    "quantity": _to_int(self._chejan(FID_HOLDING_QUANTITY)),
+                    "avg_price": str(abs(_to_int(self._chejan(FID_AVG_PRICE)))),
+                    "current_price": str(abs(_to_int(self._chejan(FID_CURRENT_PRICE)))),
+                },
+            )
+            self.publish("balance", {"balance": str(_to_int(self._chejan(FID_DEPOSIT)))})
+
+    def _chejan(self, fid: int) -> str:
+        return str(self._call("GetChejanData(int)", fid)).strip()
+
+    # === TR 응답 파서 ===
+
+    def _parse_balance(self, tr_code: str, rq_name: str) -> dict:
+        deposit = _to_int(self._comm_data(tr_code, rq_name, 0, "예수금"))
+        return {"balance": str(deposit), "currency": "KRW"}
+
+    def _parse_positions(self, tr_code: str, rq_name: str) -> list:
+        count = self._call("GetRepeatCnt(QString, QString)", tr_code, rq_name)
+        positions = []
+        for i in range(count):
+            symbol = self._comm_data(tr_code, rq_name, i, "종목번호").lstrip("A")
+            positions.append(
+                {
+                    "symbol": symbol,
+                    "quantity": _to_int(self._comm_data(tr_code, rq_name, i, "보유수량")),
+                    "avg_price": str(abs(_to_int(self._comm_data(tr_code, rq_name, i, "매입가")))),
+                    "current_price": str(
+                        abs(_to_int(self._comm_data(tr_code, rq_name, i, "현재가")))
+                    ),
+                    "unrealized_pnl": str(
+                        _to_int(self._comm_data(tr_code, rq_name, i, "평가손익"))
+                    ),
+                }
+            )
+        return positions
+
+    def _parse_daily_candles(self, tr_code: str, rq_name: str) -> list:
+        count = self._call("GetRepeatCnt(QString, QString)", tr_code, rq_name)
+        candles = []
+        for i in range(count):
+            day = datetime.strptime(self._comm_data(tr_code, rq_name, i, "일자"), "%Y%m%d")
+            candles.append(
+                {
+                    "timestamp": day.isoformat(),
+                    "open": str(abs(_to_int(self._comm_data(tr_code, rq_name, i, "시가")))),
+                    "high": str(abs(_to_int(self._comm_data(tr_code, rq_name, i, "고가")))),
+                    "low": str(abs(_to_int(self._comm_data(tr_code, rq_name, i, "저가")))),
+                    "close": str(abs(_to_int(self._comm_data(tr_code, rq_name, i, "현재가")))),
+                    "volume": _to_int(self._comm_data(tr_code, rq_name, i, "거래량")),
+                }
+            )
+        # 키움은 최신순으로 반환
+        candles.reverse()
+        return candles
 
     # === 핸들러 메서드 ===
 
@@ -138,64 +666,123 @@ class KiwoomServer:
         """연결 테스트."""
         return {"pong": True, "timestamp": datetime.now().isoformat()}
 
-    def _handle_connect(self, params: dict) -> dict:
+    def _handle_get_event_info(self, params: dict) -> dict:
+        """계좌 이벤트 발행 주소와 마지막 이벤트 번호."""
+        return {"address": self.event_endpoint, "epoch": self._epoch, "seq": self._event_seq}
+
+    def _handle_connect(self, params: dict) -> Any:
         """키움 API 연결."""
-        # TODO: 실제 키움 API 연결 구현
         logger.info("키움 API 연결 요청")
-        return {"connected": True}
+        if self._backend is not None:
+            return self._backend.connect(params)
+        if self._kiwoom is None:
+            return {"connected": True}
+        if self._call("GetConnectState()") == 1:
+            return {"connected": True}
+        self._defer(self._current.request_id)
+        self._call("CommConnect()")
+        return DEFERRED
 
     def _handle_disconnect(self, params: dict) -> dict:
         """키움 API 연결 해제."""
-        # TODO: 실제 키움 API 연결 해제 구현
+        # 키움 API는 명시적 로그아웃을 지원하지 않음 (프로세스 종료 시 해제)
         logger.info("키움 API 연결 해제 요청")
         return {"disconnected": True}
 
-    def _handle_get_balance(self, params: dict) -> dict:
+    def _handle_get_balance(self, params: dict) -> Any:
         """계좌 잔고 조회."""
-        # TODO: 실제 구현
         logger.info("잔고 조회 요청")
-        return {"balance": "0", "currency": "KRW"}
-
-    def _handle_get_positions(self, params: dict) -> list:
+        if self._backend is not None:
+            return self._backend.get_balance(params)
+        if self._kiwoom is None:
+            return {"balance": "0", "currency": "KRW"}
+        return self._request_tr(
+            "opw00001",
+            {
+                "계좌번호": params.get("account", self._account),
+                "비밀번호": "",
+                "비밀번호입력매체구분": "00",
+                "조회구분": "2",
+            },
+            self._parse_balance,
+        )
+
+    def _handle_get_positions(self, params: dict) -> Any:
         """보유 포지션 조회."""
-        # TODO: 실제 구현
         logger.info("포지션 조회 요청")
-        return []
+        if self._backend is not None:
+            return self._backend.get_positions(params)
+        if self._kiwoom is None:
+            return []
+        return self._request_tr(
+            "opw00018",
+            {
+                "계좌번호": params.get("account", self._account),
+                "비밀번호": "",
+                "비밀번호입력매체구분": "00",
+                "조회구분": "2",
+            },
+            self._parse_positions,
+        )
 
     def _handle_submit_order(self, params: dict) -> dict:
         """주문 제출."""
-        # TODO: 실제 구현
         logger.info(f"주문 제출 요청: {params}")
+        if self._backend is not None:
+            return self._backend.submit_order(params)
+        # TODO: 실제 구현 (SendOrder + OnReceiveChejanData)
         return {"order_id": "MOCK_ORDER_ID", "status": "submitted"}
 
     def _handle_cancel_order(self, params: dict) -> dict:
         """주문 취소."""
         order_id = params.get("order_id")
-        # TODO: 실제 구현
         logger.info(f"주문 취소 요청: {order_id}")
+        if self._backend is not None:
+            return self._backend.cancel_order(params)
+        # TODO: 실제 구현
         return {"order_id": order_id, "cancelled": True}
 
-    def _handle_get_historical_data(self, params: dict) -> list:
+    def _handle_get_historical_data(self, params: dict) -> Any:
         """과거 시세 데이터 조회."""
         symbol = params.get("symbol")
         start_date = params.get("start_date")
         end_date = params.get("end_date")
         interval = params.get("interval", "1d")
-        # TODO: 실제 구현
         logger.info(f"시세 데이터 조회: {symbol} ({start_date} ~ {end_date})")
-        return []
+        if self._backend is not None:
+            return self._backend.get_historical_data(params)
+        if self._kiwoom is None:
+            return []
+        if interval != "1d":
+            raise ValueError(f"지원하지 않는 주기: {interval}")
+
+        start = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
+
+        def parse(tr_code: str, rq_name: str) -> list:
+            candles = self._parse_daily_candles(tr_code, rq_name)
+            return [c for c in candles if start <= datetime.fromisoformat(c["timestamp"]) <= end]
+
+        return self._request_tr(
+            "opt10081",
+            {"종목코드": symbol, "기준일자": end.strftime("%Y%m%d"), "수정주가구분": "1"},
+            parse,
+        )
 
 
 def main() -> None:
     """서버 메인 엔트리포인트."""
+    # PyQt5는 키움 API 이벤트 루프에 필요
+    from PyQt5.QtWidgets import QApplication
+
     # 32비트 Python 확인
     if sys.maxsize > 2**32:
         logger.warning("64비트 Python에서 실행 중입니다. 키움 API는 32비트 Python이 필요합니다.")
 
     # PyQt5 애플리케이션 (키움 API 이벤트 루프용)
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv)  # noqa: F841
 
-    server = KiwoomServer()
+    server = KiwoomServer(ocx=create_kiwoom_ocx())
 
     try:
         server.start()
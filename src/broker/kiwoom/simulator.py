@@ -0,0 +1,487 @@
+"""키움 서버 모의 백엔드.
+
+키움 OpenAPI+ 없이 `KiwoomServer`를 실행하기 위한 백엔드입니다. 기록된 틱/호가 데이터
+(CSV) 또는 합성 틱을 재생하며, 주문은 설정한 지연 시간 후 슬리피지를 반영해 체결하고,
+키움과 같은 방식으로 TR 조회 횟수를 제한합니다. 체결/포지션/잔고 변동은 실제 서버와
+같은 이벤트로 발행하므로 `AccountCache`와 함께 사용할 수 있습니다.
+
+Example:
+    ```python
+    backend = SimulatorBackend(synthetic_ticks(["005930", "000660"], count=100_000))
+    server = KiwoomServer(bind_address="tcp://127.0.0.1:*", backend=backend)
+    server.start_thread()
+    ```
+"""
+
+import csv
+import heapq
+import itertools
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+Publish = Callable[[str, dict[str, Any]], int]
+
+# 키움 조회 제한: 1초당 5회 (초과 시 OP_ERR_SISE_OVERFLOW)
+DEFAULT_TR_LIMIT = 5
+DEFAULT_ORDER_LIMIT = 5
+
+
+class TRLimitExceeded(RuntimeError):
+    """TR 조회 또는 주문 횟수 제한 초과."""
+
+    pass
+
+
+@dataclass(slots=True)
+class Tick:
+    """체결 틱 (호가 포함 가능)."""
+
+    timestamp: datetime
+    symbol: str
+    price: Decimal
+    volume: int
+    bid: Decimal | None = None  # 매수 1호가
+    ask: Decimal | None = None  # 매도 1호가
+
+
+@dataclass(slots=True)
+class SimOrder:
+    """모의 주문."""
+
+    order_id: str
+    symbol: str
+    side: str  # "buy" | "sell"
+    order_type: str  # "market" | "limit"
+    quantity: int
+    price: Decimal | None
+    active_at: float  # 체결 가능 시각 (백엔드 시계 기준, 초)
+
+
+@dataclass(slots=True)
+class SimPosition:
+    """모의 보유 포지션."""
+
+    quantity: int = 0
+    avg_price: Decimal = Decimal("0")
+
+
+def tick_size(price: Decimal) -> Decimal:
+    """유가증권시장 호가 가격 단위."""
+    if price < 2000:
+        return Decimal(1)
+    if price < 5000:
+        return Decimal(5)
+    if price < 20000:
+        return Decimal(10)
+    if price < 50000:
+        return Decimal(50)
+    if price < 200000:
+        return Decimal(100)
+    if price < 500000:
+        return Decimal(500)
+    return Decimal(1000)
+
+
+def round_to_tick(price: Decimal) -> Decimal:
+    """가격을 가장 가까운 호가 단위로 맞춥니다."""
+    unit = tick_size(price)
+    return (price / unit).quantize(Decimal(1), rounding=ROUND_HALF_UP) * unit
+
+
+def synthetic_ticks(
+    symbols: list[str],
+    count: int = 10_000,
+    start: datetime = datetime(2024, 1, 2, 9, 0),
+    interval: timedelta = timedelta(milliseconds=100),
+    start_price: Decimal = Decimal("50000"),
+    volatility: float = 0.0005,
+    seed: int = 0,
+) -> Iterator[Tick]:
+    """종목별 기하 랜덤워크로 합성 틱을 생성합니다.
+
+    Args:
+        symbols: 종목 코드 리스트. 종목을 번갈아 가며 틱을 생성합니다.
+        count: 생성할 전체 틱 수.
+        start: 첫 틱 시각.
+        interval: 틱 간격.
+        start_price: 시작 가격.
+        volatility: 틱당 수익률 표준편차.
+        seed: 난수 시드.
+    """
+    rng = random.Random(seed)
+    prices = {symbol: float(start_price) for symbol in symbols}
+    for i in range(count):
+        symbol = symbols[i % len(symbols)]
+        prices[symbol] *= math.exp(rng.gauss(0.0, volatility))
+        price = round_to_tick(Decimal(str(round(prices[symbol]))))
+        unit = tick_size(price)
+        yield Tick(
+            timestamp=start + interval * i,
+            symbol=symbol,
+            price=price,
+            volume=rng.randint(1, 1000),
+            bid=price - unit,
+            ask=price,
+        )
+
+
+def load_ticks_csv(path: str | Path) -> list[Tick]:
+    """기록된 틱 데이터를 읽습니다.
+
+    컬럼: timestamp, symbol, price, volume[, bid, ask]
+    """
+    ticks = []
+    with Path(path).open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            ticks.append(
+                Tick(
+                    timestamp=datetime.fromisoformat(row["timestamp"]),
+                    symbol=row["symbol"],
+                    price=Decimal(row["price"]),
+                    volume=int(row["volume"]),
+                    bid=Decimal(row["bid"]) if row.get("bid") else None,
+                    ask=Decimal(row["ask"]) if row.get("ask") else None,
+                )
+            )
+    return ticks
+
+
+class RateLimiter:
+    """구간 내 호출 횟수 제한 (슬라이딩 윈도우)."""
+
+    def __init__(self, limit: int, window: float = 1.0):
+        self.limit = limit
+        self.window = window
+        self._calls: deque[float] = deque()
+
+    def acquire(self, now: float) -> bool:
+        """호출 가능하면 기록하고 True, 제한을 넘으면 False."""
+        while self._calls and now - self._calls[0] >= self.window:
+            self._calls.popleft()
+        if len(self._calls) >= self.limit:
+            return False
+        self._calls.append(now)
+        return True
+
+
+class SimulatorBackend:
+    """틱 재생 기반 키움 모의 백엔드.
+
+    서버 이벤트 루프가 `process()`를 주기적으로 호출하면, 경과 시간만큼 틱을 재생하고
+    체결 시각이 된 주문을 체결합니다. 모든 메서드는 서버 스레드에서만 호출됩니다.
+    """
+
+    def __init__(
+        self,
+        ticks: Iterable[Tick],
+        initial_cash: Decimal = Decimal("100000000"),
+        fill_latency_ms: float = 50.0,
+        slippage_bps: float = 5.0,
+        commission_rate: Decimal = Decimal("0.00015"),
+        speed: float = 1.0,
+        tr_limit: int | None = DEFAULT_TR_LIMIT,
+        order_limit: int | None = DEFAULT_ORDER_LIMIT,
+        publish_ticks: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ticks: 재생할 틱. 시각 순으로 정렬합니다.
+            initial_cash: 초기 예수금.
+            fill_latency_ms: 주문 접수부터 체결 가능 시점까지의 지연 (밀리초).
+            slippage_bps: 시장가 체결 슬리피지 (bp). 매수는 높게, 매도는 낮게 체결됩니다.
+            commission_rate: 체결 금액 대비 수수료율.
+            speed: 재생 배속. 1.0이면 틱 시각 간격을 그대로 재생합니다.
+            tr_limit: 1초당 TR 조회 제한. None이면 제한 없음.
+            order_limit: 1초당 주문 제한. None이면 제한 없음.
+            publish_ticks: 재생한 틱을 "tick" 이벤트로 발행할지 여부.
+            clock: 단조 증가 시계 (초). 테스트에서 교체할 수 있습니다.
+        """
+        self.ticks = sorted(ticks, key=lambda t: t.timestamp)
+        self.cash = initial_cash
+        self.fill_latency = fill_latency_ms / 1000
+        self.slippage = Decimal(str(slippage_bps)) / Decimal(10000)
+        self.commission_rate = commission_rate
+        self.speed = speed
+        self.publish_ticks = publish_ticks
+        self.clock = clock
+        self.positions: dict[str, SimPosition] = {}
+        self.last: dict[str, Tick] = {}
+        self.orders: dict[str, SimOrder] = {}  # 미체결 주문
+        self._symbol_orders: dict[str, set[str]] = {}  # 종목별 미체결 주문번호
+        self._order_ids = itertools.count(1)
+        self._due: list[tuple[float, str]] = []  # (체결 가능 시각, 주문번호) 힙
+        self._daily: dict[str, list[tuple[datetime, dict[str, Any]]]] = {}
+        self._cursor = 0
+        self._started_at: float | None = None
+        self._publish: Publish = lambda topic, data: 0
+        self._tr_limiter = RateLimiter(tr_limit) if tr_limit else None
+        self._order_limiter = RateLimiter(order_limit) if order_limit else None
+
+    def attach(self, publish: Publish) -> None:
+        """이벤트 발행 함수를 연결하고 재생을 시작합니다."""
+        self._publish = publish
+        self._started_at = self.clock()
+
+    @property
+    def replay_finished(self) -> bool:
+        return self._cursor >= len(self.ticks)
+
+    # === 이벤트 루프 ===
+
+    def process(self) -> float | None:
+        """경과 시간만큼 틱을 재생하고 주문을 체결합니다.
+
+        Returns:
+            다음 처리가 필요할 때까지 남은 시간 (초). 예정된 작업이 없으면 None.
+        """
+        now = self.clock()
+        if self._started_at is None:
+            self._started_at = now
+        self._replay(now)
+        self._fill_due(now)
+
+        wakeups = []
+        if self._due:
+            wakeups.append(self._due[0][0] - now)
+        if not self.replay_finished:
+            wakeups.append(self._replay_time(self.ticks[self._cursor]) - now)
+        return max(0.0, min(wakeups)) if wakeups else None
+
+    def _replay_time(self, tick: Tick) -> float:
+        """틱이 재생될 백엔드 시계 시각."""
+        elapsed = (tick.timestamp - self.ticks[0].timestamp).total_seconds()
+        return self._started_at + elapsed / self.speed
+
+    def _replay(self, now: float) -> None:
+        ticks = self.ticks
+        while self._cursor < len(ticks) and self._replay_time(ticks[self._cursor]) <= now:
+            tick = ticks[self._cursor]
+            self._cursor += 1
+            self.last[tick.symbol] = tick
+            if self.publish_ticks:
+                self._publish(
+                    "tick",
+                    {
+                        "symbol": tick.symbol,
+                        "timestamp": tick.timestamp.isoformat(),
+                        "price": str(tick.price),
+                        "volume": tick.volume,
+                    },
+                )
+            # 체결 대기 중인 지정가 주문은 새 시세에서 다시 확인 (주문번호 = 접수 순서)
+            for order_id in sorted(self._symbol_orders.get(tick.symbol, ())):
+                order = self.orders[order_id]
+                if order.active_at <= now:
+                    self._try_fill(order)
+
+    def _fill_due(self, now: float) -> None:
+        while self._due and self._due[0][0] <= now:
+            _, order_id = heapq.heappop(self._due)
+            order = self.orders.get(order_id)
+            if order is not None:
+                self._try_fill(order)
+
+    def _try_fill(self, order: SimOrder) -> None:
+        tick = self.last.get(order.symbol)
+        if tick is None:
+            return
+        if order.side == "buy":
+            quote = tick.ask if tick.ask is not None else tick.price
+            price = round_to_tick(quote * (1 + self.slippage))
+            if order.order_type == "limit":
+                if quote > order.price:
+                    return
+                price = min(price, order.price)
+        else:
+            quote = tick.bid if tick.bid is not None else tick.price
+            price = round_to_tick(quote * (1 - self.slippage))
+            if order.order_type == "limit":
+                if quote < order.price:
+                    return
+                price = max(price, order.price)
+
+        self._remove_order(order.order_id)
+        self._apply_fill(order, price)
+
+    def _remove_order(self, order_id: str) -> SimOrder | None:
+        """미체결 주문과 종목별 색인에서 주문을 제거합니다."""
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            ids = self._symbol_orders[order.symbol]
+            ids.discard(order_id)
+            if not ids:
+                del self._symbol_orders[order.symbol]
+        return order
+
+    def _apply_fill(self, order: SimOrder, price: Decimal) -> None:
+        notional = price * order.quantity
+        commission = (notional * self.commission_rate).quantize(Decimal(1))
+        position = self.positions.setdefault(order.symbol, SimPosition())
+        if order.side == "buy":
+            total_cost = position.avg_price * position.quantity + notional
+            position.quantity += order.quantity
+            position.avg_price = (total_cost / position.quantity).quantize(Decimal(1))
+            self.cash -= notional + commission
+        else:
+            position.quantity -= order.quantity
+            self.cash += notional - commission
+            if position.quantity == 0:
+                position.avg_price = Decimal("0")
+
+        self._publish(
+            "fill",
+            {
+                "order_id": order.order_id,
+                "symbol": order.symbol,
+                "side": order.side,
+                "quantity": order.quantity,
+                "price": str(price),
+            },
+        )
+        self._publish(
+            "position",
+            {
+                "symbol": order.symbol,
+                "quantity": position.quantity,
+                "avg_price": str(position.avg_price),
+                "current_price": str(self.last[order.symbol].price),
+            },
+        )
+        self._publish("balance", {"balance": str(self.cash)})
+        if position.quantity == 0:
+            del self.positions[order.symbol]
+
+    def _check_limit(self, limiter: RateLimiter | None, kind: str) -> None:
+        if limiter is not None and not limiter.acquire(self.clock()):
+            raise TRLimitExceeded(f"{kind} 과부하: 1초당 {limiter.limit}회 제한")
+
+    # === 요청 처리 ===
+
+    def connect(self, params: dict) -> dict:
+        return {"connected": True}
+
+    def get_balance(self, params: dict) -> dict:
+        self._check_limit(self._tr_limiter, "조회")
+        return {"balance": str(self.cash), "currency": "KRW"}
+
+    def get_positions(self, params: dict) -> list:
+        self._check_limit(self._tr_limiter, "조회")
+        positions = []
+        for symbol, position in self.positions.items():
+            current = self.last[symbol].price
+            positions.append(
+                {
+                    "symbol": symbol,
+                    "quantity": position.quantity,
+                    "avg_price": str(position.avg_price),
+                    "current_price": str(current),
+                    "unrealized_pnl": str((current - position.avg_price) * position.quantity),
+                }
+            )
+        return positions
+
+    def submit_order(self, params: dict) -> dict:
+        self._check_limit(self._order_limiter, "주문")
+        symbol = params["symbol"]
+        side = params["side"]
+        order_type = params["order_type"]
+        quantity = int(params["quantity"])
+        price = Decimal(params["price"]) if params.get("price") else None
+
+        if quantity <= 0:
+            raise ValueError(f"주문 수량 오류: {quantity}")
+        if order_type == "limit" and price is None:
+            raise ValueError("지정가 주문에는 가격이 필요합니다")
+        if side == "sell":
+            held = self.positions.get(symbol, SimPosition()).quantity
+            pending = sum(
+                self.orders[order_id].quantity
+                for order_id in self._symbol_orders.get(symbol, ())
+                if self.orders[order_id].side == "sell"
+            )
+            if quantity > held - pending:
+                raise ValueError(f"매도 가능 수량 부족: {symbol} (보유 {held}, 미체결 {pending})")
+        else:
+            last = self.last.get(symbol)
+            estimate = price if price is not None else (last.price if last else None)
+            if estimate is not None and estimate * quantity > self.cash:
+                raise ValueError("주문 가능 금액 부족")
+
+        order = SimOrder(
+            order_id=f"SIM{next(self._order_ids):08d}",
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+            active_at=self.clock() + self.fill_latency,
+        )
+        self.orders[order.order_id] = order
+        self._symbol_orders.setdefault(symbol, set()).add(order.order_id)
+        heapq.heappush(self._due, (order.active_at, order.order_id))
+        logger.debug(f"모의 주문 접수: {order}")
+        return {"order_id": order.order_id, "status": "submitted"}
+
+    def cancel_order(self, params: dict) -> dict:
+        self._check_limit(self._order_limiter, "주문")
+        order_id = params.get("order_id")
+        cancelled = self._remove_order(order_id) is not None
+        return {"order_id": order_id, "cancelled": cancelled}
+
+    def get_historical_data(self, params: dict) -> list:
+        """재생 데이터 전체로 만든 일봉 중 기간에 해당하는 것을 반환합니다."""
+        self._check_limit(self._tr_limiter, "조회")
+        if params.get("interval", "1d") != "1d":
+            raise ValueError(f"지원하지 않는 주기: {params.get('interval')}")
+        start = datetime.fromisoformat(params["start_date"])
+        end = datetime.fromisoformat(params["end_date"])
+        return [
+            candle for day, candle in self._daily_candles(params["symbol"]) if start <= day <= end
+        ]
+
+    def _daily_candles(self, symbol: str) -> list[tuple[datetime, dict[str, Any]]]:
+        """종목의 일봉 (처음 요청할 때 한 번 만들어 재사용)."""
+        cached = self._daily.get(symbol)
+        if cached is not None:
+            return cached
+
+        bars: dict[datetime, list[Any]] = {}  # 일자 -> [시, 고, 저, 종, 거래량]
+        for tick in self.ticks:
+            if tick.symbol != symbol:
+                continue
+            day = datetime(tick.timestamp.year, tick.timestamp.month, tick.timestamp.day)
+            bar = bars.get(day)
+            if bar is None:
+                bars[day] = [tick.price, tick.price, tick.price, tick.price, tick.volume]
+                continue
+            bar[1] = max(bar[1], tick.price)
+            bar[2] = min(bar[2], tick.price)
+            bar[3] = tick.price
+            bar[4] += tick.volume
+
+        cached = self._daily[symbol] = [
+            (
+                day,
+                {
+                    "timestamp": day.isoformat(),
+                    "open": str(bar[0]),
+                    "high": str(bar[1]),
+                    "low": str(bar[2]),
+                    "close": str(bar[3]),
+                    "volume": bar[4],
+                },
+            )
+            for day, bar in sorted(bars.items())
+        ]
+        return cached
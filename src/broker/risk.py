@@ -0,0 +1,419 @@
+"""주문 전 리스크 점검 게이트.
+
+`RiskGate`는 `BrokerInterface`를 구현하면서 다른 브로커를 감싸고,
+`submit_order` 요청을 브로커로 보내기 전에 프로세스 안에서 점검합니다.
+
+- 종목별 1회 주문 수량/금액 한도, 보유 수량 한도, 보유 수량을 넘는 매도(공매도)
+- 계좌 전체 총 노출(보유 + 미체결 매수) 한도
+- 기준가 대비 지정가 가격 범위 (가격제한폭 등)
+- 일정 시간 안의 동일 주문 중복 제출
+
+종목별 한도는 생성 시 미리 계산해 두고, 보유/미체결 수량과 총 노출은 주문 제출,
+체결, 취소 때마다 증분으로 갱신하므로 점검 1회가 O(1)입니다. IPC 왕복 없이 수 마이크로초
+안에 끝나며, 점검 지연 시간과 거부 사유별 횟수를 집계합니다.
+
+Example:
+    ```python
+    limits = RiskLimits(
+        default=SymbolLimits(max_order_notional=Decimal("5000000"), max_position=1000),
+        max_gross_exposure=Decimal("50000000"),
+    )
+    broker = RiskGate(KiwoomClient(), limits)
+    broker.connect()  # 보유 포지션으로 노출 초기화
+    try:
+        broker.submit_order(order)
+    except RiskRejectedError as e:
+        logger.warning(f"주문 거부: {e.reason}")
+    print(broker.stats())
+    ```
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from src.utils.tracing import Histogram, tracer
+
+from .interface import OHLCV, BrokerInterface, Order, OrderSide, OrderType, Position
+
+DuplicateKey = tuple[str, OrderSide, OrderType, int, Decimal | None]
+
+
+class RiskRejectedError(Exception):
+    """리스크 점검에서 거부된 주문."""
+
+    def __init__(self, reason: str, order: Order, detail: str):
+        """
+        Args:
+            reason: 거부 사유 코드 (quantity, order_quantity, order_notional, position,
+                short, gross_exposure, price_band, no_price, duplicate).
+            order: 거부된 주문.
+            detail: 사람이 읽을 수 있는 설명.
+        """
+        super().__init__(f"[{reason}] {detail}")
+        self.reason = reason
+        self.order = order
+
+
+@dataclass(slots=True)
+class SymbolLimits:
+    """종목별 한도. None인 항목은 점검하지 않습니다."""
+
+    max_order_quantity: int | None = None  # 1회 주문 최대 수량
+    max_order_notional: Decimal | None = None  # 1회 주문 최대 금액 (원)
+    max_position: int | None = None  # 주문 체결 후 최대 보유 수량
+    reference_price: Decimal | None = None  # 기준가 (전일 종가 등)
+    price_band: Decimal | None = None  # 기준가 대비 허용 범위 (0.3 = ±30%)
+
+
+@dataclass
+class RiskLimits:
+    """리스크 한도 설정."""
+
+    default: SymbolLimits = field(default_factory=SymbolLimits)
+    symbols: dict[str, SymbolLimits] = field(default_factory=dict)  # 종목별 재정의 항목
+    max_gross_exposure: Decimal | None = None  # 보유 + 미체결 매수 금액 합계 한도
+    duplicate_window: float = 1.0  # 동일 주문 거부 시간 (초). 0이면 점검하지 않음
+    allow_short: bool = False  # 보유 수량을 넘는 매도 허용 여부
+
+
+@dataclass(slots=True)
+class _SymbolState:
+    """종목별 한도와 실행 중 노출."""
+
+    limits: SymbolLimits
+    lower: Decimal | None = None  # 가격 범위 하한
+    upper: Decimal | None = None  # 가격 범위 상한
+    position: int = 0  # 보유 수량
+    pending_buy: int = 0  # 미체결 매수 수량
+    pending_sell: int = 0  # 미체결 매도 수량
+    held: Decimal = Decimal("0")  # 보유 금액 (취득 가격 기준)
+    last_price: Decimal | None = None  # 시장가 주문 금액 계산용
+
+
+@dataclass(slots=True)
+class _PendingOrder:
+    """게이트를 거쳐 제출된 주문의 미체결 잔량."""
+
+    symbol: str
+    side: OrderSide
+    quantity: int  # 미체결 수량
+    notional: Decimal  # 미체결 금액 (주문 가격 기준)
+
+
+class RiskGate(BrokerInterface):
+    """주문 전 리스크 점검을 수행하는 브로커 래퍼.
+
+    조회와 취소는 감싼 브로커에 그대로 위임합니다. 제출한 주문은 주문 ID별 미체결
+    잔량으로 추적하여 보유 한도와 총 노출에 미리 포함하고(보수적), 체결 통보를
+    `on_fill()`로 전달하면 체결분을 미체결에서 보유로 옮깁니다. 취소하면 남은
+    미체결분만 되돌립니다. 총 노출은 종목별 보유 금액(취득 가격 기준)과 미체결 매수
+    금액의 합이며, 매도 체결은 해당 종목 보유 금액을 매도 수량 비율만큼만 줄입니다.
+    계좌 상태를 다시 맞추려면 `sync()`를 호출하세요.
+
+    `KiwoomClient`와 마찬가지로 스레드 안전하지 않으므로 한 스레드에서만 사용하세요.
+    """
+
+    def __init__(
+        self,
+        broker: BrokerInterface,
+        limits: RiskLimits | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            broker: 주문을 전달할 브로커.
+            limits: 리스크 한도. None이면 수량 점검과 중복 주문 점검만 합니다.
+            clock: 중복 주문 판단용 시계 (초).
+        """
+        self.broker = broker
+        self.limits = limits or RiskLimits()
+        self.clock = clock
+        self.gross_exposure = Decimal("0")
+        self.checks = 0  # 점검한 주문 수
+        self.rejected: dict[str, int] = {}  # 거부 사유별 횟수
+        self.latency = Histogram()  # 점검 지연 시간 (마이크로초)
+
+        self._states: dict[str, _SymbolState] = {
+            symbol: self._new_state(symbol) for symbol in self.limits.symbols
+        }
+        self._pending: dict[str, _PendingOrder] = {}
+        self._recent: dict[DuplicateKey, float] = {}
+        self._recent_order: deque[tuple[float, DuplicateKey]] = deque()
+
+    # === 리스크 점검 ===
+
+    def check(self, order: Order) -> None:
+        """주문을 점검합니다. 통과하지 못하면 RiskRejectedError를 발생시킵니다.
+
+        상태는 바꾸지 않습니다 (중복 주문 기록과 노출 반영은 `submit_order`에서).
+        """
+        started = time.perf_counter_ns()
+        self.checks += 1
+        try:
+            self._check(order, self._state(order.symbol))
+        except RiskRejectedError as e:
+            self.rejected[e.reason] = self.rejected.get(e.reason, 0) + 1
+            tracer.count(f"risk.rejected.{e.reason}")
+            raise
+        finally:
+            self.latency.observe((time.perf_counter_ns() - started) / 1000)
+
+    def _check(self, order: Order, state: _SymbolState) -> None:
+        limits = state.limits
+        quantity = order.quantity
+        if quantity <= 0:
+            raise RiskRejectedError("quantity", order, f"주문 수량이 0 이하입니다: {quantity}")
+        if limits.max_order_quantity is not None and quantity > limits.max_order_quantity:
+            raise RiskRejectedError("order_quantity", order, f"1회 주문 수량 한도 초과: {quantity}")
+
+        price = order.price if order.order_type == OrderType.LIMIT else state.last_price
+        if order.order_type == OrderType.LIMIT and state.lower is not None:
+            if price is None or not state.lower <= price <= state.upper:
+                raise RiskRejectedError(
+                    "price_band", order, f"가격 범위({state.lower}~{state.upper}) 밖: {price}"
+                )
+
+        buying = order.side == OrderSide.BUY
+        if buying:
+            projected = state.position + state.pending_buy + quantity
+        else:
+            projected = state.position - state.pending_sell - quantity
+            if projected < 0 and not self.limits.allow_short:
+                raise RiskRejectedError(
+                    "short", order, f"매도 가능 수량 초과: {state.position - state.pending_sell}"
+                )
+        if limits.max_position is not None and abs(projected) > limits.max_position:
+            raise RiskRejectedError("position", order, f"보유 수량 한도 초과: {projected}")
+
+        needs_notional = limits.max_order_notional is not None or (
+            buying and self.limits.max_gross_exposure is not None
+        )
+        if needs_notional:
+            if price is None:
+                raise RiskRejectedError(
+                    "no_price", order, f"{order.symbol} 시장가 주문 금액을 계산할 기준가 없음"
+                )
+            notional = price * quantity
+            if limits.max_order_notional is not None and notional > limits.max_order_notional:
+                raise RiskRejectedError(
+                    "order_notional", order, f"1회 주문 금액 한도 초과: {notional}"
+                )
+            if (
+                buying
+                and self.limits.max_gross_exposure is not None
+                and self.gross_exposure + notional > self.limits.max_gross_exposure
+            ):
+                raise RiskRejectedError(
+                    "gross_exposure", order, f"총 노출 한도 초과: {self.gross_exposure + notional}"
+                )
+
+        if self.limits.duplicate_window > 0:
+            last = self._recent.get(_duplicate_key(order))
+            if last is not None and self.clock() - last < self.limits.duplicate_window:
+                raise RiskRejectedError("duplicate", order, "같은 주문이 방금 제출되었습니다")
+
+    # === 노출 관리 ===
+
+    def set_price(self, symbol: str, price: Decimal) -> None:
+        """종목 현재가를 갱신합니다 (시장가 주문 금액 계산용)."""
+        self._state(symbol).last_price = price
+
+    def set_reference_price(self, symbol: str, price: Decimal) -> None:
+        """종목 기준가를 갱신하고 가격 범위를 다시 계산합니다 (장 시작 전 호출)."""
+        state = self._state(symbol)
+        state.limits = replace(state.limits, reference_price=price)
+        state.lower, state.upper = _price_band(state.limits)
+        if state.last_price is None:
+            state.last_price = price
+
+    def on_fill(self, order_id: str, quantity: int, price: Decimal) -> None:
+        """체결을 반영합니다 (미체결 → 보유).
+
+        게이트를 거치지 않았거나 이미 취소/전량 체결된 주문의 체결은 무시합니다
+        (`sync()`로 맞추세요). 매도 체결은 체결 가격과 무관하게 보유 금액을 매도 수량
+        비율만큼 줄입니다.
+
+        Args:
+            order_id: `submit_order`가 반환한 주문 ID.
+            quantity: 이번 체결 수량 (부분 체결이면 일부).
+            price: 체결 가격.
+        """
+        pending = self._pending.get(order_id)
+        if pending is None:
+            return
+        state = self._state(pending.symbol)
+        state.last_price = price
+        filled = min(quantity, pending.quantity)
+        released = pending.notional * filled / pending.quantity
+        pending.quantity -= filled
+        pending.notional -= released
+        if pending.quantity == 0:
+            del self._pending[order_id]
+
+        if pending.side == OrderSide.BUY:
+            state.pending_buy = max(state.pending_buy - filled, 0)
+            state.position += quantity
+            state.held += price * quantity
+            # 미체결 매수 금액을 체결 금액(보유)으로 교체
+            self.gross_exposure += price * quantity - released
+        else:
+            state.pending_sell = max(state.pending_sell - filled, 0)
+            sold = min(quantity, max(state.position, 0))
+            if sold == state.position:
+                held = state.held
+            else:
+                held = state.held * sold / state.position
+            state.position -= quantity
+            state.held -= held
+            self.gross_exposure -= held
+
+    def sync(self) -> None:
+        """브로커의 보유 포지션으로 노출을 다시 계산합니다.
+
+        보유 금액은 현재가 기준으로 다시 잡고, 게이트를 거쳐 제출된 미체결 주문은 그대로
+        유지하여 다시 반영합니다. 브로커 보유에 이미 포함된 체결은 그 전에 `on_fill()`로
+        전달되어 있어야 합니다 (아니면 나중에 전달될 때 이중으로 반영됩니다).
+        """
+        positions = self.broker.get_positions()
+        for state in self._states.values():
+            state.position = state.pending_buy = state.pending_sell = 0
+            state.held = Decimal("0")
+        self.gross_exposure = Decimal("0")
+        for position in positions:
+            state = self._state(position.symbol)
+            state.position = position.quantity
+            state.held = position.current_price * position.quantity
+            state.last_price = position.current_price
+            self.gross_exposure += state.held
+        for pending in self._pending.values():
+            state = self._state(pending.symbol)
+            if pending.side == OrderSide.BUY:
+                state.pending_buy += pending.quantity
+                self.gross_exposure += pending.notional
+            else:
+                state.pending_sell += pending.quantity
+
+    def stats(self) -> dict[str, Any]:
+        """점검 횟수, 거부 사유별 횟수, 점검 지연 시간 (마이크로초)."""
+        return {
+            "checks": self.checks,
+            "rejected": dict(self.rejected),
+            "latency_us": self.latency.summary(),
+            "gross_exposure": self.gross_exposure,
+        }
+
+    def _state(self, symbol: str) -> _SymbolState:
+        state = self._states.get(symbol)
+        if state is None:
+            state = self._states[symbol] = self._new_state(symbol)
+        return state
+
+    def _new_state(self, symbol: str) -> _SymbolState:
+        """기본 한도에 종목별 재정의 항목을 합쳐 미리 계산합니다."""
+        limits = self.limits.default
+        override = self.limits.symbols.get(symbol)
+        if override is not None:
+            limits = replace(
+                limits,
+                **{
+                    f.name: getattr(override, f.name)
+                    for f in fields(SymbolLimits)
+                    if getattr(override, f.name) is not None
+                },
+            )
+        lower, upper = _price_band(limits)
+        return _SymbolState(
+            limits=limits, lower=lower, upper=upper, last_price=limits.reference_price
+        )
+
+    def _remember(self, order: Order) -> None:
+        """중복 주문 판단용으로 제출 시각을 기록하고 오래된 기록을 정리합니다."""
+        now = self.clock()
+        key = _duplicate_key(order)
+        self._recent[key] = now
+        self._recent_order.append((now, key))
+        window = self.limits.duplicate_window
+        while self._recent_order and now - self._recent_order[0][0] >= window:
+            expired_at, expired = self._recent_order.popleft()
+            if self._recent.get(expired) == expired_at:
+                del self._recent[expired]
+
+    # === BrokerInterface ===
+
+    def connect(self) -> bool:
+        connected = self.broker.connect()
+        if connected:
+            self.sync()
+        return connected
+
+    def disconnect(self) -> None:
+        self.broker.disconnect()
+
+    def get_balance(self) -> Decimal:
+        return self.broker.get_balance()
+
+    def get_positions(self) -> list[Position]:
+        return self.broker.get_positions()
+
+    def submit_order(self, order: Order) -> str:
+        """리스크 점검을 통과한 주문만 브로커로 제출합니다.
+
+        Raises:
+            RiskRejectedError: 리스크 한도를 넘는 주문.
+        """
+        self.check(order)
+        order_id = self.broker.submit_order(order)
+
+        state = self._state(order.symbol)
+        price = order.price if order.order_type == OrderType.LIMIT else state.last_price
+        notional = (price or Decimal("0")) * order.quantity
+        if order.side == OrderSide.BUY:
+            state.pending_buy += order.quantity
+            self.gross_exposure += notional
+        else:
+            state.pending_sell += order.quantity
+        self._pending[order_id] = _PendingOrder(order.symbol, order.side, order.quantity, notional)
+        if self.limits.duplicate_window > 0:
+            self._remember(order)
+        return order_id
+
+    def cancel_order(self, order_id: str) -> bool:
+        """주문을 취소하고, 성공하면 남은 미체결 수량과 금액만 되돌립니다."""
+        cancelled = self.broker.cancel_order(order_id)
+        pending = self._pending.pop(order_id, None) if cancelled else None
+        if pending is not None:
+            state = self._state(pending.symbol)
+            if pending.side == OrderSide.BUY:
+                state.pending_buy = max(state.pending_buy - pending.quantity, 0)
+                self.gross_exposure -= pending.notional
+            else:
+                state.pending_sell = max(state.pending_sell - pending.quantity, 0)
+        return cancelled
+
+    def get_historical_data(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> list[OHLCV]:
+        return self.broker.get_historical_data(symbol, start_date, end_date, interval)
+
+    def __repr__(self) -> str:
+        return f"RiskGate({self.broker!r}, checks={self.checks}, rejected={sum(self.rejected.values())})"
+
+
+def _duplicate_key(order: Order) -> DuplicateKey:
+    return (order.symbol, order.side, order.order_type, order.quantity, order.price)
+
+
+def _price_band(limits: SymbolLimits) -> tuple[Decimal | None, Decimal | None]:
+    if limits.reference_price is None or limits.price_band is None:
+        return None, None
+    width = limits.reference_price * limits.price_band
+    return limits.reference_price - width, limits.reference_price + width
@@ -0,0 +1,279 @@
+"""공유 메모리 시세 데이터.
+
+병렬 백테스트 워커마다 같은 OHLCV 이력을 다시 불러오고 파싱하면 메모리가
+워커 수에 비례해 늘어납니다. `SharedMarketData`는 유니버스 전체를
+`multiprocessing.shared_memory` 블록 하나에 열 단위로 한 번만 적재하고,
+워커는 이름으로 연결(attach)하여 복사 없이 읽기 전용 NumPy 뷰를 얻습니다.
+
+메모리 배치 (열마다 연속, 64바이트 정렬):
+    timestamp[전체 행] | open[전체 행] | ... | volume[전체 행]
+종목은 각 열에서 [start, end) 구간을 차지합니다.
+
+Example:
+    ```python
+    _market: SharedMarketView | None = None
+
+    def init_worker(handle: SharedMarketHandle) -> None:
+        global _market
+        _market = SharedMarketView(handle)
+
+    def run(symbol: str) -> float:
+        closes = _market[symbol].close  # 복사 없는 읽기 전용 뷰
+        return float(closes[-1] / closes[0] - 1)
+
+    with SharedMarketData(universe) as market:
+        with ProcessPoolExecutor(initializer=init_worker, initargs=(market.handle,)) as pool:
+            returns = list(pool.map(run, market.handle.symbols))
+    ```
+"""
+
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.broker.interface import OHLCV
+
+if TYPE_CHECKING:
+    from src.broker.interface import BrokerInterface
+
+# (열 이름, dtype)
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("timestamp", "datetime64[ns]"),
+    ("open", "float64"),
+    ("high", "float64"),
+    ("low", "float64"),
+    ("close", "float64"),
+    ("volume", "int64"),
+)
+_ALIGNMENT = 64
+_attach_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SharedMarketHandle:
+    """공유 메모리 연결 정보. 작고 pickle 가능하므로 워커에 그대로 전달합니다."""
+
+    name: str  # 공유 메모리 블록 이름
+    rows: int  # 전체 행 수
+    symbols: dict[str, tuple[int, int]]  # 종목 → [start, end) 행 범위
+    offsets: dict[str, int]  # 열 이름 → 바이트 오프셋
+
+
+@dataclass(slots=True)
+class MarketSeries:
+    """종목 1개의 시세 (읽기 전용 뷰)."""
+
+    symbol: str
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+UniverseData = Mapping[str, Sequence[OHLCV] | Mapping[str, Any] | Any]
+
+
+class SharedMarketData:
+    """유니버스 시세를 공유 메모리에 적재하는 발행자.
+
+    발행자가 공유 메모리 블록을 소유하며, `close()`하면 블록을 해제(unlink)합니다.
+    워커가 모두 끝난 뒤에 닫으세요.
+    """
+
+    def __init__(self, universe: UniverseData, name: str | None = None):
+        """
+        Args:
+            universe: 종목 → 시세. 시세는 `list[OHLCV]`이거나, 열 이름으로 배열을
+                꺼낼 수 있는 객체(dict of arrays, polars/pandas DataFrame)입니다.
+            name: 공유 메모리 블록 이름. None이면 자동 생성.
+        """
+        columns = {symbol: _to_columns(data) for symbol, data in universe.items()}
+
+        symbols: dict[str, tuple[int, int]] = {}
+        rows = 0
+        for symbol, arrays in columns.items():
+            symbols[symbol] = (rows, rows + len(arrays["close"]))
+            rows += len(arrays["close"])
+
+        offsets: dict[str, int] = {}
+        size = 0
+        for column, dtype in COLUMNS:
+            offsets[column] = size
+            size += _aligned(rows * np.dtype(dtype).itemsize)
+
+        self._shm = SharedMemory(name=name, create=True, size=max(size, 1))
+        self.handle = SharedMarketHandle(
+            name=self._shm.name, rows=rows, symbols=symbols, offsets=offsets
+        )
+        for column, dtype in COLUMNS:
+            target = _column_view(self._shm, self.handle, column, dtype)
+            for symbol, (start, end) in symbols.items():
+                target[start:end] = columns[symbol][column]
+            del target
+
+    @classmethod
+    def from_broker(
+        cls,
+        broker: "BrokerInterface",
+        symbols: Sequence[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> "SharedMarketData":
+        """브로커에서 종목별 과거 시세를 한 번 조회하여 적재합니다."""
+        return cls(
+            {
+                symbol: broker.get_historical_data(symbol, start_date, end_date, interval)
+                for symbol in symbols
+            }
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """공유 메모리 블록 크기 (바이트)."""
+        return self._shm.size
+
+    def view(self) -> "SharedMarketView":
+        """같은 프로세스에서 사용할 읽기 전용 뷰."""
+        return SharedMarketView(self.handle)
+
+    def close(self) -> None:
+        """공유 메모리 블록을 해제합니다."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "SharedMarketData":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedMarketData(name={self.handle.name!r}, symbols={len(self.handle.symbols)}, "
+            f"rows={self.handle.rows})"
+        )
+
+
+class SharedMarketView:
+    """공유 메모리 시세에 연결한 읽기 전용 뷰 (워커용).
+
+    반환하는 배열은 공유 메모리를 직접 가리키므로 `close()` 전에 참조를 모두
+    해제해야 합니다.
+    """
+
+    def __init__(self, handle: SharedMarketHandle):
+        self.handle = handle
+        self._shm = _attach(handle.name)
+        self._columns = {
+            column: _column_view(self._shm, handle, column, dtype, readonly=True)
+            for column, dtype in COLUMNS
+        }
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self.handle.symbols)
+
+    def __getitem__(self, symbol: str) -> MarketSeries:
+        start, end = self.handle.symbols[symbol]
+        return MarketSeries(symbol, *(self._columns[column][start:end] for column, _ in COLUMNS))
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.handle.symbols
+
+    def __len__(self) -> int:
+        return len(self.handle.symbols)
+
+    def column(self, name: str) -> np.ndarray:
+        """유니버스 전체의 열 (종목 순서대로 이어붙인 배열)."""
+        return self._columns[name]
+
+    def close(self) -> None:
+        """연결을 끊습니다. 공유 메모리 블록은 발행자가 해제합니다."""
+        if self._shm is None:
+            return
+        self._columns.clear()
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> "SharedMarketView":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _column_view(
+    shm: SharedMemory,
+    handle: SharedMarketHandle,
+    column: str,
+    dtype: str,
+    readonly: bool = False,
+) -> np.ndarray:
+    array = np.ndarray(
+        (handle.rows,), dtype=np.dtype(dtype), buffer=shm.buf, offset=handle.offsets[column]
+    )
+    if readonly:
+        array.flags.writeable = False
+    return array
+
+
+def _attach(name: str) -> SharedMemory:
+    """자원 추적기에 등록하지 않고 공유 메모리에 연결합니다.
+
+    Python 3.12 이하에서는 연결만 해도 자원 추적기에 등록되어, 발행자와 무관한
+    프로세스가 종료될 때 블록이 해제(unlink)될 수 있습니다.
+
+    제약: 3.12 이하에서는 연결하는 동안 전역 `resource_tracker.register`를 no-op으로
+    바꿔 둡니다. 그동안 다른 스레드가 만드는 공유 메모리나 세마포어도 추적기에
+    등록되지 않으므로, 연결은 워커 초기화처럼 다른 스레드가 자원을 만들지 않는
+    시점에 하세요. 연결 후 `resource_tracker.unregister`로 되돌리는 방식은 쓰지
+    않습니다. spawn 워커는 발행자와 같은 추적기 프로세스를 공유하므로 발행자의
+    등록까지 지워지고, 발행자의 unlink 때 추적기가 KeyError를 출력합니다.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _to_columns(data: Sequence[OHLCV] | Mapping[str, Any] | Any) -> dict[str, np.ndarray]:
+    if isinstance(data, Sequence) and (not data or isinstance(data[0], OHLCV)):
+        return {
+            "timestamp": np.array([c.timestamp for c in data], dtype="datetime64[ns]"),
+            "open": np.array([float(c.open) for c in data], dtype=np.float64),
+            "high": np.array([float(c.high) for c in data], dtype=np.float64),
+            "low": np.array([float(c.low) for c in data], dtype=np.float64),
+            "close": np.array([float(c.close) for c in data], dtype=np.float64),
+            "volume": np.array([c.volume for c in data], dtype=np.int64),
+        }
+
+    arrays = {column: np.asarray(data[column]).astype(dtype) for column, dtype in COLUMNS}
+    lengths = {len(a) for a in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"열 길이가 다릅니다: {sorted(lengths)}")
+    return arrays
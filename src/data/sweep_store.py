@@ -0,0 +1,281 @@
+"""파라미터 스윕 결과 저장소.
+
+스윕 결과를 메모리의 `list[tuple[dict, BacktestResult]]`로 들고 있는 대신
+Parquet 파일로 추가(append-only) 저장하고, polars LazyFrame으로 필요한 행과
+열만 읽어 조회합니다.
+
+디렉터리 구조:
+    root/
+        results/part-00000.parquet  # run_id, param_* 파라미터 열, 지표 열
+        curves/part-00000.parquet   # run_id, curve (다운샘플링한 자산 곡선)
+
+결과 파일은 행 그룹마다 min/max 통계를 기록하므로 `sharpe_ratio > 1` 같은 조건은
+조건에 맞지 않는 행 그룹을 읽지 않고 건너뜁니다(predicate pushdown). 자산 곡선은
+별도 파일에 저장하므로 지표 조회 시에는 읽지 않습니다.
+
+Example:
+    ```python
+    store = SweepResultStore("results/sweep-12345")
+    for outcome in orchestrator.run("12345", base_params, grid):
+        store.append_outcome(outcome)
+    store.flush()
+
+    top = store.top(50, by="sharpe_ratio", where=pl.col("max_drawdown") > -20)
+    curve = store.equity_curve(top["run_id"][0])
+    ```
+"""
+
+import dataclasses
+import re
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from src.utils.tracing import tracer
+
+PARAM_PREFIX = "param_"
+_PART_PATTERN = re.compile(r"part-(\d+)\.parquet$")
+_SCALAR_TYPES = (bool, int, float, str)
+
+
+class SweepResultStore:
+    """Parquet 기반 추가 전용 스윕 결과 저장소.
+
+    `append()`한 결과는 메모리 버퍼에 모았다가 `flush_rows`개마다 새 파트 파일로
+    기록합니다. 기존 파일은 수정하지 않으므로, 같은 디렉터리를 다시 열어 이어서
+    추가할 수 있습니다. 한 프로세스에서만 기록하세요.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        curve_points: int | None = 256,
+        compression: str = "zstd",
+        flush_rows: int = 1000,
+        row_group_size: int = 10_000,
+    ):
+        """
+        Args:
+            root: 저장 디렉터리. 없으면 생성합니다.
+            curve_points: 자산 곡선 다운샘플링 점 수. None이면 원본 그대로 저장.
+            compression: Parquet 압축 방식 (zstd, lz4, snappy, uncompressed 등).
+            flush_rows: 버퍼에 모았다가 파일로 기록할 행 수.
+            row_group_size: Parquet 행 그룹 크기. 작을수록 조건 필터가 세밀해집니다.
+        """
+        if curve_points is not None and curve_points < 2:
+            raise ValueError("curve_points는 2 이상이어야 합니다")
+        self.root = Path(root)
+        self.curve_points = curve_points
+        self.compression = compression
+        self.flush_rows = flush_rows
+        self.row_group_size = row_group_size
+
+        self._results_dir = self.root / "results"
+        self._curves_dir = self.root / "curves"
+        self._results_dir.mkdir(parents=True, exist_ok=True)
+        self._curves_dir.mkdir(parents=True, exist_ok=True)
+
+        self._rows: list[dict[str, Any]] = []
+        self._curves: list[dict[str, Any]] = []
+        self._next_part = self._last_part() + 1
+        self._next_run_id = self._stored_max_run_id() + 1
+
+    # === 기록 ===
+
+    def append(
+        self,
+        params: Mapping[str, Any],
+        metrics: Mapping[str, Any] | Any,
+        equity_curve: Sequence[float] | np.ndarray | None = None,
+    ) -> int:
+        """실행 결과 1건을 추가하고 run_id를 반환합니다.
+
+        Args:
+            params: 파라미터 (스윕에서 변경한 값). `param_` 접두사를 붙인 열로 저장됩니다.
+            metrics: 지표 dict 또는 dataclass (genport/Rust BacktestResult 등).
+                숫자/문자열 필드만 저장하고 raw_data, equity_curve 같은 필드는 제외합니다.
+            equity_curve: 자산 곡선. 지정하면 다운샘플링하여 별도 파일에 저장합니다.
+        """
+        run_id = self._next_run_id
+        self._next_run_id += 1
+
+        row: dict[str, Any] = {"run_id": run_id}
+        for name, value in params.items():
+            row[PARAM_PREFIX + name] = value if isinstance(value, _SCALAR_TYPES) else str(value)
+        for name, value in _metric_values(metrics).items():
+            row[name] = value
+        self._rows.append(row)
+
+        curve = equity_curve
+        if curve is None and hasattr(metrics, "equity_curve"):
+            curve = metrics.equity_curve
+        if curve is not None and len(curve) > 0:
+            self._curves.append(
+                {"run_id": run_id, "curve": downsample(curve, self.curve_points).tolist()}
+            )
+
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+        return run_id
+
+    def append_outcome(self, outcome: Any) -> int | None:
+        """`genport.sweep.SweepOutcome`을 추가합니다. 실패한 작업은 건너뜁니다.
+
+        Returns:
+            run_id. 건너뛰면 None.
+        """
+        if outcome.result is None:
+            return None
+        return self.append(outcome.job.overrides, outcome.result)
+
+    def flush(self) -> None:
+        """버퍼의 결과를 새 파트 파일로 기록합니다."""
+        if not self._rows:
+            return
+        with tracer.span("sweep_store.flush", rows=len(self._rows)):
+            name = f"part-{self._next_part:05d}.parquet"
+            results = pl.from_dicts(self._rows, infer_schema_length=None)
+            results.write_parquet(
+                self._results_dir / name,
+                compression=self.compression,
+                statistics=True,
+                row_group_size=self.row_group_size,
+            )
+            if self._curves:
+                curves = pl.DataFrame(
+                    self._curves,
+                    schema={"run_id": pl.Int64, "curve": pl.List(pl.Float32)},
+                )
+                curves.write_parquet(self._curves_dir / name, compression=self.compression)
+            self._next_part += 1
+            self._rows.clear()
+            self._curves.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "SweepResultStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    # === 조회 ===
+
+    def scan(self) -> pl.LazyFrame:
+        """기록된 결과 전체를 LazyFrame으로 반환합니다 (버퍼는 포함하지 않음).
+
+        파트마다 파라미터 열이 달라도 합쳐지며, 없는 열은 null입니다.
+        """
+        parts = self._parts(self._results_dir)
+        if not parts:
+            return pl.LazyFrame({"run_id": []}, schema={"run_id": pl.Int64})
+        return pl.concat([pl.scan_parquet(path) for path in parts], how="diagonal_relaxed")
+
+    def query(
+        self,
+        where: pl.Expr | None = None,
+        sort_by: str | None = None,
+        descending: bool = True,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+    ) -> pl.DataFrame:
+        """조건에 맞는 결과를 조회합니다.
+
+        Args:
+            where: 필터 조건. 예: `pl.col("max_drawdown") > -20`
+            sort_by: 정렬 기준 열.
+            descending: 내림차순 정렬 여부.
+            limit: 반환할 최대 행 수. 정렬과 함께 쓰면 상위 k개만 유지합니다.
+            columns: 반환할 열. None이면 전체.
+        """
+        with tracer.span("sweep_store.query"):
+            frame = self.scan()
+            if where is not None:
+                frame = frame.filter(where)
+            if sort_by is not None:
+                frame = frame.sort(sort_by, descending=descending, nulls_last=True)
+            if limit is not None:
+                frame = frame.head(limit)
+            if columns is not None:
+                frame = frame.select(columns)
+            return frame.collect()
+
+    def top(self, n: int, by: str = "sharpe_ratio", where: pl.Expr | None = None) -> pl.DataFrame:
+        """지표 기준 상위 n개. 예: `store.top(50, where=pl.col("max_drawdown") > -20)`"""
+        return self.query(where=where, sort_by=by, descending=True, limit=n)
+
+    def params(self, run_id: int) -> dict[str, Any]:
+        """실행의 파라미터 (접두사를 뗀 이름, null 제외)."""
+        row = self.query(where=pl.col("run_id") == run_id)
+        if row.is_empty():
+            raise KeyError(run_id)
+        return {
+            name[len(PARAM_PREFIX) :]: value
+            for name, value in row.row(0, named=True).items()
+            if name.startswith(PARAM_PREFIX) and value is not None
+        }
+
+    def equity_curve(self, run_id: int) -> np.ndarray:
+        """실행의 (다운샘플링된) 자산 곡선."""
+        parts = self._parts(self._curves_dir)
+        if parts:
+            found = (
+                pl.scan_parquet(parts).filter(pl.col("run_id") == run_id).select("curve").collect()
+            )
+            if not found.is_empty():
+                return np.asarray(found["curve"][0].to_list(), dtype=np.float64)
+        raise KeyError(run_id)
+
+    def __len__(self) -> int:
+        """기록된 결과 수 (버퍼 포함)."""
+        stored = self.scan().select(pl.len()).collect().item()
+        return stored + len(self._rows)
+
+    # === 내부 ===
+
+    @staticmethod
+    def _parts(directory: Path) -> list[Path]:
+        return sorted(p for p in directory.glob("part-*.parquet") if _PART_PATTERN.search(p.name))
+
+    def _last_part(self) -> int:
+        parts = self._parts(self._results_dir)
+        if not parts:
+            return -1
+        return int(_PART_PATTERN.search(parts[-1].name).group(1))
+
+    def _stored_max_run_id(self) -> int:
+        # run_id 열만 읽음
+        value = self.scan().select(pl.col("run_id").max()).collect().item()
+        return -1 if value is None else value
+
+    def __repr__(self) -> str:
+        return f"SweepResultStore({str(self.root)!r}, buffered={len(self._rows)})"
+
+
+def downsample(curve: Sequence[float] | np.ndarray, points: int | None) -> np.ndarray:
+    """곡선을 균등 간격 `points`개로 줄입니다. 첫 점과 마지막 점은 유지합니다.
+
+    `points`가 None이거나 곡선이 더 짧으면 float32로만 변환합니다.
+    """
+    values = np.asarray(curve, dtype=np.float32)
+    if points is None or len(values) <= points:
+        return values
+    index = np.linspace(0, len(values) - 1, points).round().astype(np.int64)
+    return values[index]
+
+
+def _metric_values(metrics: Mapping[str, Any] | Any) -> dict[str, Any]:
+    if isinstance(metrics, Mapping):
+        items = metrics.items()
+    elif dataclasses.is_dataclass(metrics):
+        items = ((f.name, getattr(metrics, f.name)) for f in dataclasses.fields(metrics))
+    else:
+        # pyo3 클래스 등 __dict__가 없는 객체
+        items = (
+            (name, getattr(metrics, name)) for name in dir(metrics) if not name.startswith("_")
+        )
+    return {name: value for name, value in items if isinstance(value, _SCALAR_TYPES)}
@@ -0,0 +1,98 @@
+"""임포트 시간 측정 유틸리티.
+
+`python -X importtime`으로 구문 하나를 실행하고, 인터프리터 기본 시작 비용을 뺀
+임포트 시간을 모듈별로 집계합니다.
+
+실행 방법:
+    uv run python -m src.utils.importtime "from genport import BacktestParams"
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass
+class ImportProfile:
+    """구문 하나의 임포트 프로파일."""
+
+    statement: str
+    self_us: dict[str, int] = field(default_factory=dict)  # 모듈별 자체 시간 (마이크로초)
+    cumulative_us: dict[str, int] = field(default_factory=dict)  # 모듈별 누적 시간
+
+    @property
+    def modules(self) -> set[str]:
+        """구문 실행으로 새로 임포트된 모듈."""
+        return set(self.self_us)
+
+    @property
+    def total_ms(self) -> float:
+        """새로 임포트된 모듈의 자체 시간 합계 (밀리초)."""
+        return sum(self.self_us.values()) / 1000
+
+    def top(self, n: int = 10) -> list[tuple[str, int]]:
+        """누적 시간이 가장 긴 모듈 n개."""
+        return sorted(self.cumulative_us.items(), key=lambda item: item[1], reverse=True)[:n]
+
+
+def _run_importtime(statement: str, python: str) -> dict[str, tuple[int, int]]:
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        # import time:       self [us] |  cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        module = parts[2].strip()
+        timings[module] = (int(parts[0]), int(parts[1]))
+    return timings
+
+
+def measure_import_time(statement: str, python: str = sys.executable) -> ImportProfile:
+    """구문 실행에 드는 임포트 시간을 측정합니다.
+
+    Args:
+        statement: 측정할 파이썬 구문. 예: "from genport import BacktestParams"
+        python: 사용할 파이썬 실행 파일.
+
+    Returns:
+        인터프리터 시작 시 임포트되는 모듈을 제외한 임포트 프로파일.
+    """
+    baseline = _run_importtime("pass", python)
+    timings = _run_importtime(statement, python)
+
+    profile = ImportProfile(statement=statement)
+    for module, (self_us, cumulative_us) in timings.items():
+        if module in baseline:
+            continue
+        profile.self_us[module] = self_us
+        profile.cumulative_us[module] = cumulative_us
+    return profile
+
+
+def main() -> None:
+    statements = sys.argv[1:] or [
+        "import genport",
+        "from genport import BacktestParams",
+        "from src.broker.kiwoom import KiwoomClient",
+    ]
+    for statement in statements:
+        profile = measure_import_time(statement)
+        print(f"{statement}: {profile.total_ms:.1f} ms ({len(profile.modules)} modules)")
+        for module, cumulative_us in profile.top(5):
+            print(f"    {cumulative_us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
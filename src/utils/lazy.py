@@ -0,0 +1,43 @@
+"""패키지 속성 지연 로딩 (PEP 562).
+
+패키지 `__init__`에서 하위 모듈을 실제로 접근할 때 로드하도록 `__getattr__`와
+`__dir__`를 만듭니다.
+"""
+
+import sys
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_module(
+    package: str, attrs: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """패키지의 `__getattr__`, `__dir__`를 만듭니다.
+
+    속성은 처음 접근할 때 해당 모듈에서 불러와 패키지 네임스페이스에 저장하므로,
+    두 번째 접근부터는 `__getattr__`를 거치지 않습니다.
+
+    Example:
+        ```python
+        __getattr__, __dir__ = lazy_module(__name__, {"GenportBrowser": ".browser"})
+        ```
+
+    Args:
+        package: 패키지 이름 (`__name__`).
+        attrs: 속성 이름 → 모듈 경로. 상대 경로는 `package` 기준입니다.
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        module = attrs.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(attrs))
+
+    return __getattr__, __dir__
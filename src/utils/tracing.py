@@ -0,0 +1,337 @@
+"""경량 지연 시간 계측 모듈.
+
+스팬(span), 카운터, 히스토그램을 제공합니다. 비활성 상태에서는 `span()`이
+미리 만들어 둔 no-op 객체를 반환하므로 계측 코드를 운영 경로에 그대로 둘 수 있습니다.
+활성화하면 스팬을 JSON Lines 또는 Chrome trace 포맷 파일로 내보내고,
+단계별 p50/p95/p99 지연 시간을 집계합니다.
+
+Example:
+    ```python
+    from src.utils.tracing import ChromeTraceExporter, trace_context, tracer
+
+    tracer.enable(ChromeTraceExporter("logs/sweep.trace.json"))
+    with trace_context(strategy_id="12345"):
+        with tracer.span("genport.run"):
+            ...
+    print(tracer.summary())
+    tracer.disable()
+    ```
+
+환경변수 `TRADING_TRACE_FILE`을 설정하면 임포트 시 자동으로 활성화됩니다
+(`.json`이면 Chrome trace, 그 외에는 JSON Lines). Chrome trace는 프로세스마다
+파일을 따로 씁니다 (`trace.json` → `trace.<pid>.json`).
+"""
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Protocol
+
+# 현재 작업 컨텍스트 (request_id, strategy_id 등)
+_context: ContextVar[Mapping[str, Any]] = ContextVar("trace_context", default=MappingProxyType({}))
+# 현재 열린 스팬 ID (부모-자식 관계용)
+_current_span: ContextVar[int | None] = ContextVar("trace_current_span", default=None)
+
+
+@contextmanager
+def trace_context(**attrs: Any) -> Iterator[None]:
+    """블록 안에서 생성되는 스팬에 공통 속성을 붙입니다.
+
+    Example:
+        with trace_context(request_id=request_id, strategy_id=strategy_id):
+            ...
+    """
+    token = _context.set({**_context.get(), **attrs})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class Histogram:
+    """지연 시간 히스토그램.
+
+    개수/합계/최소/최대는 정확히 집계하고, 백분위수는 고정 크기 저장소 샘플링
+    (reservoir sampling)으로 근사하여 메모리를 일정하게 유지합니다.
+    """
+
+    def __init__(self, max_samples: int = 4096):
+        self.max_samples = max_samples
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._samples: list[float] = []
+        self._random = random.Random(0)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._samples) < self.max_samples:
+            self._samples.append(value)
+        else:
+            i = self._random.randrange(self.count)
+            if i < self.max_samples:
+                self._samples[i] = value
+
+    def percentile(self, q: float) -> float:
+        """백분위수 (q: 0~100)."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max if self.count else 0.0,
+        }
+
+
+class Exporter(Protocol):
+    """스팬 내보내기 인터페이스."""
+
+    def export(self, record: dict[str, Any]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonLinesExporter:
+    """스팬을 한 줄에 하나씩 JSON으로 기록합니다.
+
+    줄 단위로 버퍼를 비우므로 프로세스가 비정상 종료되어도 기록된 스팬은 남습니다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+
+    def export(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class ChromeTraceExporter:
+    """Chrome trace 포맷(chrome://tracing, Perfetto)으로 기록합니다.
+
+    스팬을 메모리에 모으지 않고 `traceEvents` 배열에 한 줄씩 이어 씁니다.
+    close() 시 배열을 닫으며, 닫지 못한 파일도 Perfetto에서 열 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8", buffering=1)
+        self._file.write('{"displayTimeUnit":"ms","traceEvents":[\n')
+        self._separator = ""
+        self._lock = threading.Lock()
+
+    def export(self, record: dict[str, Any]) -> None:
+        event = {
+            "name": record["name"],
+            "ph": "X",
+            "ts": record["start_us"],
+            "dur": record["duration_us"],
+            "pid": record["pid"],
+            "tid": record["tid"],
+            "args": record["attrs"],
+        }
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(self._separator + line + "\n")
+            self._separator = ","
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.write("]}\n")
+                self._file.close()
+
+
+class _NoopSpan:
+    """비활성 상태에서 사용하는 스팬."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """시간을 측정하는 구간."""
+
+    __slots__ = ("tracer", "name", "attrs", "span_id", "parent_id", "_start_ns", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = tracer._next_id()
+        self.parent_id: int | None = None
+        self._start_ns = 0
+        self._token: Any = None
+
+    def set(self, **attrs: Any) -> None:
+        """스팬에 속성을 추가합니다."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.parent_id = _current_span.get()
+        self._token = _current_span.set(self.span_id)
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._finish(self, self._start_ns, end_ns)
+
+
+class Tracer:
+    """스팬, 카운터, 히스토그램 수집기."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._exporter: Exporter | None = None
+        self._lock = threading.Lock()
+        self._ids = 0
+        self._counters: dict[str, float] = {}
+        self._histograms: dict[str, Histogram] = {}
+        # perf_counter 기준 시각을 벽시계(마이크로초)로 변환하기 위한 기준점
+        self._epoch_us = time.time_ns() // 1000 - time.perf_counter_ns() // 1000
+
+    def enable(self, exporter: Exporter | None = None) -> None:
+        """계측을 시작합니다. exporter가 없으면 메모리 집계만 합니다."""
+        self._exporter = exporter
+        self.enabled = True
+
+    def disable(self) -> None:
+        """계측을 중지하고 exporter를 닫습니다."""
+        self.enabled = False
+        if self._exporter:
+            self._exporter.close()
+            self._exporter = None
+
+    def reset(self) -> None:
+        """집계된 카운터와 히스토그램을 초기화합니다."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def span(self, name: str, **attrs: Any) -> Span | _NoopSpan:
+        """구간 측정용 컨텍스트 매니저를 반환합니다. 동기/비동기 코드 모두 사용 가능."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, attrs)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """카운터를 증가시킵니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """히스토그램에 값을 기록합니다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._histogram(name).observe(value)
+
+    def histogram(self, name: str) -> Histogram | None:
+        return self._histograms.get(name)
+
+    def counter(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    def summary(self) -> dict[str, Any]:
+        """카운터 값과 히스토그램별 count/mean/p50/p95/p99/max (밀리초)."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "histograms": {name: h.summary() for name, h in self._histograms.items()},
+            }
+
+    def _histogram(self, name: str) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        return histogram
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+    def _finish(self, span: Span, start_ns: int, end_ns: int) -> None:
+        duration_us = (end_ns - start_ns) // 1000
+        with self._lock:
+            self._histogram(span.name).observe(duration_us / 1000)
+        if self._exporter is None:
+            return
+        self._exporter.export(
+            {
+                "name": span.name,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "start_us": self._epoch_us + start_ns // 1000,
+                "duration_us": duration_us,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "attrs": {**_context.get(), **span.attrs},
+            }
+        )
+
+
+tracer = Tracer()
+
+_trace_file = os.getenv("TRADING_TRACE_FILE")
+if _trace_file:
+    if _trace_file.endswith(".json"):
+        # 워커 프로세스도 이 모듈을 임포트하므로 파일을 프로세스별로 분리
+        _trace_path = Path(_trace_file)
+        tracer.enable(
+            ChromeTraceExporter(_trace_path.with_name(f"{_trace_path.stem}.{os.getpid()}.json"))
+        )
+    else:
+        tracer.enable(JsonLinesExporter(_trace_file))
+    atexit.register(tracer.disable)
@@ -0,0 +1,33 @@
+"""공용 테스트 픽스처."""
+
+import os
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def qt_app() -> Any:
+    """offscreen 플랫폼의 QApplication (PyQt5가 없으면 건너뜀)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def server_factory(qt_app: Any) -> Iterator[Callable[..., Any]]:
+    """가짜 OCX로 Qt 이벤트 루프에 붙인 키움 서버를 만들고, 테스트가 끝나면 중지합니다."""
+    from src.broker.kiwoom.server import KiwoomServer
+
+    servers: list[KiwoomServer] = []
+
+    def factory(ocx: Any, **kwargs: Any) -> KiwoomServer:
+        server = KiwoomServer(bind_address="tcp://127.0.0.1:*", ocx=ocx, **kwargs)
+        server.start(block=False, use_qt=True)
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.stop()
@@ -0,0 +1,129 @@
+"""젠포트 백테스트 네트워크 응답 캡처 테스트.
+
+고정 응답을 돌려주는 로컬 스텁 서버로 젠포트 페이지를 흉내냅니다.
+"""
+
+import json
+import threading
+from collections.abc import Iterator
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from genport.backtest import GenportBacktest
+from genport.browser import GenportBrowser
+from genport.models import BacktestParams
+
+STRATEGY_PAGE = """<!doctype html>
+<html><body>
+<input name="startDate"><input name="endDate"><input name="initialCapital">
+<input name="commissionRate"><input name="maxHoldings">
+<button onclick="runBacktest()">백테스트 실행</button>
+<script>
+async function runBacktest() {
+  // 진행 상태를 폴링하다가 마지막 응답에서 결과를 받음
+  for (let i = 0; i < RESPONSE_COUNT; i++) {
+    await fetch('/api/strategy/backtest', {method: 'POST'});
+  }
+  // 차트/표 렌더링이 느린 상황을 흉내냄
+  setTimeout(() => {
+    const div = document.createElement('div');
+    div.className = 'backtest-result';
+    div.innerText = '총 수익률: 1.0% 샤프 비율: 0.5 거래 횟수: 3';
+    document.body.appendChild(div);
+  }, RENDER_DELAY_MS);
+}
+</script>
+</body></html>
+"""
+
+
+def make_handler(payloads: list[dict], render_delay_ms: int) -> type[BaseHTTPRequestHandler]:
+    remaining = list(payloads)
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def _send(self, body: str, content_type: str) -> None:
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            page = STRATEGY_PAGE.replace("RENDER_DELAY_MS", str(render_delay_ms)).replace(
+                "RESPONSE_COUNT", str(len(payloads))
+            )
+            self._send(page, "text/html; charset=utf-8")
+
+        def do_POST(self) -> None:
+            self._send(json.dumps(remaining.pop(0)), "application/json")
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return StubHandler
+
+
+@pytest.fixture
+def stub_server(request: pytest.FixtureRequest) -> Iterator[str]:
+    payloads, render_delay_ms = request.param
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(payloads, render_delay_ms))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+
+
+def make_browser(base_url: str) -> GenportBrowser:
+    class StubBrowser(GenportBrowser):
+        GENPORT_URL = base_url
+
+    return StubBrowser(headless=True)
+
+
+PARAMS = BacktestParams(start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stub_server", [([{"data": {"totalReturn": 25.0, "tradeCount": 12}}], 30000)], indirect=True
+)
+async def test_network_capture_skips_dom_render(stub_server: str) -> None:
+    """API 응답으로 렌더링 전에 결과를 읽는지 테스트."""
+    async with make_browser(stub_server) as browser:
+        backtest = GenportBacktest(browser, capture_network=True)
+        result = await backtest.run("S1", PARAMS)
+
+    assert result.total_return == 25.0
+    assert result.trade_count == 12
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_server", [([{"status": "queued"}], 200)], indirect=True)
+async def test_network_capture_falls_back_to_dom(stub_server: str) -> None:
+    """응답에 지표가 없으면 DOM 결과로 대체하는지 테스트."""
+    async with make_browser(stub_server) as browser:
+        backtest = GenportBacktest(browser, capture_network=True)
+        result = await backtest.run("S1", PARAMS)
+
+    assert result.total_return == 1.0
+    assert result.trade_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "stub_server",
+    [([{"status": "queued"}, {"status": "running"}, {"totalReturn": 7.0}], 30000)],
+    indirect=True,
+)
+async def test_network_capture_waits_past_status_polls(stub_server: str) -> None:
+    """진행 상태 응답은 건너뛰고 결과 응답을 기다리는지 테스트."""
+    async with make_browser(stub_server) as browser:
+        backtest = GenportBacktest(browser, capture_network=True)
+        result = await backtest.run("S1", PARAMS)
+
+    assert result.total_return == 7.0
@@ -0,0 +1,108 @@
+"""적응형 파라미터 탐색 테스트."""
+
+from datetime import date
+
+import pytest
+
+from genport.models import BacktestParams, BacktestResult
+from genport.optimize import (
+    SuccessiveHalving,
+    SurrogateSearch,
+    apply_overrides,
+    shorten_period,
+)
+
+BASE = BacktestParams(start_date=date(2015, 1, 1), end_date=date(2024, 1, 1))
+SPACE = {"max_holdings": [5, 10, 15, 20, 25, 30], "lookback": [1, 2, 3, 4, 5]}
+
+
+class FakeBacktest:
+    """max_holdings=20, lookback=3에서 최대가 되는 가짜 백테스트."""
+
+    def __init__(self) -> None:
+        self.calls: list[BacktestParams] = []
+
+    async def run(self, strategy_id: str, params: BacktestParams) -> BacktestResult:
+        self.calls.append(params)
+        lookback = params.strategy_params["lookback"]
+        if lookback == 5:
+            raise RuntimeError("젠포트 타임아웃")
+        sharpe = 2.0 - ((params.max_holdings - 20) / 10) ** 2 - ((lookback - 3) / 2) ** 2
+        return BacktestResult(
+            total_return=0.0,
+            cagr=0.0,
+            sharpe_ratio=sharpe,
+            max_drawdown=0.0,
+            win_rate=0.0,
+            trade_count=0,
+            raw_data={},
+        )
+
+
+def test_apply_overrides_routes_strategy_params() -> None:
+    """BacktestParams 필드와 전략 파라미터 분리 테스트."""
+    params = apply_overrides(BASE, {"max_holdings": 7, "lookback": 4})
+    assert params.max_holdings == 7
+    assert params.strategy_params == {"lookback": 4}
+    assert BASE.strategy_params == {}
+
+
+def test_shorten_period_keeps_recent_window() -> None:
+    """최근 구간 축소 테스트."""
+    params = shorten_period(BASE, 0.1)
+    assert params.end_date == BASE.end_date
+    total_days = (BASE.end_date - BASE.start_date).days
+    assert (params.end_date - params.start_date).days == round(total_days * 0.1)
+    assert shorten_period(BASE, 1.0) is BASE
+
+
+@pytest.mark.asyncio
+async def test_successive_halving_within_budget() -> None:
+    """연속 절반 제거 탐색 예산 및 최적값 테스트."""
+    fake = FakeBacktest()
+    search = SuccessiveHalving(fake.run, "S1", BASE, SPACE, max_runs=30, eta=3, seed=1)
+    result = await search.run()
+
+    assert result.runs == len(fake.calls) <= 30
+    fidelities = [t.fidelity for t in result.trials]
+    assert fidelities == sorted(fidelities)
+    assert fidelities[-1] == 1.0
+    assert fidelities[0] < 1.0
+    assert result.best_overrides == {"max_holdings": 20, "lookback": 3}
+    assert result.best_params.strategy_params == {"lookback": 3}
+
+
+@pytest.mark.asyncio
+async def test_successive_halving_budget_below_rung_count() -> None:
+    """예산이 단계 수보다 적으면 앞쪽 단계를 생략하고 평가할 후보만 샘플링하는지 테스트."""
+    fake = FakeBacktest()
+    search = SuccessiveHalving(fake.run, "S1", BASE, SPACE, max_runs=2, eta=3, seed=1)
+    sampled: list[int] = []
+    sample = search._sample
+    search._sample = lambda n: sampled.append(n) or sample(n)
+    result = await search.run()
+
+    # 1/9, 1/3, 1 세 단계 중 마지막 두 단계만 실행
+    assert [t.fidelity for t in result.trials] == [pytest.approx(1 / 3), 1.0]
+    assert sampled == [1]
+    assert result.trials[0].overrides == result.trials[1].overrides
+
+
+@pytest.mark.asyncio
+async def test_surrogate_search_finds_optimum_with_fraction_of_grid() -> None:
+    """대리 모델 탐색이 그리드 일부만 실행하고 최적값을 찾는지 테스트."""
+    fake = FakeBacktest()
+    search = SurrogateSearch(fake.run, "S1", BASE, SPACE, max_runs=15, n_initial=5, seed=3)
+    result = await search.run()
+
+    assert result.runs == 15 < search.space_size
+    assert result.best_score == pytest.approx(2.0)
+    assert any(t.error for t in result.trials) or all(
+        t.overrides["lookback"] != 5 for t in result.trials
+    )
+
+
+def test_empty_space_rejected() -> None:
+    """빈 탐색 공간 테스트."""
+    with pytest.raises(ValueError, match="탐색 공간"):
+        SuccessiveHalving(FakeBacktest().run, "S1", BASE, {"max_holdings": []})
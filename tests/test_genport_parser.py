@@ -0,0 +1,48 @@
+"""젠포트 결과 파서 테스트."""
+
+import pytest
+
+from genport.parser import GenportResultParser
+
+
+def test_parse_html() -> None:
+    """HTML 결과 파싱 테스트."""
+    html = "<div>총 수익률: 12.5%</div><div>샤프 비율: 1.3</div><div>거래 횟수: 42</div>"
+    result = GenportResultParser().parse(html)
+    assert result.total_return == 12.5
+    assert result.sharpe_ratio == 1.3
+    assert result.trade_count == 42
+
+
+def test_parse_payload_camel_case_nested() -> None:
+    """중첩된 camelCase API 응답 파싱 테스트."""
+    payload = {
+        "status": "ok",
+        "data": {
+            "totalReturn": "1,234.5%",
+            "cagr": 18.2,
+            "sharpeRatio": 1.1,
+            "mdd": -22.4,
+            "winRate": 55,
+            "tradeCount": "310",
+        },
+    }
+    result = GenportResultParser().parse_payload(payload)
+    assert result.total_return == 1234.5
+    assert result.cagr == 18.2
+    assert result.max_drawdown == -22.4
+    assert result.win_rate == 55.0
+    assert result.trade_count == 310
+    assert result.raw_data["payload"] is payload
+
+
+def test_parse_payload_without_metrics() -> None:
+    """지표가 없는 응답 테스트."""
+    with pytest.raises(ValueError, match="지표를 찾을 수 없습니다"):
+        GenportResultParser().parse_payload({"status": "queued"})
+
+
+def test_parse_payload_all_metrics_null() -> None:
+    """지표 키는 있지만 값이 모두 null인 진행 상태 응답 테스트."""
+    with pytest.raises(ValueError, match="모두 비어"):
+        GenportResultParser().parse_payload({"status": "running", "total_return": None})
@@ -0,0 +1,97 @@
+"""젠포트 스윕 오케스트레이터 테스트."""
+
+import time
+from datetime import date
+from functools import partial
+
+import pytest
+
+from genport.models import BacktestParams, BacktestResult
+from genport.sweep import LocalEngineRunner, SweepOrchestrator, SweepProgress, expand_grid
+
+
+def fake_engine(strategy_id: str, params: BacktestParams) -> BacktestResult:
+    """max_holdings를 수익률로 돌려주는 가짜 엔진."""
+    started = time.time()
+    if params.max_holdings < 0:
+        raise ValueError("잘못된 보유 종목 수")
+    if params.max_holdings == 999:
+        time.sleep(1.0)
+    return BacktestResult(
+        total_return=float(params.max_holdings),
+        cagr=0.0,
+        sharpe_ratio=params.slippage,
+        max_drawdown=0.0,
+        win_rate=0.0,
+        trade_count=0,
+        raw_data={"strategy_id": strategy_id, "started": started},
+    )
+
+
+@pytest.fixture
+def base_params() -> BacktestParams:
+    return BacktestParams(start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
+
+
+def test_expand_grid_full_product(base_params: BacktestParams) -> None:
+    """그리드 전체 조합 생성 테스트."""
+    combos = expand_grid(base_params, {"max_holdings": [5, 10], "slippage": [0.001, 0.002]})
+    assert len(combos) == 4
+    overrides, params = combos[-1]
+    assert overrides == {"max_holdings": 10, "slippage": 0.002}
+    assert params.max_holdings == 10
+    assert params.start_date == base_params.start_date
+
+
+def test_expand_grid_unknown_parameter(base_params: BacktestParams) -> None:
+    """알 수 없는 파라미터 테스트."""
+    with pytest.raises(ValueError, match="알 수 없는 파라미터"):
+        expand_grid(base_params, {"unknown": [1]})
+
+
+def test_orchestrator_runs_all_jobs(base_params: BacktestParams) -> None:
+    """여러 워커에서 모든 작업 실행 및 진행 상황 보고 테스트."""
+    updates: list[SweepProgress] = []
+    orchestrator = SweepOrchestrator(
+        partial(LocalEngineRunner, fake_engine), max_workers=2, progress=updates.append
+    )
+    outcomes = orchestrator.run("S1", base_params, {"max_holdings": [1, 2, 3, 4, 5]})
+
+    assert [o.result.total_return for o in outcomes] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert all(o.ok and o.attempts == 1 for o in outcomes)
+    assert outcomes[0].result.raw_data["strategy_id"] == "S1"
+    assert [u.completed for u in updates] == [1, 2, 3, 4, 5]
+    assert updates[-1].remaining == 0
+
+
+def test_orchestrator_retry_and_timeout(base_params: BacktestParams) -> None:
+    """실패 작업 재시도 및 타임아웃 테스트."""
+    orchestrator = SweepOrchestrator(
+        partial(LocalEngineRunner, fake_engine),
+        max_workers=1,
+        max_retries=2,
+        job_timeout=0.2,
+        retry_budget=3,
+    )
+    outcomes = orchestrator.run("S1", base_params, {"max_holdings": [-1, 999, 7]})
+
+    assert outcomes[0].error is not None and "ValueError" in outcomes[0].error
+    assert outcomes[0].attempts == 3
+    # 타임아웃된 엔진 호출이 스레드에서 아직 실행 중이므로 재시도하지 않음
+    assert outcomes[1].error is not None and "타임아웃" in outcomes[1].error
+    assert outcomes[1].attempts == 1
+    assert outcomes[2].ok
+
+
+def test_timed_out_engine_call_not_overlapped(base_params: BacktestParams) -> None:
+    """타임아웃된 엔진 호출이 끝난 뒤에 다음 작업을 시작하는지 테스트."""
+    orchestrator = SweepOrchestrator(
+        partial(LocalEngineRunner, fake_engine), max_workers=1, job_timeout=0.2
+    )
+    submitted = time.time()
+    outcomes = orchestrator.run("S1", base_params, {"max_holdings": [999, 7]})
+
+    assert outcomes[0].error is not None and "타임아웃" in outcomes[0].error
+    assert outcomes[0].elapsed < 0.9
+    # 1초 걸리는 첫 작업이 스레드에서 끝날 때까지 다음 작업을 시작하지 않음
+    assert outcomes[1].result.raw_data["started"] >= submitted + 1.0
@@ -0,0 +1,61 @@
+"""임포트 지연 로딩 테스트.
+
+짧은 작업이 무거운 의존성(Playwright, zmq 등)을 불러오지 않는지 새 인터프리터의
+`sys.modules`로 확인합니다. 임포트 시간은 `python -m src.utils.importtime`으로 측정합니다.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.importtime import PROJECT_ROOT
+
+HEAVY_MODULES = {"playwright", "zmq", "loguru", "pydantic", "pandas", "vectorbt", "backtrader"}
+
+
+def loaded_packages(statement: str) -> set[str]:
+    """새 인터프리터에서 구문을 실행한 뒤 로드된 최상위 패키지 이름."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.partition(".")[0] for name in json.loads(proc.stdout.splitlines()[-1])}
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import genport",
+        "from genport import BacktestParams, BacktestResult",
+        "from genport import GenportResultParser",
+        "from genport.sweep import SweepOrchestrator",
+        "from src.broker import BrokerInterface",
+        "from src.broker.kiwoom.protocol import IPCMessage",
+    ],
+)
+def test_light_imports_skip_heavy_modules(statement: str) -> None:
+    """가벼운 진입점이 무거운 모듈을 로드하지 않는지 테스트."""
+    assert not loaded_packages(statement) & HEAVY_MODULES
+
+
+def test_lazy_attribute_loads_on_access() -> None:
+    """지연 로딩 속성 접근 시 모듈 로드 테스트."""
+    assert "zmq" in loaded_packages("from src.broker.kiwoom import KiwoomClient")
+
+
+def test_unknown_lazy_attribute() -> None:
+    """존재하지 않는 속성 접근 테스트."""
+    import genport
+
+    with pytest.raises(AttributeError):
+        _ = genport.DoesNotExist
+    assert "GenportBrowser" in dir(genport)
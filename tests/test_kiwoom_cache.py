@@ -0,0 +1,132 @@
+"""키움 계좌 캐시 테스트.
+
+가짜 OCX로 서버를 실행하고, 체결/잔고 통보가 클라이언트 캐시에 반영되는지 확인합니다.
+"""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from src.broker.kiwoom import AccountCache, KiwoomClient
+from src.broker.kiwoom.server import (
+    FID_AVG_PRICE,
+    FID_CURRENT_PRICE,
+    FID_DEPOSIT,
+    FID_FILL_PRICE,
+    FID_FILL_QUANTITY,
+    FID_HOLDING_QUANTITY,
+    FID_ORDER_NO,
+    FID_SIDE,
+    FID_SYMBOL,
+)
+from tests.test_kiwoom_server import FakeKiwoomOCX, run_clients
+
+FILL = {
+    FID_ORDER_NO: "0012345",
+    FID_SYMBOL: "A005930",
+    FID_SIDE: "2",
+    FID_FILL_QUANTITY: "5",
+    FID_FILL_PRICE: "+71000",
+}
+BALANCE = {
+    FID_SYMBOL: "A005930",
+    FID_HOLDING_QUANTITY: "15",
+    FID_AVG_PRICE: "70333",
+    FID_CURRENT_PRICE: "-71000",
+    FID_DEPOSIT: "12000678",
+}
+
+
+def wait_for_events(cache: AccountCache, count: int, timeout: float = 2.0) -> None:
+    """PUB/SUB 전달은 비동기이므로 이벤트가 도착할 때까지 기다립니다."""
+    deadline = time.perf_counter() + timeout
+    received = 0
+    while received < count and time.perf_counter() < deadline:
+        received += cache.poll()
+        time.sleep(0.01)
+    assert received == count
+
+
+@pytest.fixture
+def seeded(server_factory: Callable) -> tuple:
+    """캐시를 한 번 조회하여 초기화한 클라이언트."""
+    ocx = FakeKiwoomOCX({})
+    server = server_factory(ocx)
+
+    def seed() -> KiwoomClient:
+        client = KiwoomClient(server.endpoint, timeout_ms=3000, cache_account=True)
+        client.get_balance()
+        return client
+
+    client = run_clients({"seed": seed})["seed"]
+    yield ocx, server, client
+    run_clients({"disconnect": client.disconnect})
+
+
+def test_reads_served_from_cache_after_seed(seeded: tuple) -> None:
+    """초기화 이후 조회가 TR 요청 없이 처리되는지 테스트."""
+    ocx, _, client = seeded
+    assert [tr for _, tr, _ in ocx.requests] == ["opw00001", "opw00018"]
+
+    for _ in range(100):
+        assert str(client.get_balance()) == "12345678"
+        assert client.get_positions()[0].quantity == 10
+
+    assert len(ocx.requests) == 2
+    assert client.account_cache.version == 1
+
+
+def test_chejan_events_update_cache(seeded: tuple) -> None:
+    """체결/잔고 통보가 캐시에 반영되는지 테스트."""
+    ocx, _, client = seeded
+    cache = client.account_cache
+    version = cache.version
+
+    ocx.send_chejan("0", FILL)
+    ocx.send_chejan("1", BALANCE)
+    wait_for_events(cache, 3)
+
+    assert str(client.get_balance()) == "12000678"
+    position = client.get_positions()[0]
+    assert (position.quantity, str(position.avg_price)) == (15, "70333")
+    assert str(position.unrealized_pnl) == str((71000 - 70333) * 15)
+    fill = cache.fills()[0]
+    assert (fill.order_id, fill.quantity, fill.side.value) == ("0012345", 5, "buy")
+    assert cache.seq == 3
+    assert cache.version > version
+    assert not cache.stale
+    assert len(ocx.requests) == 2
+
+    # 전량 매도 시 포지션 제거
+    ocx.send_chejan("1", {**BALANCE, FID_HOLDING_QUANTITY: "0"})
+    wait_for_events(cache, 2)
+    assert cache.position("005930") is None
+
+
+def test_sequence_gap_marks_cache_stale(seeded: tuple) -> None:
+    """누락된 이벤트가 있으면 다음 조회에서 서버와 다시 맞추는지 테스트."""
+    ocx, server, client = seeded
+    cache = client.account_cache
+
+    server._event_seq += 1  # 이벤트 1건 유실
+    server.publish("balance", {"balance": "1"})
+    wait_for_events(cache, 1)
+    assert cache.stale
+
+    results = run_clients({"balance": client.get_balance})
+    assert str(results["balance"]) == "12345678"
+    assert not cache.stale
+    assert cache.seq == 2
+    assert len(ocx.requests) == 4
+
+
+def test_explicit_refresh(seeded: tuple) -> None:
+    """refresh()로 서버 상태를 다시 불러오는지 테스트."""
+    ocx, _, client = seeded
+    version = client.account_cache.version
+
+    run_clients({"refresh": client.refresh})
+
+    assert client.account_cache.version == version + 1
+    assert len(ocx.requests) == 4
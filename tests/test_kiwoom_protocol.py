@@ -0,0 +1,80 @@
+"""키움 IPC 프로토콜 테스트."""
+
+import pytest
+
+from src.broker.interface import OHLCV
+from src.broker.kiwoom.protocol import IPCEvent, IPCMessage, IPCResponse, ProtocolError
+
+
+def test_message_roundtrip() -> None:
+    """IPCMessage 직렬화/역직렬화 테스트."""
+    msg = IPCMessage(method="get_balance", params={"account": "1234"}, request_id="r1")
+    decoded = IPCMessage.from_json(msg.to_json())
+    assert decoded == msg
+
+
+def test_message_defaults() -> None:
+    """IPCMessage 기본값 테스트."""
+    msg = IPCMessage.from_json('{"method": "ping"}')
+    assert msg.params == {}
+    assert msg.request_id is None
+
+
+def test_response_roundtrip_without_validation() -> None:
+    """검증 생략 모드 역직렬화 테스트."""
+    resp = IPCResponse(success=True, data=[{"symbol": "005930"}], request_id="r1")
+    decoded = IPCResponse.from_json(resp.to_json().encode(), validate=False)
+    assert decoded == resp
+
+
+def test_event_roundtrip() -> None:
+    """IPCEvent 직렬화/역직렬화 테스트."""
+    event = IPCEvent(topic="balance", seq=3, epoch="e1", data={"balance": "1000"})
+    assert IPCEvent.from_json(event.to_json()) == event
+    assert IPCEvent.from_json(event.to_json(), validate=False) == event
+    with pytest.raises(ProtocolError, match="필드 타입 오류"):
+        IPCEvent.from_json('{"topic": "fill", "seq": "1", "epoch": "e1"}')
+
+
+@pytest.mark.parametrize(
+    "raw, match",
+    [
+        ('{"params": {}}', "필수 필드 누락"),
+        ('{"method": 1}', "필드 타입 오류"),
+        ('{"method": "ping", "params": []}', "필드 타입 오류"),
+        ("[]", "JSON 객체가 필요합니다"),
+        ("{not json", "JSON 파싱 실패"),
+    ],
+)
+def test_message_validation_errors(raw: str, match: str) -> None:
+    """잘못된 메시지 검증 테스트."""
+    with pytest.raises(ProtocolError, match=match):
+        IPCMessage.from_json(raw)
+
+
+@pytest.mark.parametrize(
+    "cls, raw",
+    [
+        (IPCMessage, '{"params": {}}'),
+        (IPCMessage, "[]"),
+        (IPCResponse, '{"data": 1}'),
+        (IPCEvent, '{"topic": "fill", "seq": 1}'),
+        (IPCEvent, '"fill"'),
+    ],
+)
+def test_unvalidated_malformed_input(cls: type, raw: str) -> None:
+    """검증을 생략해도 형식 오류는 ProtocolError로 보고하는지 테스트."""
+    with pytest.raises(ProtocolError, match="메시지 형식 오류"):
+        cls.from_json(raw, validate=False)
+
+
+def test_response_requires_bool_success() -> None:
+    """IPCResponse success 필드 검증 테스트."""
+    with pytest.raises(ProtocolError):
+        IPCResponse.from_json('{"success": "yes"}')
+
+
+def test_models_have_no_instance_dict() -> None:
+    """__slots__ 모델 테스트."""
+    assert not hasattr(IPCMessage(method="ping"), "__dict__")
+    assert "__dict__" not in dir(OHLCV)
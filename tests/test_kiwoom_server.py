@@ -0,0 +1,332 @@
+"""키움 서버 Qt 이벤트 루프 연동 테스트.
+
+가짜 OCX와 offscreen Qt 플랫폼으로 실행합니다.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+
+import zmq  # noqa: E402
+
+from src.broker.kiwoom import KiwoomClient, KiwoomClientError  # noqa: E402
+from src.broker.kiwoom.protocol import IPCMessage, IPCResponse  # noqa: E402
+from src.broker.kiwoom.server import SCREEN_NO_COUNT  # noqa: E402
+
+
+class FakeSignal:
+    """pyqtSignal 대용."""
+
+    def __init__(self) -> None:
+        self._slots: list[Callable[..., None]] = []
+
+    def connect(self, slot: Callable[..., None]) -> None:
+        self._slots.append(slot)
+
+    def emit(self, *args: Any) -> None:
+        for slot in self._slots:
+            slot(*args)
+
+
+class FakeKiwoomOCX:
+    """TR 요청을 지연 후 OnReceiveTrData 이벤트로 응답하는 가짜 키움 OCX.
+
+    지연 시간이 None인 TR은 응답하지 않고, `messages`에 있는 TR은 OnReceiveMsg로
+    메시지만 보냅니다.
+    """
+
+    ROWS = {
+        "opw00001": [{"예수금": "000000012345678"}],
+        "opw00018": [
+            {
+                "종목번호": "A005930",
+                "보유수량": "000000000010",
+                "매입가": "000000070000",
+                "현재가": "-000000072000",
+                "평가손익": "000000020000",
+            }
+        ],
+        "opt10081": [
+            {
+                "일자": "20240103",
+                "시가": "71000",
+                "고가": "72000",
+                "저가": "70500",
+                "현재가": "71500",
+                "거래량": "1000",
+            },
+            {
+                "일자": "20240102",
+                "시가": "70000",
+                "고가": "71000",
+                "저가": "69500",
+                "현재가": "70800",
+                "거래량": "2000",
+            },
+        ],
+    }
+
+    def __init__(
+        self, delays_ms: dict[str, int | None], messages: dict[str, str] | None = None
+    ) -> None:
+        self.OnEventConnect = FakeSignal()
+        self.OnReceiveTrData = FakeSignal()
+        self.OnReceiveMsg = FakeSignal()
+        self.OnReceiveChejanData = FakeSignal()
+        self.delays_ms = delays_ms
+        self.messages = messages or {}
+        self.chejan: dict[int, str] = {}
+        self.inputs: dict[str, str] = {}
+        self.requests: list[tuple[str, str, str]] = []  # (rq_name, tr_code, screen_no)
+
+    def dynamicCall(self, signature: str, args: list[Any] = ()) -> Any:  # noqa: N802
+        name = signature.split("(")[0]
+        if name == "SetInputValue":
+            self.inputs[args[0]] = args[1]
+        elif name == "CommRqData":
+            rq_name, tr_code, _, screen_no = args
+            self.requests.append((rq_name, tr_code, screen_no))
+            if tr_code in self.messages:
+                message = self.messages[tr_code]
+                QtCore.QTimer.singleShot(
+                    0, lambda: self.OnReceiveMsg.emit(screen_no, rq_name, tr_code, message)
+                )
+            elif self.delays_ms.get(tr_code, 0) is not None:
+                QtCore.QTimer.singleShot(
+                    self.delays_ms.get(tr_code, 0),
+                    lambda: self.OnReceiveTrData.emit(screen_no, rq_name, tr_code, "", "0"),
+                )
+            return 0
+        elif name == "GetRepeatCnt":
+            return len(self.ROWS[args[0]])
+        elif name == "GetCommData":
+            tr_code, _, index, item = args
+            return self.ROWS[tr_code][index][item]
+        elif name == "GetChejanData":
+            return self.chejan.get(args[0], "")
+        elif name == "GetConnectState":
+            return 0
+        elif name == "CommConnect":
+            QtCore.QTimer.singleShot(10, lambda: self.OnEventConnect.emit(0))
+        return None
+
+    def send_chejan(self, gubun: str, fields: dict[int, str]) -> None:
+        """체결/잔고 통보를 발생시킵니다."""
+        self.chejan = fields
+        self.OnReceiveChejanData.emit(gubun, len(fields), ";".join(map(str, fields)))
+
+
+def run_clients(calls: dict[str, Callable[[], Any]], timeout: float = 5.0) -> dict[str, Any]:
+    """클라이언트 호출을 스레드에서 실행하는 동안 Qt 이벤트 루프를 돌립니다."""
+    results: dict[str, Any] = {}
+    finished: dict[str, float] = {}
+    started = time.perf_counter()
+
+    def worker(name: str, call: Callable[[], Any]) -> None:
+        results[name] = call()
+        finished[name] = time.perf_counter() - started
+
+    threads = [threading.Thread(target=worker, args=item) for item in calls.items()]
+    for thread in threads:
+        thread.start()
+
+    loop = QtCore.QEventLoop()
+    timer = QtCore.QTimer()
+    timer.timeout.connect(lambda: loop.quit() if not any(t.is_alive() for t in threads) else None)
+    timer.start(5)
+    QtCore.QTimer.singleShot(int(timeout * 1000), loop.quit)
+    loop.exec_()
+    timer.stop()
+
+    for thread in threads:
+        thread.join(timeout=1)
+    results["_finished"] = finished
+    return results
+
+
+def test_concurrent_tr_requests_complete_out_of_order(server_factory: Callable) -> None:
+    """여러 TR 요청이 동시에 진행되고 이벤트 순서대로 응답되는지 테스트."""
+    ocx = FakeKiwoomOCX({"opw00001": 400, "opw00018": 20})
+    server = server_factory(ocx)
+    endpoint = server.endpoint
+
+    results = run_clients(
+        {
+            "balance": lambda: KiwoomClient(endpoint, timeout_ms=3000).get_balance(),
+            "positions": lambda: KiwoomClient(endpoint, timeout_ms=3000).get_positions(),
+        }
+    )
+
+    assert str(results["balance"]) == "12345678"
+    position = results["positions"][0]
+    assert position.symbol == "005930"
+    assert position.quantity == 10
+    assert str(position.current_price) == "72000"
+    # 느린 잔고 조회가 포지션 조회를 막지 않음
+    assert results["_finished"]["positions"] < results["_finished"]["balance"]
+    assert len({screen for _, _, screen in ocx.requests}) == 2
+    assert server.pending_count == 0
+
+
+def test_ping_not_blocked_by_pending_tr(server_factory: Callable) -> None:
+    """TR 대기 중에도 다른 요청이 즉시 처리되는지 테스트."""
+    server = server_factory(FakeKiwoomOCX({"opw00001": 1000}))
+    endpoint = server.endpoint
+
+    results = run_clients(
+        {
+            "balance": lambda: KiwoomClient(endpoint, timeout_ms=3000).get_balance(),
+            "ping": lambda: (time.sleep(0.05), KiwoomClient(endpoint, timeout_ms=3000).ping())[1],
+        }
+    )
+
+    assert results["ping"] is True
+    assert results["_finished"]["ping"] < 0.5
+    assert results["_finished"]["balance"] >= 1.0
+
+
+def test_connect_and_historical_data(server_factory: Callable) -> None:
+    """로그인 이벤트 및 일봉 조회 테스트."""
+    server = server_factory(FakeKiwoomOCX({}))
+    endpoint = server.endpoint
+
+    def connect_then_fetch() -> Any:
+        from datetime import datetime
+
+        client = KiwoomClient(endpoint, timeout_ms=3000)
+        connected = client.connect()
+        candles = client.get_historical_data(
+            "005930", datetime(2024, 1, 1), datetime(2024, 1, 2, 23, 59)
+        )
+        return connected, candles
+
+    results = run_clients({"flow": connect_then_fetch})
+    connected, candles = results["flow"]
+
+    assert connected is True
+    assert len(candles) == 1
+    assert str(candles[0].close) == "70800"
+
+
+def test_unanswered_tr_expires_and_frees_screen(server_factory: Callable) -> None:
+    """응답 없는 TR이 제한 시간 후 실패하고 화면번호를 반환하는지 테스트."""
+    ocx = FakeKiwoomOCX({"opw00001": None})
+    server = server_factory(ocx, tr_timeout=0.2)
+    endpoint = server.endpoint
+
+    def get_balance() -> str:
+        try:
+            KiwoomClient(endpoint, timeout_ms=3000).get_balance()
+        except KiwoomClientError as e:
+            return str(e)
+        return "ok"
+
+    results = run_clients({"balance": get_balance})
+
+    assert "TR 응답 시간 초과" in results["balance"]
+    assert results["_finished"]["balance"] < 2.0
+    assert server.pending_count == 0
+    assert len(server._free_screens) == SCREEN_NO_COUNT
+
+
+def test_error_message_fails_matching_tr(server_factory: Callable) -> None:
+    """OnReceiveMsg 오류 메시지가 해당 TR만 실패시키는지 테스트."""
+    ocx = FakeKiwoomOCX(
+        {"opw00018": 100}, messages={"opw00001": "[800033] 조회 횟수 제한을 초과했습니다"}
+    )
+    server = server_factory(ocx)
+    endpoint = server.endpoint
+
+    def get_balance() -> str:
+        try:
+            KiwoomClient(endpoint, timeout_ms=3000).get_balance()
+        except KiwoomClientError as e:
+            return str(e)
+        return "ok"
+
+    results = run_clients(
+        {
+            "balance": get_balance,
+            "positions": lambda: KiwoomClient(endpoint, timeout_ms=3000).get_positions(),
+        }
+    )
+
+    assert "조회 횟수 제한" in results["balance"]
+    assert results["_finished"]["balance"] < 1.0
+    assert results["positions"][0].symbol == "005930"
+    assert server.pending_count == 0
+    assert len(server._free_screens) == SCREEN_NO_COUNT
+
+
+def test_request_queued_behind_expiring_tr_is_served(server_factory: Callable) -> None:
+    """TR 만료 응답을 보내는 동안 도착한 요청이 멈추지 않고 처리되는지 테스트."""
+    server = server_factory(FakeKiwoomOCX({"opw00001": None}), tr_timeout=0.2)
+    endpoint = server.endpoint
+    expiring = threading.Event()
+    fail = server._fail
+
+    def slow_fail(key: str, error: str) -> None:
+        # 만료 처리 중에 다음 요청이 도착하게 하고, 송신으로 FD 알림이 소모된 경우를
+        # 재현하기 위해 소켓 알림을 끔 (이후로는 만료 처리 뒤의 재확인만 요청을 처리)
+        expiring.set()
+        assert server._socket.poll(2000)
+        server._notifier.setEnabled(False)
+        fail(key, error)
+
+    server._fail = slow_fail
+
+    def ping_during_expiry() -> bool:
+        assert expiring.wait(2.0)
+        return KiwoomClient(endpoint, timeout_ms=1000).ping()
+
+    # 실패 응답을 받은 클라이언트의 연결 종료가 서버를 깨우지 않도록 끝까지 유지
+    balance_client = KiwoomClient(endpoint, timeout_ms=3000)
+
+    def get_balance() -> str:
+        try:
+            balance_client.get_balance()
+        except KiwoomClientError as e:
+            return str(e)
+        return "ok"
+
+    results = run_clients({"balance": get_balance, "ping": ping_during_expiry})
+
+    assert "TR 응답 시간 초과" in results["balance"]
+    assert results["ping"] is True
+    assert results["_finished"]["ping"] < 1.0
+
+
+def test_duplicate_request_id_rejected(server_factory: Callable) -> None:
+    """대기 중인 요청과 같은 request_id는 거부하고 앞선 요청은 그대로 응답하는지 테스트."""
+    ocx = FakeKiwoomOCX({"opw00001": 300})
+    server = server_factory(ocx)
+    endpoint = server.endpoint
+    context = zmq.Context.instance()
+
+    def request() -> IPCResponse:
+        socket = context.socket(zmq.REQ)
+        socket.setsockopt(zmq.RCVTIMEO, 3000)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(endpoint)
+        try:
+            socket.send_string(IPCMessage("get_balance", request_id="same").to_json())
+            return IPCResponse.from_json(socket.recv_string())
+        finally:
+            socket.close()
+
+    results = run_clients({"first": request, "second": lambda: (time.sleep(0.05), request())[1]})
+
+    first, second = results["first"], results["second"]
+    assert first.success and first.data == {"balance": "12345678", "currency": "KRW"}
+    assert not second.success
+    assert second.request_id == "same"
+    assert "이미 처리 중" in second.error
+    assert results["_finished"]["second"] < results["_finished"]["first"]
+    assert len(ocx.requests) == 1
+    assert server.pending_count == 0
+    assert len(server._free_screens) == SCREEN_NO_COUNT
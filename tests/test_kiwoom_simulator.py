@@ -0,0 +1,215 @@
+"""키움 모의 백엔드 및 부하 테스트 하네스 테스트."""
+
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from src.broker.interface import Order, OrderSide, OrderType
+from src.broker.kiwoom import KiwoomClient
+from src.broker.kiwoom.loadtest import run_load_test
+from src.broker.kiwoom.server import KiwoomServer
+from src.broker.kiwoom.simulator import (
+    SimulatorBackend,
+    Tick,
+    TRLimitExceeded,
+    round_to_tick,
+    synthetic_ticks,
+)
+
+T0 = datetime(2024, 1, 2, 9, 0)
+
+
+class FakeClock:
+    """수동으로 진행하는 시계."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_backend(ticks: list[Tick], **kwargs: Any) -> tuple[SimulatorBackend, FakeClock, list]:
+    clock = FakeClock()
+    events: list[tuple[str, dict]] = []
+    backend = SimulatorBackend(ticks, clock=clock, publish_ticks=False, **kwargs)
+    backend.attach(lambda topic, data: events.append((topic, data)) or len(events))
+    return backend, clock, events
+
+
+def tick(seconds: float, price: int, symbol: str = "005930") -> Tick:
+    return Tick(
+        timestamp=T0 + timedelta(seconds=seconds),
+        symbol=symbol,
+        price=Decimal(price),
+        volume=10,
+        bid=Decimal(price - 100),
+        ask=Decimal(price),
+    )
+
+
+def test_round_to_tick() -> None:
+    """호가 단위 반올림 테스트."""
+    assert round_to_tick(Decimal("70049")) == Decimal("70000")
+    assert round_to_tick(Decimal("70050")) == Decimal("70100")
+    assert round_to_tick(Decimal("1234.6")) == Decimal("1235")
+
+
+def test_market_order_fills_after_latency_with_slippage() -> None:
+    """시장가 주문이 지연 후 슬리피지를 반영해 체결되는지 테스트."""
+    backend, clock, events = make_backend(
+        [tick(0, 70000)], fill_latency_ms=50, slippage_bps=20, commission_rate=Decimal("0")
+    )
+    backend.process()
+
+    order_id = backend.submit_order(
+        {"symbol": "005930", "side": "buy", "order_type": "market", "quantity": 10}
+    )["order_id"]
+    clock.now = 0.049
+    assert backend.process() == pytest.approx(0.001)
+    assert events == []
+
+    clock.now = 0.05
+    backend.process()
+    assert [topic for topic, _ in events] == ["fill", "position", "balance"]
+    fill = events[0][1]
+    assert fill["order_id"] == order_id
+    assert fill["price"] == "70100"  # 70000 * 1.002 = 70140 -> 호가 단위 100
+    assert events[1][1]["quantity"] == 10
+    assert backend.cash == Decimal("100000000") - Decimal("701000")
+    assert backend.get_positions({})[0]["avg_price"] == "70100"
+
+
+def test_limit_order_rests_until_price_crosses() -> None:
+    """지정가 주문이 가격 도달 시 체결되고, 취소할 수 있는지 테스트."""
+    backend, clock, events = make_backend(
+        [tick(0, 70000), tick(1, 69500), tick(2, 69000)], fill_latency_ms=0
+    )
+    backend.process()
+    order = {"symbol": "005930", "side": "buy", "order_type": "limit", "quantity": 1}
+    resting = backend.submit_order({**order, "price": "69000"})["order_id"]
+    cancelled = backend.submit_order({**order, "price": "68000"})["order_id"]
+
+    clock.now = 1.0
+    backend.process()
+    assert events == []
+
+    clock.now = 2.0
+    backend.process()
+    assert events[0][1]["order_id"] == resting
+    assert events[0][1]["price"] == "69000"
+    assert backend.cancel_order({"order_id": cancelled})["cancelled"] is True
+    assert backend.cancel_order({"order_id": resting})["cancelled"] is False
+    assert backend.process() is None
+    # 체결/취소된 주문은 종목별 색인에서도 제거
+    assert backend._symbol_orders == {}
+
+
+def test_order_validation() -> None:
+    """매도 가능 수량/주문 가능 금액 검증 테스트."""
+    backend, _, _ = make_backend([tick(0, 70000)], initial_cash=Decimal("100000"))
+    backend.process()
+    with pytest.raises(ValueError, match="매도 가능 수량 부족"):
+        backend.submit_order(
+            {"symbol": "005930", "side": "sell", "order_type": "market", "quantity": 1}
+        )
+    with pytest.raises(ValueError, match="주문 가능 금액 부족"):
+        backend.submit_order(
+            {"symbol": "005930", "side": "buy", "order_type": "market", "quantity": 2}
+        )
+
+
+def test_tr_rate_limit() -> None:
+    """TR 조회 횟수 제한 테스트."""
+    backend, clock, _ = make_backend([tick(0, 70000)], tr_limit=5)
+    for _ in range(5):
+        backend.get_balance({})
+    with pytest.raises(TRLimitExceeded):
+        backend.get_positions({})
+
+    clock.now = 1.0
+    backend.get_balance({})
+
+
+def test_historical_data_from_replay() -> None:
+    """재생 데이터 일봉 조회 테스트."""
+    ticks = [tick(0, 70000), tick(60, 71000), tick(120, 69000), tick(86400, 72000)]
+    backend, _, _ = make_backend(ticks)
+    candles = backend.get_historical_data(
+        {"symbol": "005930", "start_date": "2024-01-01", "end_date": "2024-01-02T23:59:59"}
+    )
+    assert len(candles) == 1
+    assert {k: candles[0][k] for k in ("open", "high", "low", "close", "volume")} == {
+        "open": "70000",
+        "high": "71000",
+        "low": "69000",
+        "close": "69000",
+        "volume": 30,
+    }
+
+
+@pytest.fixture
+def sim_server() -> KiwoomServer:
+    backend = SimulatorBackend(
+        synthetic_ticks(["005930", "000660"], count=2000, interval=timedelta(milliseconds=10)),
+        fill_latency_ms=10,
+        tr_limit=None,
+        order_limit=None,
+    )
+    server = KiwoomServer(
+        bind_address="tcp://127.0.0.1:*", event_address="tcp://127.0.0.1:*", backend=backend
+    )
+    thread = server.start_thread()
+    yield server
+    server.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_simulated_fill_reaches_account_cache(sim_server: KiwoomServer) -> None:
+    """모의 체결 이벤트가 클라이언트 계좌 캐시에 반영되는지 테스트."""
+    client = KiwoomClient(sim_server.endpoint, timeout_ms=3000, cache_account=True)
+    try:
+        assert client.get_positions() == []
+        client.submit_order(
+            Order(symbol="005930", side=OrderSide.BUY, order_type=OrderType.MARKET, quantity=3)
+        )
+
+        # 포지션과 예수금 이벤트가 따로 오므로 둘 다 반영될 때까지 대기
+        deadline = time.perf_counter() + 2
+        while time.perf_counter() < deadline and not (
+            client.get_positions() and client.get_balance() < Decimal("100000000")
+        ):
+            time.sleep(0.01)
+
+        position = client.get_positions()[0]
+        assert (position.symbol, position.quantity) == ("005930", 3)
+        assert client.get_balance() < Decimal("100000000")
+        assert client.account_cache.fills()[0].quantity == 3
+    finally:
+        client.disconnect()
+
+
+def test_load_test_report(sim_server: KiwoomServer) -> None:
+    """부하 테스트 하네스 실행 테스트."""
+    report = run_load_test(sim_server.endpoint, clients=2, duration=0.5)
+
+    summary = report.summary()
+    assert summary["requests"] > 0
+    assert summary["errors"] == 0
+    assert summary["throughput"] > 0
+    assert report.events > 0  # 재생 틱 및 체결 이벤트
+    assert set(summary["methods"]) <= {
+        "ping",
+        "get_balance",
+        "get_positions",
+        "submit_order",
+        "cancel_order",
+        "get_historical_data",
+    }
+    latency = summary["latency"]
+    assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert "p95" in report.format()
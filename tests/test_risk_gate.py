@@ -0,0 +1,214 @@
+"""주문 전 리스크 점검 게이트 테스트."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.broker.interface import OHLCV, BrokerInterface, Order, OrderSide, OrderType, Position
+from src.broker.risk import RiskGate, RiskLimits, RiskRejectedError, SymbolLimits
+
+
+class FakeBroker(BrokerInterface):
+    """제출된 주문을 기록하는 가짜 브로커."""
+
+    def __init__(self, positions: list[Position] | None = None):
+        self.positions = positions or []
+        self.submitted: list[Order] = []
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self) -> None:
+        pass
+
+    def get_balance(self) -> Decimal:
+        return Decimal("100000000")
+
+    def get_positions(self) -> list[Position]:
+        return self.positions
+
+    def submit_order(self, order: Order) -> str:
+        self.submitted.append(order)
+        return f"ORD{len(self.submitted)}"
+
+    def cancel_order(self, order_id: str) -> bool:
+        return True
+
+    def get_historical_data(
+        self, symbol: str, start_date: datetime, end_date: datetime, interval: str = "1d"
+    ) -> list[OHLCV]:
+        return []
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def limit(symbol: str, side: OrderSide, quantity: int, price: str) -> Order:
+    return Order(symbol, side, OrderType.LIMIT, quantity, Decimal(price))
+
+
+def rejection(gate: RiskGate, order: Order) -> str:
+    with pytest.raises(RiskRejectedError) as info:
+        gate.submit_order(order)
+    return info.value.reason
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def gate(clock: FakeClock) -> RiskGate:
+    limits = RiskLimits(
+        default=SymbolLimits(max_order_notional=Decimal("1000000"), max_position=20),
+        symbols={
+            "005930": SymbolLimits(
+                max_position=12, reference_price=Decimal("70000"), price_band=Decimal("0.3")
+            )
+        },
+        max_gross_exposure=Decimal("1500000"),
+    )
+    gate = RiskGate(FakeBroker(), limits, clock=clock)
+    gate.connect()
+    return gate
+
+
+def test_limits_and_price_band(gate: RiskGate) -> None:
+    """종목별 한도, 금액 한도, 가격 범위 점검 테스트."""
+    assert rejection(gate, limit("005930", OrderSide.BUY, 0, "70000")) == "quantity"
+    assert rejection(gate, limit("005930", OrderSide.BUY, 1, "48000")) == "price_band"
+    # 종목별 보유 한도(12주)가 기본 한도(20주)보다 우선
+    assert rejection(gate, limit("005930", OrderSide.BUY, 13, "70000")) == "position"
+    # 종목별로 지정하지 않은 금액 한도는 기본값(100만원) 적용
+    assert rejection(gate, limit("005930", OrderSide.BUY, 12, "90000")) == "order_notional"
+    assert rejection(gate, limit("000660", OrderSide.BUY, 10, "150000")) == "order_notional"
+    # 기준가가 없는 종목의 시장가 주문은 금액을 계산할 수 없음
+    market = Order("000660", OrderSide.BUY, OrderType.MARKET, 1)
+    assert rejection(gate, market) == "no_price"
+
+    gate.set_price("000660", Decimal("150000"))
+    assert gate.submit_order(market) == "ORD1"
+    assert gate.broker.submitted == [market]
+    assert gate.rejected == {
+        "quantity": 1,
+        "price_band": 1,
+        "position": 1,
+        "order_notional": 2,
+        "no_price": 1,
+    }
+    assert gate.checks == 7
+
+
+def test_running_exposure_and_cancel(gate: RiskGate, clock: FakeClock) -> None:
+    """미체결 노출 누적, 취소 시 복원, 중복 주문 점검 테스트."""
+    gate.submit_order(limit("005930", OrderSide.BUY, 6, "70000"))
+    assert gate.gross_exposure == Decimal("420000")
+    # 보유 0 + 미체결 6 + 7 > 12
+    assert rejection(gate, limit("005930", OrderSide.BUY, 7, "70000")) == "position"
+
+    order_id = gate.submit_order(limit("035720", OrderSide.BUY, 20, "50000"))
+    assert gate.gross_exposure == Decimal("1420000")
+    clock.now += 5
+    assert rejection(gate, limit("000660", OrderSide.BUY, 2, "100000")) == "gross_exposure"
+
+    assert gate.cancel_order(order_id)
+    assert gate.gross_exposure == Decimal("420000")
+    gate.submit_order(limit("000660", OrderSide.BUY, 2, "100000"))
+
+    # 같은 주문을 바로 다시 제출하면 거부, 시간 창이 지나면 허용
+    assert rejection(gate, limit("000660", OrderSide.BUY, 2, "100000")) == "duplicate"
+    clock.now += 1.5
+    gate.submit_order(limit("000660", OrderSide.BUY, 2, "100000"))
+
+
+def test_sync_and_fills(clock: FakeClock) -> None:
+    """보유 포지션 동기화 및 체결 반영 테스트."""
+    broker = FakeBroker(
+        [Position("005930", 8, Decimal("68000"), Decimal("70000"), Decimal("16000"))]
+    )
+    gate = RiskGate(broker, RiskLimits(default=SymbolLimits(max_position=10)), clock=clock)
+    gate.connect()
+    assert gate.gross_exposure == Decimal("560000")
+
+    # 보유 8 + 매수 3 > 10
+    assert rejection(gate, Order("005930", OrderSide.BUY, OrderType.MARKET, 3)) == "position"
+    sell_id = gate.submit_order(Order("005930", OrderSide.SELL, OrderType.MARKET, 8))
+    # 보유 8주를 모두 매도 주문했으므로 추가 매도는 공매도
+    assert rejection(gate, Order("005930", OrderSide.SELL, OrderType.MARKET, 3)) == "short"
+
+    gate.on_fill(sell_id, 8, Decimal("70000"))
+    assert gate.gross_exposure == Decimal("0")
+    # 전량 체결된 주문을 취소해도 다시 되돌리지 않음
+    gate.cancel_order(sell_id)
+    assert gate.gross_exposure == Decimal("0")
+    gate.submit_order(Order("005930", OrderSide.BUY, OrderType.MARKET, 10))
+
+    stats = gate.stats()
+    assert stats["checks"] == 4
+    assert stats["latency_us"]["count"] == 4
+
+
+def test_partial_fill_then_cancel(gate: RiskGate) -> None:
+    """부분 체결 후 취소하면 남은 미체결분만 되돌리는지 테스트."""
+    order_id = gate.submit_order(limit("005930", OrderSide.BUY, 10, "70000"))
+    assert gate.gross_exposure == Decimal("700000")
+
+    gate.on_fill(order_id, 4, Decimal("71000"))
+    # 미체결 6주(420,000) + 보유 4주(284,000)
+    assert gate.gross_exposure == Decimal("704000")
+
+    assert gate.cancel_order(order_id)
+    assert gate.gross_exposure == Decimal("284000")
+    # 체결된 4주는 보유로 남고 미체결 6주만 해제: 4 + 9 > 12
+    assert rejection(gate, limit("005930", OrderSide.BUY, 9, "70000")) == "position"
+    gate.submit_order(limit("005930", OrderSide.BUY, 8, "70000"))
+
+    # 취소된 주문의 늦은 체결 통보는 무시
+    gate.on_fill(order_id, 6, Decimal("71000"))
+    assert gate.gross_exposure == Decimal("844000")
+
+
+def test_sell_fill_releases_only_its_symbol(clock: FakeClock) -> None:
+    """이익 매도 체결이 다른 종목의 노출까지 지우지 않는지 테스트."""
+    broker = FakeBroker(
+        [
+            Position("A", 10, Decimal("100"), Decimal("100"), Decimal("0")),
+            Position("B", 10, Decimal("100"), Decimal("100"), Decimal("0")),
+        ]
+    )
+    limits = RiskLimits(max_gross_exposure=Decimal("2500"), duplicate_window=0)
+    gate = RiskGate(broker, limits, clock=clock)
+    gate.connect()
+    assert gate.gross_exposure == Decimal("2000")
+
+    sell_id = gate.submit_order(limit("A", OrderSide.SELL, 10, "200"))
+    gate.on_fill(sell_id, 4, Decimal("200"))
+    # A 보유 금액 1,000 중 4/10만 해제
+    assert gate.gross_exposure == Decimal("1600")
+    gate.on_fill(sell_id, 6, Decimal("200"))
+    # B 보유 1,000은 그대로 남음
+    assert gate.gross_exposure == Decimal("1000")
+    assert rejection(gate, limit("C", OrderSide.BUY, 25, "100")) == "gross_exposure"
+    gate.submit_order(limit("C", OrderSide.BUY, 15, "100"))
+    assert gate.gross_exposure == Decimal("2500")
+
+
+def test_sync_keeps_working_orders(gate: RiskGate) -> None:
+    """동기화 후에도 미체결 주문이 한도 점검과 체결 반영에 남아 있는지 테스트."""
+    order_id = gate.submit_order(limit("005930", OrderSide.BUY, 10, "70000"))
+    gate.sync()
+    assert gate.gross_exposure == Decimal("700000")
+    # 보유 0 + 미체결 10 + 3 > 12
+    assert rejection(gate, limit("005930", OrderSide.BUY, 3, "70000")) == "position"
+
+    gate.on_fill(order_id, 10, Decimal("70000"))
+    assert gate.gross_exposure == Decimal("700000")
+    assert rejection(gate, limit("005930", OrderSide.BUY, 3, "70000")) == "position"
+    gate.submit_order(limit("005930", OrderSide.BUY, 2, "70000"))
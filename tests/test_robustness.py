@@ -0,0 +1,83 @@
+"""백테스트 강건성 분석 테스트."""
+
+import numpy as np
+import pytest
+
+from src.strategy import robustness
+from src.strategy.robustness import block_bootstrap, path_metrics, trade_reshuffle
+
+
+@pytest.fixture
+def equity_curve() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0005, 0.01, 500)
+    return 10_000_000 * np.concatenate([[1.0], np.cumprod(1 + returns)])
+
+
+def test_path_metrics_matches_loop() -> None:
+    """벡터화 지표와 반복문 계산 일치 테스트."""
+    returns = np.array([0.1, -0.2, 0.05, 0.1, -0.05])
+    cagr, sharpe, mdd = path_metrics(returns, periods_per_year=5)
+
+    equity, peak, worst = 1.0, 1.0, 0.0
+    for r in returns:
+        equity *= 1 + r
+        peak = max(peak, equity)
+        worst = min(worst, equity / peak - 1)
+    assert cagr[0] == pytest.approx(equity - 1)
+    assert sharpe[0] == pytest.approx(returns.mean() / returns.std(ddof=1) * np.sqrt(5))
+    assert mdd[0] == pytest.approx(worst)
+
+
+def test_block_bootstrap_reproducible_across_workers(equity_curve: np.ndarray) -> None:
+    """같은 시드면 워커 수와 관계없이 같은 결과인지 테스트."""
+    single = block_bootstrap(equity_curve, simulations=600, seed=7, workers=1, batch_size=100)
+    parallel = block_bootstrap(equity_curve, simulations=600, seed=7, workers=2, batch_size=100)
+    other = block_bootstrap(equity_curve, simulations=600, seed=8, workers=1, batch_size=100)
+
+    for name in ("cagr", "sharpe", "max_drawdown"):
+        np.testing.assert_array_equal(single.samples[name], parallel.samples[name])
+    assert not np.array_equal(single.samples["cagr"], other.samples["cagr"])
+
+    assert len(single.samples["cagr"]) == 600
+    for interval in (single.cagr, single.sharpe, single.max_drawdown):
+        assert interval.lower <= interval.median <= interval.upper
+        assert interval.lower <= interval.estimate <= interval.upper
+    assert single.max_drawdown.upper <= 0
+    assert 0 <= single.prob_loss <= 1
+
+
+def test_few_batches_run_in_process(
+    equity_curve: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """workers=None이고 배치가 적으면 프로세스를 띄우지 않는지 테스트."""
+
+    def no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("프로세스 풀을 만들면 안 됩니다")
+
+    monkeypatch.setattr(robustness.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(robustness, "ProcessPoolExecutor", no_pool)
+    result = block_bootstrap(equity_curve, simulations=1000, seed=7)
+    assert len(result.samples["cagr"]) == 1000
+
+
+def test_trade_reshuffle_permutation_keeps_final_return() -> None:
+    """순서만 섞으면 CAGR은 같고 낙폭만 달라지는지 테스트."""
+    trades = np.array([0.05, -0.03, 0.08, -0.1, 0.02, 0.04, -0.02, 0.06])
+    result = trade_reshuffle(trades, years=1.0, simulations=300, replace=False, seed=1, workers=1)
+
+    np.testing.assert_allclose(result.samples["cagr"], result.cagr.estimate)
+    assert result.max_drawdown.lower < result.max_drawdown.upper
+
+    bootstrap = trade_reshuffle(trades, years=1.0, simulations=300, seed=1, workers=1)
+    assert bootstrap.cagr.lower < bootstrap.cagr.upper
+
+
+def test_invalid_inputs(equity_curve: np.ndarray) -> None:
+    """잘못된 입력 테스트."""
+    with pytest.raises(ValueError, match="block_size"):
+        block_bootstrap(equity_curve, block_size=1000)
+    with pytest.raises(ValueError, match="3개 이상"):
+        block_bootstrap([1.0, 2.0])
+    with pytest.raises(ValueError, match="years"):
+        trade_reshuffle([0.1, 0.2], years=0)
@@ -0,0 +1,106 @@
+"""공유 메모리 시세 데이터 테스트."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.broker.interface import OHLCV
+from src.data.shared_market import SharedMarketData, SharedMarketHandle, SharedMarketView
+
+_market: SharedMarketView | None = None
+
+
+def init_worker(handle: SharedMarketHandle) -> None:
+    global _market
+    _market = SharedMarketView(handle)
+
+
+def close_sum(symbol: str) -> tuple[float, bool]:
+    series = _market[symbol]
+    return float(series.close.sum()), series.close.flags.writeable
+
+
+def make_candles(count: int, base: int) -> list[OHLCV]:
+    start = datetime(2024, 1, 2)
+    return [
+        OHLCV(
+            timestamp=start + timedelta(days=i),
+            open=Decimal(base + i),
+            high=Decimal(base + i + 10),
+            low=Decimal(base + i - 10),
+            close=Decimal(base + i + 5),
+            volume=1000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def universe() -> dict:
+    return {
+        "005930": make_candles(30, 70_000),
+        "000660": {
+            "timestamp": np.arange("2024-01-02", "2024-01-12", dtype="datetime64[D]"),
+            "open": np.full(10, 100.0),
+            "high": np.full(10, 110.0),
+            "low": np.full(10, 90.0),
+            "close": np.arange(10, dtype=float),
+            "volume": np.ones(10, dtype=np.int64),
+        },
+    }
+
+
+def test_view_is_read_only_and_matches_source(universe: dict) -> None:
+    """종목별 읽기 전용 뷰 및 원본 일치 테스트."""
+    with SharedMarketData(universe) as market:
+        assert market.handle.rows == 40
+        with market.view() as view:
+            samsung = view["005930"]
+            assert len(samsung) == 30
+            assert samsung.timestamp[0] == np.datetime64("2024-01-02")
+            assert samsung.close[-1] == 70_000 + 29 + 5
+            assert samsung.volume.dtype == np.int64
+            assert view["000660"].close.tolist() == list(range(10))
+            assert "000660" in view and "035720" not in view
+
+            with pytest.raises(ValueError):
+                samsung.close[0] = 0.0
+            del samsung
+
+
+def test_workers_attach_by_name(universe: dict) -> None:
+    """워커 프로세스가 이름으로 연결하여 같은 데이터를 읽는지 테스트."""
+    with SharedMarketData(universe) as market:
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+            initargs=(market.handle,),
+        ) as pool:
+            symbols = list(market.handle.symbols)
+            results = dict(zip(symbols, pool.map(close_sum, symbols), strict=True))
+
+    expected = sum(70_000 + i + 5 for i in range(30))
+    assert results["005930"] == (expected, False)
+    assert results["000660"] == (45.0, False)
+
+
+def test_close_releases_segment(universe: dict) -> None:
+    """발행자 종료 시 공유 메모리 해제 테스트."""
+    market = SharedMarketData(universe)
+    handle = market.handle
+    market.close()
+    with pytest.raises(FileNotFoundError):
+        SharedMarketView(handle)
+
+
+def test_mismatched_column_lengths() -> None:
+    """열 길이 불일치 테스트."""
+    data = {name: np.zeros(3) for name in ("open", "high", "low", "close", "volume")}
+    data["timestamp"] = np.arange("2024-01-01", "2024-01-03", dtype="datetime64[D]")
+    with pytest.raises(ValueError, match="열 길이"):
+        SharedMarketData({"A": data})
@@ -0,0 +1,93 @@
+"""스윕 결과 저장소 테스트."""
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from genport.models import BacktestParams, BacktestResult
+from genport.sweep import SweepJob, SweepOutcome
+from src.data.sweep_store import SweepResultStore, downsample
+
+
+def make_result(sharpe: float, mdd: float) -> BacktestResult:
+    return BacktestResult(
+        total_return=sharpe * 10,
+        cagr=sharpe * 5,
+        sharpe_ratio=sharpe,
+        max_drawdown=mdd,
+        win_rate=50.0,
+        trade_count=10,
+        raw_data={"large": list(range(100))},
+    )
+
+
+def test_append_flush_and_top_k(tmp_path: Path) -> None:
+    """파트 파일 분할 기록 및 조건부 상위 k개 조회 테스트."""
+    store = SweepResultStore(tmp_path, flush_rows=30)
+    for i in range(100):
+        store.append({"short": i % 10, "long": 20 + i // 10}, make_result(i / 10, -float(i % 40)))
+    store.flush()
+
+    assert len(list((tmp_path / "results").glob("part-*.parquet"))) == 4
+    assert len(store) == 100
+
+    top = store.top(5, by="sharpe_ratio", where=pl.col("max_drawdown") > -20)
+    assert top.height == 5
+    assert top["sharpe_ratio"].to_list() == [9.9, 9.8, 9.7, 9.6, 9.5]
+    assert (top["max_drawdown"] > -20).all()
+    # raw_data 같은 비스칼라 필드는 저장하지 않음
+    assert "raw_data" not in top.columns
+    assert store.params(top["run_id"][0]) == {"short": 9, "long": 29}
+
+
+def test_reopen_continues_run_ids(tmp_path: Path) -> None:
+    """저장소를 다시 열었을 때 이어서 추가 테스트."""
+    with SweepResultStore(tmp_path) as store:
+        first = [store.append({"a": i}, {"sharpe_ratio": float(i)}) for i in range(3)]
+
+    with SweepResultStore(tmp_path) as store:
+        second = store.append({"b": "x"}, {"sharpe_ratio": 10.0})
+
+    assert first == [0, 1, 2]
+    assert second == 3
+    frame = SweepResultStore(tmp_path).query(sort_by="run_id", descending=False)
+    # 파트마다 파라미터 열이 달라도 합쳐서 조회
+    assert frame["param_a"].to_list() == [0, 1, 2, None]
+    assert frame["param_b"].to_list() == [None, None, None, "x"]
+
+
+def test_equity_curves_are_downsampled(tmp_path: Path) -> None:
+    """자산 곡선 다운샘플링 저장 및 조회 테스트."""
+    store = SweepResultStore(tmp_path, curve_points=50)
+    curve = np.linspace(100.0, 200.0, 1000)
+    run_id = store.append({"a": 1}, {"sharpe_ratio": 1.0}, equity_curve=curve)
+    no_curve = store.append({"a": 2}, {"sharpe_ratio": 2.0})
+    store.flush()
+
+    stored = store.equity_curve(run_id)
+    assert len(stored) == 50
+    assert stored[0] == pytest.approx(100.0)
+    assert stored[-1] == pytest.approx(200.0)
+    with pytest.raises(KeyError):
+        store.equity_curve(no_curve)
+
+    assert len(downsample([1.0, 2.0, 3.0], 50)) == 3
+
+
+def test_append_outcome_skips_failures(tmp_path: Path) -> None:
+    """스윕 결과 추가 시 실패 작업 제외 테스트."""
+    params = BacktestParams(start_date=date(2024, 1, 1), end_date=date(2024, 12, 31))
+    job = SweepJob(job_id=0, strategy_id="S1", overrides={"max_holdings": 5}, params=params)
+    ok = SweepOutcome(job, make_result(1.5, -10.0), None, 1, 0, 0.1)
+    failed = SweepOutcome(job, None, "타임아웃", 3, 0, 0.1)
+
+    store = SweepResultStore(tmp_path)
+    assert store.append_outcome(ok) == 0
+    assert store.append_outcome(failed) is None
+    store.flush()
+
+    frame = store.query(columns=["param_max_holdings", "sharpe_ratio", "trade_count"])
+    assert frame.rows() == [(5, 1.5, 10)]
@@ -0,0 +1,116 @@
+"""지연 시간 계측 테스트."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils.tracing import (
+    ChromeTraceExporter,
+    Histogram,
+    JsonLinesExporter,
+    Tracer,
+    trace_context,
+)
+
+
+def test_disabled_tracer_is_noop() -> None:
+    """비활성 상태 no-op 테스트."""
+    tracer = Tracer()
+    with tracer.span("noop") as span:
+        span.set(extra=1)
+    tracer.count("requests")
+    tracer.observe("latency", 1.0)
+    assert tracer.summary() == {"counters": {}, "histograms": {}}
+
+
+def test_histogram_percentiles() -> None:
+    """히스토그램 백분위수 테스트."""
+    histogram = Histogram()
+    for value in range(1, 101):
+        histogram.observe(float(value))
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(50, abs=1)
+    assert histogram.percentile(99) == pytest.approx(99, abs=1)
+    assert histogram.mean == pytest.approx(50.5)
+
+
+def test_histogram_reservoir_is_bounded() -> None:
+    """히스토그램 샘플 수 제한 테스트."""
+    histogram = Histogram(max_samples=10)
+    for value in range(1000):
+        histogram.observe(float(value))
+    assert len(histogram._samples) == 10
+    assert histogram.max == 999
+
+
+def test_spans_export_jsonl_with_context(tmp_path: Path) -> None:
+    """JSON Lines 내보내기 및 컨텍스트 속성 테스트."""
+    path = tmp_path / "trace.jsonl"
+    tracer = Tracer()
+    tracer.enable(JsonLinesExporter(path))
+
+    with trace_context(strategy_id="S1"):
+        with tracer.span("genport.run"):
+            with tracer.span("genport.navigate", url="/strategy/S1"):
+                pass
+    with pytest.raises(ValueError):
+        with tracer.span("genport.parse"):
+            raise ValueError("bad html")
+    tracer.count("kiwoom.request.timeout")
+    tracer.disable()
+
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    navigate, run, parse = records
+    assert navigate["parent_id"] == run["span_id"]
+    assert navigate["attrs"] == {"strategy_id": "S1", "url": "/strategy/S1"}
+    assert parse["attrs"] == {"error": "ValueError"}
+
+    summary = tracer.summary()
+    assert summary["counters"] == {"kiwoom.request.timeout": 1}
+    assert summary["histograms"]["genport.run"]["count"] == 1
+
+
+def test_chrome_trace_export(tmp_path: Path) -> None:
+    """Chrome trace 포맷 내보내기 테스트."""
+    path = tmp_path / "trace.json"
+    tracer = Tracer()
+    tracer.enable(ChromeTraceExporter(path))
+    with trace_context(request_id="r1"):
+        with tracer.span("kiwoom.request", method="ping"):
+            pass
+    # 이벤트는 메모리에 쌓이지 않고 바로 파일에 기록됨
+    assert '"kiwoom.request"' in path.read_text(encoding="utf-8")
+    tracer.disable()
+
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert len(events) == 1
+    assert events[0]["ph"] == "X"
+    assert events[0]["args"] == {"request_id": "r1", "method": "ping"}
+
+
+def test_env_chrome_trace_is_per_process(tmp_path: Path) -> None:
+    """환경변수로 활성화한 Chrome trace가 프로세스별 파일에 기록되는지 테스트."""
+    code = (
+        "import os\n"
+        "from src.utils.tracing import tracer\n"
+        "with tracer.span('worker.run'):\n"
+        "    pass\n"
+        "print(os.getpid())\n"
+    )
+    env = {**os.environ, "TRADING_TRACE_FILE": str(tmp_path / "sweep.json")}
+    root = Path(__file__).resolve().parents[1]
+    pids = [
+        subprocess.run(
+            [sys.executable, "-c", code], cwd=root, env=env, capture_output=True, text=True
+        ).stdout.strip()
+        for _ in range(2)
+    ]
+
+    assert not (tmp_path / "sweep.json").exists()
+    for pid in pids:
+        trace = json.loads((tmp_path / f"sweep.{pid}.json").read_text(encoding="utf-8"))
+        assert [e["name"] for e in trace["traceEvents"]] == ["worker.run"]